@@ -7,22 +7,34 @@ Version: Flightv0_4
 Date: 2025-12-08
 """
 
+import asyncio
 import csv
-import json
+import hashlib
 import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+import orjson
+from neo4j import AsyncGraphDatabase
+
 from infrastructure.persistence.neo4j.neo4j_client import Neo4jClient
-from infrastructure.config.config import Config
+from infrastructure.config.config import CONFIG
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# CSV中需要读取的列（按解析顺序）
+NODE_COLUMNS = ('id:ID', 'name', 'label', 'properties', 'version')
+RELATIONSHIP_COLUMNS = (':START_ID', ':END_ID', ':TYPE', 'properties', 'version')
+
+_json_loads = orjson.loads
+
+# CSV读取缓冲区大小（大块读取，减少系统调用次数）
+CSV_READ_BUFFER = 1 << 20
+
 
 class FlightCSVImporter:
     """
@@ -32,20 +44,30 @@ class FlightCSVImporter:
     数据格式遵循Neo4j CSV批量导入规范
     """
 
-    def __init__(self, data_dir: str = None, client: Neo4jClient = None):
+    # 每个UNWIND批次写入的行数
+    BATCH_SIZE = 1000
+    # 每个写事务最多包含的行数（多个批次合并在一个事务中提交）
+    TRANSACTION_ROWS = 50000
+
+    def __init__(self, data_dir: str = None, client: Neo4jClient = None, batch_size: int = None,
+                 transaction_rows: int = None):
         """
         初始化CSV导入器
 
         Args:
-            data_dir: CSV文件所在目录，默认为 Config.DATA_DIR / 'Flight'
+            data_dir: CSV文件所在目录，默认为 CONFIG.data_dir / 'Flight'
             client: Neo4j客户端实例，默认创建新实例
+            batch_size: 每批写入的行数，默认为 BATCH_SIZE
+            transaction_rows: 每个写事务最多包含的行数，默认为 TRANSACTION_ROWS
         """
         if data_dir:
             self.data_dir = Path(data_dir)
         else:
-            self.data_dir = Config.DATA_DIR / 'Flight'
+            self.data_dir = CONFIG.data_dir / 'Flight'
 
         self.client = client or Neo4jClient()
+        self.batch_size = batch_size or self.BATCH_SIZE
+        self.transaction_rows = transaction_rows or self.TRANSACTION_ROWS
 
         self.stats = {
             'ontology_nodes': 0,
@@ -55,6 +77,136 @@ class FlightCSVImporter:
             'errors': []
         }
 
+        # 并行导入时保护 stats['errors']
+        self._errors_lock = threading.Lock()
+
+        # 本次导入中见过的 node_id -> label，用于关系导入时带label匹配
+        self._node_labels: Dict[str, str] = {}
+        # 已确保存在 node_id 索引的label
+        self._indexed_labels = set()
+        # 本次导入写入的 node_id -> Neo4j内部id，关系导入时直接按内部id定位节点
+        self._id_cache: Dict[str, int] = {}
+
+    def _record_error(self, error_msg: str):
+        """记录导入错误（可能被多个导入线程同时调用）"""
+        with self._errors_lock:
+            self.stats['errors'].append(error_msg)
+
+    @staticmethod
+    def _open_csv(csv_file: Path):
+        """
+        打开CSV文件供csv.reader读取
+
+        使用大块缓冲读取，由C实现的TextIOWrapper统一解码；newline=''
+        保证引号内的换行按csv模块要求原样交给reader处理。
+        """
+        return open(csv_file, 'r', encoding='utf-8', newline='', buffering=CSV_READ_BUFFER)
+
+    @staticmethod
+    def _column_indices(header: List[str], columns: Tuple[str, ...]) -> Tuple[int, ...]:
+        """
+        根据表头计算所需列的下标
+
+        Args:
+            header: CSV表头
+            columns: 需要的列名
+
+        Returns:
+            tuple: 与columns顺序一致的列下标
+        """
+        missing = [column for column in columns if column not in header]
+        if missing:
+            raise ValueError(f"Missing CSV columns: {', '.join(missing)}")
+        return tuple(header.index(column) for column in columns)
+
+    def _parse_node_row(self, row: List[str], cols: Tuple[int, ...]) -> Tuple[str, Dict[str, Any]]:
+        """
+        解析一行节点CSV
+
+        Args:
+            row: csv.reader返回的一行
+            cols: NODE_COLUMNS对应的列下标
+
+        Returns:
+            tuple: (label, {'node_id': ..., 'props': {...}, 'hash': ...})
+        """
+        id_idx, name_idx, label_idx, props_idx, ver_idx = cols
+
+        # 提取CSV列（id/version由导出工具生成，不含空白，无需strip）
+        node_id = row[id_idx]
+        name = row[name_idx].strip()
+        # label取值很少，intern后分桶时的字典查找只需比较指针
+        label = sys.intern(row[label_idx].strip())
+        props_str = row[props_idx].strip()
+        version = row[ver_idx]
+
+        # 解析properties JSON字符串
+        if props_str and props_str != '{}':
+            props = _json_loads(props_str)
+        else:
+            props = {}
+
+        # 添加元数据属性
+        props['node_id'] = node_id
+        props['name'] = name
+        props['version'] = version
+
+        # 属性摘要直接基于CSV原始字段计算，重复导入时未变化的节点可跳过写入
+        props_hash = hashlib.blake2b(
+            f"{name}\x1f{props_str}\x1f{version}".encode('utf-8'), digest_size=16
+        ).hexdigest()
+
+        return label, {'node_id': node_id, 'props': props, 'hash': props_hash}
+
+    def _parse_relationship_row(self, row: List[str], cols: Tuple[int, ...]) -> Tuple[str, Dict[str, Any]]:
+        """
+        解析一行关系CSV
+
+        Args:
+            row: csv.reader返回的一行
+            cols: RELATIONSHIP_COLUMNS对应的列下标
+
+        Returns:
+            tuple: (relationship_type, {'start_id': ..., 'end_id': ..., 'props': {...}})
+        """
+        start_idx, end_idx, type_idx, props_idx, ver_idx = cols
+
+        # 提取CSV列（id/version由导出工具生成，不含空白，无需strip）
+        start_id = row[start_idx]
+        end_id = row[end_idx]
+        relationship_type = sys.intern(row[type_idx].strip())
+        props_str = row[props_idx].strip()
+        version = row[ver_idx]
+
+        # 解析properties JSON字符串
+        if props_str and props_str != '{}':
+            props = _json_loads(props_str)
+        else:
+            props = {}
+
+        # 添加版本属性
+        props['version'] = version
+
+        return relationship_type, {'start_id': start_id, 'end_id': end_id, 'props': props}
+
+    @staticmethod
+    def _node_batch_query(label: str) -> str:
+        """
+        生成按label批量MERGE节点的UNWIND语句（返回内部id供关系导入使用）
+
+        新节点整体写入属性；已存在的节点仅在属性摘要（props_hash）变化时
+        以 += 合并属性，未变化的行不产生任何属性写入，且保留导入之外
+        另行添加的属性（如embedding）。
+        """
+        return f"""
+        UNWIND $rows AS row
+        MERGE (n:{label} {{node_id: row.node_id}})
+        ON CREATE SET n = row.props, n.props_hash = row.hash
+        FOREACH (_ IN CASE WHEN n.props_hash = row.hash THEN [] ELSE [1] END |
+            SET n += row.props, n.props_hash = row.hash)
+        RETURN id(n) AS nid, n.node_id AS node_id
+        """
+
     def import_nodes_from_csv(self, csv_file: Path, node_type: str = 'unknown'):
         """
         从CSV文件导入节点
@@ -66,57 +218,63 @@ class FlightCSVImporter:
             csv_file: CSV文件路径
             node_type: 节点类型标识（用于统计），'ontology' 或 'entity'
         """
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Importing nodes from: {csv_file.name}")
-        logger.info(f"{'='*60}")
+        logger.info("\n%s", '='*60)
+        logger.info("Importing nodes from: %s", csv_file.name)
+        logger.info("%s", '='*60)
 
         count = 0
         errors = 0
 
         try:
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            with self._open_csv(csv_file) as f:
+                reader = csv.reader(f)
+                cols = self._column_indices(next(reader, []), NODE_COLUMNS)
+
+                # 按label分桶（label会拼接进Cypher，无法参数化）
+                buckets: Dict[str, List[Dict[str, Any]]] = {}
+                # 待提交的批次，攒满 transaction_rows 行后在一个事务中提交
+                pending: List[Tuple[str, Any, List[Dict[str, Any]]]] = []
+                pending_rows = 0
+                parse_row = self._parse_node_row
+                node_labels = self._node_labels
 
                 for row in reader:
+                    if not row:
+                        continue
                     try:
-                        # 提取CSV列
-                        node_id = row['id:ID'].strip()
-                        name = row['name'].strip()
-                        label = row['label'].strip()
-                        props_str = row['properties'].strip()
-                        version = row['version'].strip()
-
-                        # 解析properties JSON字符串
-                        if props_str and props_str != '{}':
-                            props = json.loads(props_str)
-                        else:
-                            props = {}
-
-                        # 添加元数据属性
-                        props['node_id'] = node_id
-                        props['name'] = name
-                        props['version'] = version
+                        label, node = parse_row(row, cols)
+                        node_labels[node['node_id']] = label
 
-                        # 使用MERGE创建或更新节点
-                        cypher = f"""
-                        MERGE (n:{label} {{node_id: $node_id}})
-                        SET n = $props
-                        RETURN n
-                        """
+                        bucket = buckets.setdefault(label, [])
+                        bucket.append(node)
 
-                        self.client.execute_write(cypher, {
-                            'node_id': node_id,
-                            'props': props
-                        })
+                        # 攒满一批后加入待提交事务
+                        if len(bucket) >= self.batch_size:
+                            pending.append(('node', label, bucket))
+                            pending_rows += len(bucket)
+                            buckets[label] = []
 
-                        count += 1
-                        logger.info(f"  ✓ {label}: {name} ({node_id})")
+                            if pending_rows >= self.transaction_rows:
+                                written = self._commit_batches(pending)
+                                count += written
+                                errors += pending_rows - written
+                                pending, pending_rows = [], 0
 
                     except Exception as e:
                         errors += 1
-                        error_msg = f"Failed to import node {row.get('id:ID', 'unknown')}: {e}"
-                        logger.error(f"  ✗ {error_msg}")
-                        self.stats['errors'].append(error_msg)
+                        node_id = row[cols[0]] if len(row) > cols[0] else 'unknown'
+                        error_msg = f"Failed to import node {node_id}: {e}"
+                        logger.error("  ✗ %s", error_msg)
+                        self._record_error(error_msg)
+
+                # 写入剩余数据
+                for label, bucket in buckets.items():
+                    if bucket:
+                        pending.append(('node', label, bucket))
+                        pending_rows += len(bucket)
+                written = self._commit_batches(pending)
+                count += written
+                errors += pending_rows - written
 
             # 更新统计
             if node_type == 'ontology':
@@ -124,11 +282,119 @@ class FlightCSVImporter:
             elif node_type == 'entity':
                 self.stats['entity_nodes'] = count
 
-            logger.info(f"\n✓ Imported {count} nodes ({errors} errors)")
+            logger.info("\n✓ Imported %s nodes (%s errors)", count, errors)
 
         except Exception as e:
-            logger.error(f"✗ Failed to open CSV file {csv_file}: {e}")
+            logger.error("✗ Failed to open CSV file %s: %s", csv_file, e)
+            raise
+
+    async def import_nodes_from_csv_async(self, csv_file: Path, node_type: str = 'unknown',
+                                          workers: int = 4):
+        """
+        异步流水线方式从CSV文件导入节点
+
+        生产者协程解析CSV并按批次投递到队列，多个消费者协程并发执行写事务，
+        使CSV解析与Neo4j写入重叠进行。批次按 hash(node_id) % workers 分片到
+        各消费者的专属队列，保证并发事务不会MERGE同一个node_id（避免死锁）。
+
+        Args:
+            csv_file: CSV文件路径
+            node_type: 节点类型标识（用于统计），'ontology' 或 'entity'
+            workers: 并发写入的消费者数量
+        """
+        logger.info("\n%s", '='*60)
+        logger.info("Importing nodes (async) from: %s", csv_file.name)
+        logger.info("%s", '='*60)
+
+        totals = {'count': 0, 'errors': 0}
+        queues = [asyncio.Queue(maxsize=4) for _ in range(workers)]
+
+        async def write_tx(tx, cypher, rows):
+            result = await tx.run(cypher, {'rows': rows})
+            return await result.data()
+
+        async def consumer(queue: asyncio.Queue):
+            async with driver.session() as session:
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        break
+                    label, rows = item
+                    try:
+                        records = await session.execute_write(write_tx, self._node_batch_query(label), rows)
+                        self._cache_internal_ids(records)
+                        totals['count'] += len(rows)
+                        self._log_node_batch(label, rows)
+                    except Exception as e:
+                        totals['errors'] += len(rows)
+                        error_msg = f"Failed to import {len(rows)} {label} nodes: {e}"
+                        logger.error("  ✗ %s", error_msg)
+                        self._record_error(error_msg)
+
+        async def producer():
+            # 每个分片独立按label分桶
+            buckets: List[Dict[str, List[Dict[str, Any]]]] = [{} for _ in range(workers)]
+            try:
+                with self._open_csv(csv_file) as f:
+                    reader = csv.reader(f)
+                    cols = self._column_indices(next(reader, []), NODE_COLUMNS)
+
+                    for row in reader:
+                        if not row:
+                            continue
+                        try:
+                            label, node = self._parse_node_row(row, cols)
+                        except Exception as e:
+                            totals['errors'] += 1
+                            node_id = row[cols[0]] if len(row) > cols[0] else 'unknown'
+                            error_msg = f"Failed to import node {node_id}: {e}"
+                            logger.error("  ✗ %s", error_msg)
+                            self._record_error(error_msg)
+                            continue
+
+                        self._node_labels[node['node_id']] = label
+                        shard = hash(node['node_id']) % workers
+                        bucket = buckets[shard].setdefault(label, [])
+                        bucket.append(node)
+
+                        if len(bucket) >= self.batch_size:
+                            self._ensure_node_id_index(label)
+                            await queues[shard].put((label, bucket))
+                            buckets[shard][label] = []
+                            # 让出事件循环，使消费者尽早发起写入
+                            await asyncio.sleep(0)
+
+                # 投递剩余数据
+                for shard, shard_buckets in enumerate(buckets):
+                    for label, bucket in shard_buckets.items():
+                        if bucket:
+                            self._ensure_node_id_index(label)
+                            await queues[shard].put((label, bucket))
+            finally:
+                # 通知消费者结束
+                for queue in queues:
+                    await queue.put(None)
+
+        driver = AsyncGraphDatabase.driver(
+            self.client.uri,
+            auth=(self.client.user, self.client.password)
+        )
+
+        try:
+            await asyncio.gather(producer(), *(consumer(queue) for queue in queues))
+        except Exception as e:
+            logger.error("✗ Failed to open CSV file %s: %s", csv_file, e)
             raise
+        finally:
+            await driver.close()
+
+        # 更新统计
+        if node_type == 'ontology':
+            self.stats['ontology_nodes'] = totals['count']
+        elif node_type == 'entity':
+            self.stats['entity_nodes'] = totals['count']
+
+        logger.info("\n✓ Imported %s nodes (%s errors)", totals['count'], totals['errors'])
 
     def import_relationships_from_csv(self, csv_file: Path, rel_type: str = 'unknown'):
         """
@@ -141,58 +407,79 @@ class FlightCSVImporter:
             csv_file: CSV文件路径
             rel_type: 关系类型标识（用于统计），'ontology' 或 'entity'
         """
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Importing relationships from: {csv_file.name}")
-        logger.info(f"{'='*60}")
+        logger.info("\n%s", '='*60)
+        logger.info("Importing relationships from: %s", csv_file.name)
+        logger.info("%s", '='*60)
 
         count = 0
         errors = 0
 
         try:
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            with self._open_csv(csv_file) as f:
+                reader = csv.reader(f)
+                cols = self._column_indices(next(reader, []), RELATIONSHIP_COLUMNS)
+
+                # 按 (关系类型, 是否按内部id匹配, 起点label, 终点label) 分桶（均决定Cypher形态）
+                buckets: Dict[Tuple[str, bool, Optional[str], Optional[str]], List[Dict[str, Any]]] = {}
+                # 待提交的批次，攒满 transaction_rows 行后在一个事务中提交
+                pending: List[Tuple[str, Any, List[Dict[str, Any]]]] = []
+                pending_rows = 0
+                parse_row = self._parse_relationship_row
+                id_cache_get = self._id_cache.get
+                node_labels_get = self._node_labels.get
 
                 for row in reader:
+                    if not row:
+                        continue
                     try:
-                        # 提取CSV列
-                        start_id = row[':START_ID'].strip()
-                        end_id = row[':END_ID'].strip()
-                        relationship_type = row[':TYPE'].strip()
-                        props_str = row['properties'].strip()
-                        version = row['version'].strip()
-
-                        # 解析properties JSON字符串
-                        if props_str and props_str != '{}':
-                            props = json.loads(props_str)
+                        relationship_type, rel = parse_row(row, cols)
+
+                        start_nid = id_cache_get(rel['start_id'])
+                        end_nid = id_cache_get(rel['end_id'])
+                        if start_nid is not None and end_nid is not None:
+                            # 两端节点本次刚导入过：按内部id直接定位，跳过索引查找
+                            rel['s'] = start_nid
+                            rel['e'] = end_nid
+                            key = (relationship_type, True, None, None)
                         else:
-                            props = {}
-
-                        # 添加版本属性
-                        props['version'] = version
-
-                        # 使用MERGE创建或更新关系
-                        cypher = f"""
-                        MATCH (from {{node_id: $start_id}})
-                        MATCH (to {{node_id: $end_id}})
-                        MERGE (from)-[r:{relationship_type}]->(to)
-                        SET r = $props
-                        RETURN r
-                        """
-
-                        self.client.execute_write(cypher, {
-                            'start_id': start_id,
-                            'end_id': end_id,
-                            'props': props
-                        })
-
-                        count += 1
-                        logger.info(f"  ✓ ({start_id})-[:{relationship_type}]->({end_id})")
+                            key = (
+                                relationship_type,
+                                False,
+                                node_labels_get(rel['start_id']),
+                                node_labels_get(rel['end_id'])
+                            )
+
+                        bucket = buckets.setdefault(key, [])
+                        bucket.append(rel)
+
+                        # 攒满一批后加入待提交事务
+                        if len(bucket) >= self.batch_size:
+                            pending.append(('relationship', key, bucket))
+                            pending_rows += len(bucket)
+                            buckets[key] = []
+
+                            if pending_rows >= self.transaction_rows:
+                                written = self._commit_batches(pending)
+                                count += written
+                                errors += pending_rows - written
+                                pending, pending_rows = [], 0
 
                     except Exception as e:
                         errors += 1
-                        error_msg = f"Failed to import relationship {row.get(':START_ID', '?')}->{row.get(':END_ID', '?')}: {e}"
-                        logger.error(f"  ✗ {error_msg}")
-                        self.stats['errors'].append(error_msg)
+                        start_id = row[cols[0]] if len(row) > cols[0] else '?'
+                        end_id = row[cols[1]] if len(row) > cols[1] else '?'
+                        error_msg = f"Failed to import relationship {start_id}->{end_id}: {e}"
+                        logger.error("  ✗ %s", error_msg)
+                        self._record_error(error_msg)
+
+                # 写入剩余数据
+                for key, bucket in buckets.items():
+                    if bucket:
+                        pending.append(('relationship', key, bucket))
+                        pending_rows += len(bucket)
+                written = self._commit_batches(pending)
+                count += written
+                errors += pending_rows - written
 
             # 更新统计
             if rel_type == 'ontology':
@@ -200,30 +487,152 @@ class FlightCSVImporter:
             elif rel_type == 'entity':
                 self.stats['entity_rels'] = count
 
-            logger.info(f"\n✓ Imported {count} relationships ({errors} errors)")
+            logger.info("\n✓ Imported %s relationships (%s errors)", count, errors)
 
         except Exception as e:
-            logger.error(f"✗ Failed to open CSV file {csv_file}: {e}")
+            logger.error("✗ Failed to open CSV file %s: %s", csv_file, e)
             raise
 
-    def run_full_import(self, clear_existing: bool = False):
+    @staticmethod
+    def _log_node_batch(label: str, rows: List[Dict[str, Any]]):
+        """记录一个节点批次的写入结果（逐行明细仅在DEBUG级别输出）"""
+        if logger.isEnabledFor(logging.DEBUG):
+            for row in rows:
+                logger.debug("  ✓ %s: %s (%s)", label, row['props']['name'], row['node_id'])
+        logger.info("  ✓ %s: %d nodes", label, len(rows))
+
+    @staticmethod
+    def _log_relationship_batch(relationship_type: str, rows: List[Dict[str, Any]]):
+        """记录一个关系批次的写入结果（逐行明细仅在DEBUG级别输出）"""
+        if logger.isEnabledFor(logging.DEBUG):
+            for row in rows:
+                logger.debug("  ✓ (%s)-[:%s]->(%s)", row['start_id'], relationship_type, row['end_id'])
+        logger.info("  ✓ %s: %d relationships", relationship_type, len(rows))
+
+    def _commit_batches(self, batches: List[Tuple[str, Any, List[Dict[str, Any]]]]) -> int:
+        """
+        在一个写事务中提交多个UNWIND批次
+
+        事务由驱动托管，遇到死锁等瞬时错误时只重试本事务；
+        任一批次失败则整个事务回滚，其中的行全部计为失败。
+
+        Args:
+            batches: [(kind, key, rows), ...]，kind 为 'node'（key为label）
+                     或 'relationship'（key为 _relationship_batch_query 的参数元组）
+
+        Returns:
+            int: 成功写入的行数（失败时为0）
+        """
+        if not batches:
+            return 0
+
+        statements = []
+        for kind, key, rows in batches:
+            if kind == 'node':
+                # 索引属于schema操作，需在数据写事务之外创建
+                self._ensure_node_id_index(key)
+                cypher = self._node_batch_query(key)
+            else:
+                cypher = self._relationship_batch_query(*key)
+            statements.append((cypher, {'rows': rows}))
+
+        total = sum(len(rows) for _, _, rows in batches)
+        try:
+            results = self.client.execute_write_batches(statements)
+        except Exception as e:
+            error_msg = f"Failed to import {total} rows ({len(batches)} batches) in one transaction: {e}"
+            logger.error("  ✗ %s", error_msg)
+            self._record_error(error_msg)
+            return 0
+
+        for (kind, key, rows), records in zip(batches, results):
+            if kind == 'node':
+                self._cache_internal_ids(records)
+                self._log_node_batch(key, rows)
+            else:
+                self._log_relationship_batch(key[0], rows)
+        return total
+
+    def _cache_internal_ids(self, records: List[Dict[str, Any]]):
+        """记录节点批次返回的 node_id -> 内部id"""
+        for record in records:
+            self._id_cache[record['node_id']] = record['nid']
+
+    def _ensure_node_id_index(self, label: str):
+        """
+        确保 label 上存在 node_id 索引（每个label只执行一次）
+
+        MERGE节点和关系导入中的MATCH都按 node_id 查找，有索引时走
+        NodeIndexSeek，否则为全label扫描。
+        """
+        if label in self._indexed_labels:
+            return
+
+        cypher = f"CREATE INDEX `{label}_node_id` IF NOT EXISTS FOR (n:{label}) ON (n.node_id)"
+        try:
+            self.client.execute_write(cypher)
+            logger.info("✓ Ensured node_id index on :%s", label)
+        except Exception as e:
+            logger.warning("⚠ Failed to create node_id index on :%s: %s", label, e)
+        self._indexed_labels.add(label)
+
+    @staticmethod
+    def _relationship_batch_query(relationship_type: str, by_internal_id: bool,
+                                  start_label: Optional[str], end_label: Optional[str]) -> str:
+        """
+        生成批量MERGE同一类型关系的UNWIND语句
+
+        起止节点的内部id已缓存时（本次导入过的节点）按内部id直接定位；
+        仅label已知时带label匹配，以使用 node_id 索引；否则退化为不带label的匹配。
+
+        Args:
+            relationship_type: 关系类型
+            by_internal_id: rows 是否带有内部id（'s' / 'e'）
+            start_label: 起点节点label（未知时为None）
+            end_label: 终点节点label（未知时为None）
+
+        Returns:
+            str: Cypher语句，参数 $rows 为 [{'start_id': ..., 'end_id': ..., 'props': {...}}, ...]
+        """
+        if by_internal_id:
+            match_clause = """
+        MATCH (from) WHERE id(from) = row.s
+        MATCH (to) WHERE id(to) = row.e"""
+        else:
+            from_pattern = f"from:{start_label}" if start_label else "from"
+            to_pattern = f"to:{end_label}" if end_label else "to"
+            match_clause = f"""
+        MATCH ({from_pattern} {{node_id: row.start_id}})
+        MATCH ({to_pattern} {{node_id: row.end_id}})"""
+
+        return f"""
+        UNWIND $rows AS row{match_clause}
+        MERGE (from)-[r:{relationship_type}]->(to)
+        SET r = row.props
+        """
+
+    def run_full_import(self, clear_existing: bool = False, use_async: bool = False,
+                        parallel: bool = True):
         """
         执行完整的导入流程
 
         导入顺序：
-        1. 本体节点 (nodes_ontology_json.csv)
-        2. 实体节点 (nodes_entities_json.csv)
-        3. 本体关系 (rels_ontology_json.csv)
-        4. 实体关系 (rels_entities_json.csv)
+        1. 本体节点 (nodes_ontology_json.csv) + 实体节点 (nodes_entities_json.csv)
+        2. 本体关系 (rels_ontology_json.csv) + 实体关系 (rels_entities_json.csv)
+
+        同一阶段的两个文件互不依赖（节点文件的label与node_id不重叠），
+        parallel 为 True 时各用一个线程并发导入；关系阶段在所有节点导入完成后开始。
 
         Args:
             clear_existing: 是否清空现有数据（谨慎使用！）
+            use_async: 节点导入是否使用异步流水线（import_nodes_from_csv_async）
+            parallel: 同一阶段的两个文件是否并发导入
         """
-        logger.info(f"\n{'#'*60}")
-        logger.info(f"# Flight CSV Import - Ontology + Entity")
-        logger.info(f"# Data Directory: {self.data_dir}")
-        logger.info(f"# Timestamp: {datetime.now().isoformat()}")
-        logger.info(f"{'#'*60}\n")
+        logger.info("\n%s", '#'*60)
+        logger.info("# Flight CSV Import - Ontology + Entity")
+        logger.info("# Data Directory: %s", self.data_dir)
+        logger.info("# Timestamp: %s", datetime.now().isoformat())
+        logger.info("%s\n", '#'*60)
 
         try:
             # 可选：清空数据库
@@ -236,69 +645,96 @@ class FlightCSVImporter:
                 else:
                     logger.info("✓ Database clear cancelled")
 
-            # 1. 导入本体节点
-            ontology_nodes = self.data_dir / 'nodes_ontology_json.csv'
-            if ontology_nodes.exists():
-                self.import_nodes_from_csv(ontology_nodes, 'ontology')
-            else:
-                logger.warning(f"⚠ File not found: {ontology_nodes}")
+            # 1. 导入本体节点 + 实体节点
+            self._run_phase([
+                (self._import_node_file, self.data_dir / 'nodes_ontology_json.csv', 'ontology', use_async),
+                (self._import_node_file, self.data_dir / 'nodes_entities_json.csv', 'entity', use_async)
+            ], parallel)
 
-            # 2. 导入实体节点
-            entity_nodes = self.data_dir / 'nodes_entities_json.csv'
-            if entity_nodes.exists():
-                self.import_nodes_from_csv(entity_nodes, 'entity')
-            else:
-                logger.warning(f"⚠ File not found: {entity_nodes}")
-
-            # 3. 导入本体关系
-            ontology_rels = self.data_dir / 'rels_ontology_json.csv'
-            if ontology_rels.exists():
-                self.import_relationships_from_csv(ontology_rels, 'ontology')
-            else:
-                logger.warning(f"⚠ File not found: {ontology_rels}")
-
-            # 4. 导入实体关系
-            entity_rels = self.data_dir / 'rels_entities_json.csv'
-            if entity_rels.exists():
-                self.import_relationships_from_csv(entity_rels, 'entity')
-            else:
-                logger.warning(f"⚠ File not found: {entity_rels}")
+            # 2. 导入本体关系 + 实体关系
+            self._run_phase([
+                (self._import_relationship_file, self.data_dir / 'rels_ontology_json.csv', 'ontology'),
+                (self._import_relationship_file, self.data_dir / 'rels_entities_json.csv', 'entity')
+            ], parallel)
 
             # 打印摘要
             self.print_summary()
 
         except Exception as e:
-            logger.error(f"\n✗ Import failed with error: {e}")
+            logger.error("\n✗ Import failed with error: %s", e)
             raise
 
+    @staticmethod
+    def _run_phase(tasks: List[Tuple], parallel: bool):
+        """
+        执行一个导入阶段
+
+        Args:
+            tasks: [(func, *args), ...]
+            parallel: 是否每个任务一个线程并发执行（驱动线程安全，每次写入使用独立session）
+        """
+        if not parallel or len(tasks) < 2:
+            for func, *args in tasks:
+                func(*args)
+            return
+
+        with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+            futures = [pool.submit(func, *args) for func, *args in tasks]
+            # 等待全部完成，并抛出第一个异常
+            for future in futures:
+                future.result()
+
+    def _import_node_file(self, csv_file: Path, node_type: str, use_async: bool):
+        """导入一个节点CSV文件（文件不存在时跳过）"""
+        if not csv_file.exists():
+            logger.warning("⚠ File not found: %s", csv_file)
+            return
+        if use_async:
+            # 每个线程使用独立的事件循环
+            asyncio.run(self.import_nodes_from_csv_async(csv_file, node_type))
+        else:
+            self.import_nodes_from_csv(csv_file, node_type)
+
+    def _import_relationship_file(self, csv_file: Path, rel_type: str):
+        """导入一个关系CSV文件（文件不存在时跳过）"""
+        if not csv_file.exists():
+            logger.warning("⚠ File not found: %s", csv_file)
+            return
+        self.import_relationships_from_csv(csv_file, rel_type)
+
     def print_summary(self):
         """打印导入摘要"""
-        logger.info(f"\n{'='*60}")
+        logger.info("\n%s", '='*60)
         logger.info("IMPORT SUMMARY")
-        logger.info(f"{'='*60}")
+        logger.info("%s", '='*60)
 
-        logger.info(f"Ontology Nodes: {self.stats['ontology_nodes']}")
-        logger.info(f"Entity Nodes: {self.stats['entity_nodes']}")
-        logger.info(f"Total Nodes: {self.stats['ontology_nodes'] + self.stats['entity_nodes']}")
+        logger.info("Ontology Nodes: %s", self.stats['ontology_nodes'])
+        logger.info("Entity Nodes: %s", self.stats['entity_nodes'])
+        logger.info("Total Nodes: %s", self.stats['ontology_nodes'] + self.stats['entity_nodes'])
 
-        logger.info(f"\nOntology Relationships: {self.stats['ontology_rels']}")
-        logger.info(f"Entity Relationships: {self.stats['entity_rels']}")
-        logger.info(f"Total Relationships: {self.stats['ontology_rels'] + self.stats['entity_rels']}")
+        logger.info("\nOntology Relationships: %s", self.stats['ontology_rels'])
+        logger.info("Entity Relationships: %s", self.stats['entity_rels'])
+        logger.info("Total Relationships: %s", self.stats['ontology_rels'] + self.stats['entity_rels'])
 
         if self.stats['errors']:
-            logger.warning(f"\nErrors encountered: {len(self.stats['errors'])}")
+            logger.warning("\nErrors encountered: %s", len(self.stats['errors']))
             for error in self.stats['errors'][:5]:
-                logger.warning(f"  - {error}")
+                logger.warning("  - %s", error)
         else:
             logger.info("\nErrors: 0")
 
-        logger.info(f"{'='*60}\n")
+        logger.info("%s\n", '='*60)
 
 
 def main():
     """主函数"""
     import argparse
 
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
     parser = argparse.ArgumentParser(
         description='Import Flight CSV data (Ontology + Entity) into Neo4j',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -313,9 +749,13 @@ Examples:
   # 清空数据库后导入
   python flight_csv_importer.py --clear
 
+  # 节点导入使用异步流水线（解析与写入重叠）
+  python flight_csv_importer.py --async
+
 Features:
   - 使用MERGE策略，支持增量更新
-  - 导入本体层（Ontology）和实体层（Entity）
+  - 使用UNWIND按批次写入（默认每批1000行）
+  - 导入本体层（Ontology）和实体层（Entity），两层文件并发导入（--serial 关闭）
   - 自动解析CSV中的JSON属性
   - 使用node_id作为唯一标识
         """
@@ -331,6 +771,17 @@ Features:
         action='store_true',
         help='Clear existing database before import (DANGEROUS!)'
     )
+    parser.add_argument(
+        '--async',
+        dest='use_async',
+        action='store_true',
+        help='Import nodes through the asynchronous batching pipeline'
+    )
+    parser.add_argument(
+        '--serial',
+        action='store_true',
+        help='Import the ontology and entity files one after another instead of concurrently'
+    )
 
     args = parser.parse_args()
 
@@ -339,13 +790,14 @@ Features:
         importer = FlightCSVImporter(data_dir=args.data_dir)
 
         # 执行完整导入
-        importer.run_full_import(clear_existing=args.clear)
+        importer.run_full_import(clear_existing=args.clear, use_async=args.use_async,
+                                 parallel=not args.serial)
 
         logger.info("\n✓ CSV Import completed successfully!")
         logger.info("Note: Uses MERGE - safe to re-run for updates")
 
     except Exception as e:
-        logger.error(f"\n✗ Import failed: {e}")
+        logger.error("\n✗ Import failed: %s", e)
         return 1
 
     return 0
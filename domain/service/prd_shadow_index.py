@@ -0,0 +1,128 @@
+"""
+In-memory shadow of the PRD description vector index
+Serves similar-PRD searches from process memory with an exact NumPy
+search over every PRD embedding, reloaded from Neo4j periodically
+"""
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from infrastructure.config.config import CONFIG
+from infrastructure.persistence.neo4j.neo4j_client import Neo4jClient, Vector
+
+logger = logging.getLogger(__name__)
+
+
+class PRDShadowIndex:
+    """
+    Exact in-memory copy of the prd_description_vector index
+
+    Holds one unit-normalized float32 row per PRD (16 KB per PRD at 4096
+    dimensions), so a search is one matrix-vector product instead of a
+    Neo4j round trip. Results have the columns and scores of
+    VectorRecallSystem.SIMILAR_PRDS_QUERY. PRDs written after the last
+    refresh are not visible until the next one. Scores follow the cosine
+    index, so the shadow index requires VECTOR_SIMILARITY_FUNCTION=cosine.
+    """
+
+    # Same columns as SIMILAR_PRDS_QUERY (similarity is filled in per search)
+    LOAD_QUERY = """
+        MATCH (prd:PRD)
+        WHERE prd.description_embedding IS NOT NULL
+        OPTIONAL MATCH (prd)-[:HAS_RECOMMENDATION]->(rec:DecisionRecommendation)
+        RETURN prd.prd_id AS prd_id,
+               prd.title AS title,
+               prd.description AS description,
+               prd.status AS status,
+               prd.priority AS priority,
+               null AS similarity,
+               rec.decision_type AS decision,
+               rec.confidence_score AS confidence,
+               rec.reasoning AS reasoning,
+               prd.description_embedding AS embedding
+        """
+
+    def __init__(self, client: Neo4jClient):
+        """
+        Initialize the shadow index (empty until refresh() is called)
+
+        Args:
+            client: Neo4j client to load PRD embeddings with
+
+        Raises:
+            ValueError: If the vector indexes do not use cosine similarity
+        """
+        if CONFIG.vector_similarity_function.lower() != 'cosine':
+            raise ValueError(
+                f"PRD shadow index needs cosine similarity, not {CONFIG.vector_similarity_function}"
+            )
+        self.client = client
+        # (unit-normalized embeddings (N, D), result rows of each PRD),
+        # swapped as a whole so searches never see a half-built snapshot
+        self._snapshot: Optional[Tuple[np.ndarray, List[List[Dict[str, Any]]]]] = None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether a snapshot has been loaded"""
+        return self._snapshot is not None
+
+    def refresh(self):
+        """Reload every PRD embedding from Neo4j"""
+        start = time.perf_counter()
+        records = self.client.execute_query(self.LOAD_QUERY, mode="read")
+
+        # One row per (PRD, recommendation); group them by PRD
+        groups: Dict[Any, Tuple[Any, List[Dict[str, Any]]]] = {}
+        for record in records:
+            embedding = record.pop("embedding")
+            if Vector is not None and isinstance(embedding, Vector):
+                embedding = embedding.to_numpy()
+            group = groups.setdefault(record["prd_id"], (embedding, []))
+            group[1].append(record)
+
+        if groups:
+            matrix = np.asarray([embedding for embedding, _ in groups.values()], dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix /= np.where(norms > 0, norms, 1.0)
+        else:
+            matrix = np.empty((0, 0), dtype=np.float32)
+
+        self._snapshot = (matrix, [rows for _, rows in groups.values()])
+        logger.info("✓ Loaded %s PRD embeddings into memory in %.2fs",
+                    len(groups), time.perf_counter() - start)
+
+    def search(self, query_embedding: np.ndarray, k: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Find the PRDs most similar to a query embedding
+
+        Args:
+            query_embedding: Query embedding
+            k: Number of results
+
+        Returns:
+            list: Up to k rows ordered by similarity, or None if nothing has
+                  been loaded yet (callers then query Neo4j)
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        matrix, groups = snapshot
+        if not groups:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        cosines = matrix @ (query / norm if norm else query)
+
+        n = min(k, len(groups))
+        top = np.argpartition(-cosines, n - 1)[:n]
+        top = top[np.argsort(-cosines[top])]
+
+        results = []
+        for i in top:
+            # The Neo4j cosine index reports (1 + cosine) / 2
+            similarity = float((1.0 + cosines[i]) / 2.0)
+            results.extend(dict(row, similarity=similarity) for row in groups[i])
+        return results[:k]
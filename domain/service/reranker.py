@@ -0,0 +1,64 @@
+"""
+Client-side reranking of recall results
+Combines the vector similarity computed by Neo4j with per-property boosts
+(e.g. priority or status weights)
+"""
+from typing import Any, Dict, List
+
+import numpy as np
+
+
+def boost_weights(results: List[Dict[str, Any]], boosts: Dict[str, Dict[Any, float]]) -> np.ndarray:
+    """
+    Compute the boost multiplier of each result
+
+    Args:
+        results: Recall results
+        boosts: Property name -> {property value: multiplier}; values
+                without an entry get 1.0
+
+    Returns:
+        np.ndarray: float32 multipliers aligned with results
+    """
+    weights = np.ones(len(results), dtype=np.float32)
+    for prop, table in boosts.items():
+        weights *= np.fromiter(
+            (table.get(row.get(prop), 1.0) for row in results),
+            dtype=np.float32,
+            count=len(results)
+        )
+    return weights
+
+
+def rerank(
+    results: List[Dict[str, Any]],
+    boosts: Dict[str, Dict[Any, float]],
+    top_k: int,
+    score_key: str = "similarity"
+) -> List[Dict[str, Any]]:
+    """
+    Rerank results by similarity * boost and keep the top_k
+
+    Each returned result gets a ``boosted_similarity`` field; ties keep the
+    original (similarity) order.
+
+    Args:
+        results: Recall results, each with a score_key field
+        boosts: Property name -> {property value: multiplier}
+        top_k: Number of results to keep
+        score_key: Field holding the vector similarity
+
+    Returns:
+        list: Reranked results
+    """
+    if not results:
+        return []
+
+    scores = np.fromiter((row[score_key] for row in results), dtype=np.float32, count=len(results))
+    scores *= boost_weights(results, boosts)
+    order = np.argsort(-scores, kind="stable")[:top_k]
+
+    return [
+        {**results[i], "boosted_similarity": float(scores[i])}
+        for i in order
+    ]
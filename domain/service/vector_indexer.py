@@ -3,25 +3,72 @@ Vector Index Manager for Neo4j
 Handles creation and management of vector indexes
 """
 import logging
-from typing import List, Dict, Any
-import json
-
-from infrastructure.persistence.neo4j.neo4j_client import Neo4jClient
+import re
+import time
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
+import orjson
+
+from infrastructure.persistence.neo4j.neo4j_client import Neo4jClient, embedding_param
 from infrastructure.service.embedding.embedding_service import EmbeddingService
-from infrastructure.config.config import Config
+from infrastructure.config.config import CONFIG
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 标签/类型名标准化映射（保留完整名称以匹配现有索引）
+_LABEL_MAPPING = {
+    "OntologyClass": "ontology_class",  # ← 修改：保留完整名称匹配现有索引
+    "Ontology": "ontology",
+    "PRD": "prd",
+    "ReviewComment": "review",
+    "RiskAssessment": "risk",
+    "LINK": "link",
+    "INHERITANCE": "inheritance",
+    "ACTION": "action"
+}
+
+# CamelCase 单词边界
+_CAMEL_RE = re.compile(r'(?<!^)(?=[A-Z])')
+
 
 class VectorIndexer:
     """Manage vector indexes in Neo4j"""
 
+    # Texts per embedding request and requests in flight during bulk imports
+    EMBEDDING_CHUNK_SIZE = 64
+    EMBEDDING_WORKERS = 4
+
+    # Seconds list_vector_indexes serves its last result (indexes rarely change)
+    INDEX_LIST_TTL = 30.0
+
+    # Vector indexes required by the PRD review system
+    VECTOR_INDEXES = [
+        {
+            "name": "prd_description_vector",
+            "label": "PRD",
+            "property": "description_embedding"
+        },
+        {
+            "name": "review_content_vector",
+            "label": "ReviewComment",
+            "property": "content_embedding"
+        },
+        {
+            "name": "risk_impact_vector",
+            "label": "RiskAssessment",
+            "property": "impact_embedding"
+        }
+    ]
+
     def __init__(self, neo4j_client: Neo4jClient, embedding_service: EmbeddingService = None):
         self.client = neo4j_client
         self.embedding_service = embedding_service
-        self.dimension = Config.EMBEDDING_DIMENSION
-        self.similarity_function = Config.VECTOR_SIMILARITY_FUNCTION
+        self.dimension = CONFIG.embedding_dimension
+        self.similarity_function = CONFIG.vector_similarity_function
+        self.quantization_enabled = CONFIG.vector_quantization_enabled
+        # (expires_at, indexes) from the last list_vector_indexes call
+        self._index_list: Optional[Tuple[float, List[Dict[str, Any]]]] = None
         
         # Only log if embedding service is provided
         if embedding_service:
@@ -30,10 +77,13 @@ class VectorIndexer:
             logger.info("VectorIndexer initialized without embedding service (index operations only)")
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def normalize_index_name(label_or_type: str, property_name: str) -> str:
         """
         生成标准化的向量索引名称（零配置设计）
 
+        结果按 (label_or_type, property_name) 缓存。
+
         规则：
         1. 标签/类型名通过映射表简化或转小写
         2. 移除属性名中的 _embedding 后缀
@@ -54,25 +104,16 @@ class VectorIndexer:
             >>> VectorIndexer.normalize_index_name("LINK", "description_embedding")
             "link_description_vector"
         """
-        # 1. 标签/类型名标准化映射（保留完整名称以匹配现有索引）
-        label_mapping = {
-            "OntologyClass": "ontology_class",  # ← 修改：保留完整名称匹配现有索引
-            "Ontology": "ontology",
-            "PRD": "prd",
-            "ReviewComment": "review",
-            "RiskAssessment": "risk",
-            "LINK": "link",
-            "INHERITANCE": "inheritance",
-            "ACTION": "action"
-        }
-
+        # 1. 标签/类型名标准化映射见 _LABEL_MAPPING
         # 2. 获取标准化的标签名（未映射的转小写并转换为snake_case）
-        if label_or_type in label_mapping:
-            standardized_label = label_mapping[label_or_type]
+        if label_or_type in _LABEL_MAPPING:
+            standardized_label = _LABEL_MAPPING[label_or_type]
+        elif label_or_type[1:] == label_or_type[1:].lower():
+            # 首字符之后没有大写字母（如 "Flight"），无需插入下划线，跳过正则
+            standardized_label = label_or_type.lower()
         else:
             # 将 CamelCase 转换为 snake_case
-            import re
-            standardized_label = re.sub(r'(?<!^)(?=[A-Z])', '_', label_or_type).lower()
+            standardized_label = _CAMEL_RE.sub('_', label_or_type).lower()
 
         # 3. 移除属性名中的 _embedding 后缀
         property_base = property_name.replace("_embedding", "")
@@ -80,6 +121,56 @@ class VectorIndexer:
         # 4. 生成标准索引名
         return f"{standardized_label}_{property_base}_vector"
 
+    def _index_config(self) -> str:
+        """
+        Build the indexConfig map shared by node and relationship vector indexes
+
+        When VECTOR_QUANTIZATION_ENABLED is set, the index stores int8-quantized
+        vectors, which cuts index memory and speeds up searches.
+
+        Returns:
+            str: Cypher map literal
+        """
+        entries = [
+            f"`vector.dimensions`: {self.dimension}",
+            f"`vector.similarity_function`: '{self.similarity_function}'"
+        ]
+        if self.quantization_enabled:
+            entries.append("`vector.quantization.enabled`: true")
+        return "{" + ", ".join(entries) + "}"
+
+    def _execute_index_ddl(self, index_name: str, pattern: str, property_ref: str):
+        """
+        Create a vector index, falling back to FP32 if quantization is rejected
+
+        Servers older than Neo4j 5.23 reject `vector.quantization.enabled`;
+        quantization is then disabled for the remaining indexes too.
+
+        Args:
+            index_name: Name of the vector index
+            pattern: Node or relationship pattern, e.g. "(n:PRD)"
+            property_ref: Indexed property, e.g. "n.description_embedding"
+        """
+        self._index_list = None
+        try:
+            self.client.execute_write(self._index_ddl(index_name, pattern, property_ref))
+        except Exception as e:
+            if not self.quantization_enabled:
+                raise
+            logger.warning("⚠ Quantized vector index '%s' not supported (%s), falling back to FP32", index_name, e)
+            self.quantization_enabled = False
+            self.client.execute_write(self._index_ddl(index_name, pattern, property_ref))
+
+    def _index_ddl(self, index_name: str, pattern: str, property_ref: str) -> str:
+        """Build the CREATE VECTOR INDEX statement (see _execute_index_ddl)"""
+        return f"""
+            CREATE VECTOR INDEX `{index_name}` IF NOT EXISTS
+            FOR {pattern} ON ({property_ref})
+            OPTIONS {{
+              indexConfig: {self._index_config()}
+            }}
+            """
+
     def create_vector_index(self, index_name: str, node_label: str, property_name: str) -> bool:
         """
         Create a vector index for nodes
@@ -92,23 +183,12 @@ class VectorIndexer:
         Returns:
             bool: True if successful
         """
-        query = f"""
-        CREATE VECTOR INDEX `{index_name}` IF NOT EXISTS
-        FOR (n:{node_label}) ON (n.{property_name})
-        OPTIONS {{
-          indexConfig: {{
-            `vector.dimensions`: {self.dimension},
-            `vector.similarity_function`: '{self.similarity_function}'
-          }}
-        }}
-        """
-
         try:
-            self.client.execute_write(query)
-            logger.info(f"✓ Vector index '{index_name}' created successfully")
+            self._execute_index_ddl(index_name, f"(n:{node_label})", f"n.{property_name}")
+            logger.info("✓ Vector index '%s' created successfully", index_name)
             return True
         except Exception as e:
-            logger.error(f"✗ Failed to create vector index '{index_name}': {e}")
+            logger.error("✗ Failed to create vector index '%s': %s", index_name, e)
             return False
 
     def create_relationship_vector_index(self, index_name: str, relationship_type: str, property_name: str) -> bool:
@@ -123,52 +203,39 @@ class VectorIndexer:
         Returns:
             bool: True if successful
         """
-        query = f"""
-        CREATE VECTOR INDEX `{index_name}` IF NOT EXISTS
-        FOR ()-[r:{relationship_type}]-() ON (r.{property_name})
-        OPTIONS {{
-          indexConfig: {{
-            `vector.dimensions`: {self.dimension},
-            `vector.similarity_function`: '{self.similarity_function}'
-          }}
-        }}
-        """
-
         try:
-            self.client.execute_write(query)
-            logger.info(f"✓ Relationship vector index '{index_name}' created successfully")
+            self._execute_index_ddl(index_name, f"()-[r:{relationship_type}]-()", f"r.{property_name}")
+            logger.info("✓ Relationship vector index '%s' created successfully", index_name)
             return True
         except Exception as e:
-            logger.error(f"✗ Failed to create relationship vector index '{index_name}': {e}")
+            logger.error("✗ Failed to create relationship vector index '%s': %s", index_name, e)
             return False
 
     def create_all_indexes(self) -> Dict[str, bool]:
         """
         Create all required vector indexes for PRD review system
 
+        All statements run in one transaction (one round trip and commit);
+        if that fails, each index is created on its own so one bad index
+        (or a server rejecting quantization) does not fail the others.
+
         Returns:
             dict: Index creation results
         """
-        indexes = [
-            {
-                "name": "prd_description_vector",
-                "label": "PRD",
-                "property": "description_embedding"
-            },
-            {
-                "name": "review_content_vector",
-                "label": "ReviewComment",
-                "property": "content_embedding"
-            },
-            {
-                "name": "risk_impact_vector",
-                "label": "RiskAssessment",
-                "property": "impact_embedding"
-            }
+        self._index_list = None
+        statements = [
+            (self._index_ddl(config["name"], f"(n:{config['label']})", f"n.{config['property']}"), {})
+            for config in self.VECTOR_INDEXES
         ]
+        try:
+            self.client.execute_write_batches(statements)
+            logger.info("✓ Created %s vector indexes in one transaction", len(statements))
+            return {config["name"]: True for config in self.VECTOR_INDEXES}
+        except Exception as e:
+            logger.warning("⚠ Batched index creation failed, creating indexes one by one: %s", e)
 
         results = {}
-        for index_config in indexes:
+        for index_config in self.VECTOR_INDEXES:
             success = self.create_vector_index(
                 index_name=index_config["name"],
                 node_label=index_config["label"],
@@ -181,17 +248,27 @@ class VectorIndexer:
     def drop_vector_index(self, index_name: str) -> bool:
         """Drop a vector index"""
         query = f"DROP INDEX `{index_name}` IF EXISTS"
+        self._index_list = None
 
         try:
             self.client.execute_write(query)
-            logger.info(f"✓ Vector index '{index_name}' dropped")
+            logger.info("✓ Vector index '%s' dropped", index_name)
             return True
         except Exception as e:
-            logger.error(f"✗ Failed to drop index '{index_name}': {e}")
+            logger.error("✗ Failed to drop index '%s': %s", index_name, e)
             return False
 
     def list_vector_indexes(self) -> List[Dict[str, Any]]:
-        """List all vector indexes"""
+        """
+        List all vector indexes
+
+        Results are reused for INDEX_LIST_TTL seconds, and refreshed right
+        after this indexer creates or drops an index.
+        """
+        cached = self._index_list
+        if cached is not None and cached[0] > time.monotonic():
+            return list(cached[1])
+
         query = """
         SHOW INDEXES
         WHERE type = 'VECTOR'
@@ -200,13 +277,33 @@ class VectorIndexer:
         """
 
         try:
-            results = self.client.execute_query(query)
-            logger.info(f"Found {len(results)} vector indexes")
-            return results
+            results = self.client.execute_query(query, mode="read")
+            logger.info("Found %s vector indexes", len(results))
+            self._index_list = (time.monotonic() + self.INDEX_LIST_TTL, results)
+            return list(results)
         except Exception as e:
-            logger.error(f"Failed to list vector indexes: {e}")
+            logger.error("Failed to list vector indexes: %s", e)
             return []
 
+    # Lookup indexes used by the relationship joins in _create_relationships
+    # and the department pre-filter in VectorRecallSystem
+    LOOKUP_INDEXES = [
+        ("prd_prd_id", "PRD", "prd_id"),
+        ("risk_prd_id", "RiskAssessment", "prd_id"),
+        ("review_department", "ReviewComment", "department")
+    ]
+
+    def _ensure_lookup_indexes(self):
+        """Create the range indexes backing the relationship joins"""
+        for index_name, label, property_name in self.LOOKUP_INDEXES:
+            query = f"CREATE INDEX `{index_name}` IF NOT EXISTS FOR (n:{label}) ON (n.{property_name})"
+            try:
+                self.client.execute_write(query)
+                logger.info("✓ Ensured index on :%s(%s)", label, property_name)
+            except Exception as e:
+                # An equivalent index (e.g. from a uniqueness constraint) may already exist
+                logger.warning("⚠ Skipped index on :%s(%s): %s", label, property_name, e)
+
     def import_data_with_embeddings(self, data_file: str):
         """
         Import PRD data and generate embeddings
@@ -214,10 +311,22 @@ class VectorIndexer:
         Args:
             data_file: Path to JSON data file
         """
-        logger.info(f"Loading data from {data_file}")
+        self._import_data(self._load_data_file(data_file))
+
+    @staticmethod
+    def _load_data_file(data_file: str) -> Dict[str, Any]:
+        """Read and parse a PRD data file"""
+        logger.info("Loading data from %s", data_file)
 
-        with open(data_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Parse the raw bytes in one pass (no text decoding layer); the
+        # embedding texts are needed client-side, so the file is read here
+        # rather than server-side with apoc.load.json
+        with open(data_file, 'rb') as f:
+            return orjson.loads(f.read())
+
+    def _import_data(self, data: Dict[str, Any]):
+        """Import parsed PRD data, generating its embeddings"""
+        self._ensure_lookup_indexes()
 
         # Create departments
         self._create_departments(data['departments'])
@@ -239,6 +348,40 @@ class VectorIndexer:
 
         logger.info("✓ All data imported successfully")
 
+    def bulk_load_embeddings(self, data_file: str) -> Dict[str, bool]:
+        """
+        Import PRD data with the vector indexes dropped during the load
+
+        Every embedding write otherwise triggers an HNSW insertion; building
+        each index once over the final data is considerably faster. Vector
+        search is unavailable until the rebuilt indexes come ONLINE. The
+        file is parsed before anything is dropped, and the indexes are
+        recreated even if the load fails.
+
+        Args:
+            data_file: Path to JSON data file
+
+        Returns:
+            dict: Index creation results
+        """
+        data = self._load_data_file(data_file)
+
+        for index_config in self.VECTOR_INDEXES:
+            self.drop_vector_index(index_config["name"])
+
+        try:
+            start = time.perf_counter()
+            self._import_data(data)
+            load_elapsed = time.perf_counter() - start
+            logger.info("✓ Data load finished in %.2fs", load_elapsed)
+        finally:
+            start = time.perf_counter()
+            results = self.create_all_indexes()
+            index_elapsed = time.perf_counter() - start
+            logger.info("✓ Vector indexes recreated in %.2fs (population continues in the background)", index_elapsed)
+
+        return results
+
     def _create_departments(self, departments: List[Dict]):
         """Create department nodes"""
         query = """
@@ -250,67 +393,72 @@ class VectorIndexer:
         """
 
         self.client.execute_write(query, {"departments": departments})
-        logger.info(f"✓ Created {len(departments)} departments")
+        logger.info("✓ Created %s departments", len(departments))
 
     def _create_prds_with_embeddings(self, prds: List[Dict]):
         """Create PRD nodes with embeddings"""
-        logger.info(f"Generating embeddings for {len(prds)} PRDs...")
+        logger.info("Generating embeddings for %s PRDs...", len(prds))
 
         # Generate embeddings for descriptions
         descriptions = [prd['description'] for prd in prds]
-        embeddings = self.embedding_service.generate_embeddings_batch(descriptions)
-
-        # Add embeddings to PRD data
-        for prd, embedding in zip(prds, embeddings):
-            prd['description_embedding'] = embedding
+        embeddings = self._generate_embeddings(descriptions)
 
         # Import to Neo4j
         query = """
-        UNWIND $prds AS prd
-        CREATE (p:PRD {prd_id: prd.prd_id})
-        SET p.title = prd.title,
-            p.description = prd.description,
-            p.status = prd.status,
-            p.created_at = prd.created_at,
-            p.updated_at = prd.updated_at,
-            p.submitter = prd.submitter,
-            p.priority = prd.priority,
-            p.target_launch_date = prd.target_launch_date,
-            p.description_embedding = prd.description_embedding
-        """
-
-        self.client.execute_write(query, {"prds": prds})
-        logger.info(f"✓ Created {len(prds)} PRDs with embeddings")
+        UNWIND range(0, size($prd_id) - 1) AS i
+        CREATE (p:PRD {prd_id: $prd_id[i]})
+        SET p.title = $title[i],
+            p.description = $description[i],
+            p.status = $status[i],
+            p.created_at = $created_at[i],
+            p.updated_at = $updated_at[i],
+            p.submitter = $submitter[i],
+            p.priority = $priority[i],
+            p.target_launch_date = $target_launch_date[i],
+            p.description_embedding = $embedding[i]
+        """
+
+        params = self._to_columns(prds, [
+            "prd_id", "title", "description", "status", "created_at",
+            "updated_at", "submitter", "priority", "target_launch_date"
+        ])
+        params["embedding"] = [embedding_param(embedding) for embedding in embeddings]
+
+        self.client.execute_write(query, params)
+        logger.info("✓ Created %s PRDs with embeddings", len(prds))
 
     def _create_reviews_with_embeddings(self, reviews: List[Dict]):
         """Create review comment nodes with embeddings"""
-        logger.info(f"Generating embeddings for {len(reviews)} reviews...")
+        logger.info("Generating embeddings for %s reviews...", len(reviews))
 
         # Generate embeddings for review contents
         contents = [review['content'] for review in reviews]
-        embeddings = self.embedding_service.generate_embeddings_batch(contents)
-
-        # Add embeddings to review data
-        for review, embedding in zip(reviews, embeddings):
-            review['content_embedding'] = embedding
+        embeddings = self._generate_embeddings(contents)
 
         # Import to Neo4j
         query = """
-        UNWIND $reviews AS review
-        CREATE (r:ReviewComment {comment_id: review.comment_id})
-        SET r.department = review.department,
-            r.dept_id = review.dept_id,
-            r.reviewer_name = review.reviewer_name,
-            r.content = review.content,
-            r.risk_level = review.risk_level,
-            r.recommendation = review.recommendation,
-            r.feedback_type = review.feedback_type,
-            r.created_at = review.created_at,
-            r.content_embedding = review.content_embedding
-        """
-
-        self.client.execute_write(query, {"reviews": reviews})
-        logger.info(f"✓ Created {len(reviews)} review comments with embeddings")
+        UNWIND range(0, size($comment_id) - 1) AS i
+        CREATE (r:ReviewComment {comment_id: $comment_id[i]})
+        SET r.prd_id = split($comment_id[i], '_REVIEW_')[0],
+            r.department = $department[i],
+            r.dept_id = $dept_id[i],
+            r.reviewer_name = $reviewer_name[i],
+            r.content = $content[i],
+            r.risk_level = $risk_level[i],
+            r.recommendation = $recommendation[i],
+            r.feedback_type = $feedback_type[i],
+            r.created_at = $created_at[i],
+            r.content_embedding = $embedding[i]
+        """
+
+        params = self._to_columns(reviews, [
+            "comment_id", "department", "dept_id", "reviewer_name", "content",
+            "risk_level", "recommendation", "feedback_type", "created_at"
+        ])
+        params["embedding"] = [embedding_param(embedding) for embedding in embeddings]
+
+        self.client.execute_write(query, params)
+        logger.info("✓ Created %s review comments with embeddings", len(reviews))
 
     def _create_risks_with_embeddings(self, risks: List[Dict]):
         """Create risk assessment nodes with embeddings"""
@@ -318,37 +466,75 @@ class VectorIndexer:
             logger.info("No risks to create")
             return
 
-        logger.info(f"Generating embeddings for {len(risks)} risks...")
+        logger.info("Generating embeddings for %s risks...", len(risks))
 
         # Generate embeddings for risk impacts
         impacts = [risk['impact'] for risk in risks]
-        embeddings = self.embedding_service.generate_embeddings_batch(impacts)
-
-        # Add embeddings to risk data
-        for risk, embedding in zip(risks, embeddings):
-            risk['impact_embedding'] = embedding
+        embeddings = self._generate_embeddings(impacts)
 
         # Import to Neo4j
         query = """
-        UNWIND $risks AS risk
-        CREATE (r:RiskAssessment {risk_id: risk.risk_id})
-        SET r.risk_category = risk.risk_category,
-            r.severity = risk.severity,
-            r.probability = risk.probability,
-            r.impact = risk.impact,
-            r.mitigation_strategy = risk.mitigation_strategy,
-            r.impact_embedding = risk.impact_embedding
+        UNWIND range(0, size($risk_id) - 1) AS i
+        CREATE (r:RiskAssessment {risk_id: $risk_id[i]})
+        SET r.prd_id = split($risk_id[i], '_RISK_')[0],
+            r.risk_category = $risk_category[i],
+            r.severity = $severity[i],
+            r.probability = $probability[i],
+            r.impact = $impact[i],
+            r.mitigation_strategy = $mitigation_strategy[i],
+            r.impact_embedding = $embedding[i]
+        """
+
+        params = self._to_columns(risks, [
+            "risk_id", "risk_category", "severity", "probability",
+            "impact", "mitigation_strategy"
+        ])
+        params["embedding"] = [embedding_param(embedding) for embedding in embeddings]
+
+        self.client.execute_write(query, params)
+        logger.info("✓ Created %s risk assessments with embeddings", len(risks))
+
+    def _generate_embeddings(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts for a bulk import as an (N, D) array
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            np.ndarray: Embedding matrix aligned with texts
         """
+        return self.embedding_service.generate_embeddings_array(
+            texts,
+            chunk_size=self.EMBEDDING_CHUNK_SIZE,
+            max_workers=self.EMBEDDING_WORKERS
+        )
+
+    @staticmethod
+    def _to_columns(records: List[Dict], fields: List[str]) -> Dict[str, List[Any]]:
+        """
+        Transpose records into one list per field (struct-of-arrays payload)
+
+        Sending parallel lists instead of one map per record avoids a
+        map header and repeated keys per row on the wire. Queries index
+        the lists with ``UNWIND range(0, size($<field>) - 1) AS i``.
 
-        self.client.execute_write(query, {"risks": risks})
-        logger.info(f"✓ Created {len(risks)} risk assessments with embeddings")
+        Args:
+            records: Source records (left untouched)
+            fields: Fields to extract; missing fields become null
+
+        Returns:
+            dict: Field name -> list of values aligned with records
+        """
+        return {field: [record.get(field) for record in records] for field in fields}
 
     def _create_recommendations(self, recommendations: List[Dict]):
         """Create decision recommendation nodes"""
         query = """
         UNWIND $recommendations AS rec
         CREATE (r:DecisionRecommendation {recommendation_id: rec.recommendation_id})
-        SET r.decision_type = rec.decision_type,
+        SET r.prd_id = split(rec.recommendation_id, '_RECOMMENDATION')[0],
+            r.decision_type = rec.decision_type,
             r.confidence_score = rec.confidence_score,
             r.reasoning = rec.reasoning,
             r.risk_analysis = rec.risk_analysis,
@@ -356,16 +542,15 @@ class VectorIndexer:
         """
 
         self.client.execute_write(query, {"recommendations": recommendations})
-        logger.info(f"✓ Created {len(recommendations)} decision recommendations")
+        logger.info("✓ Created %s decision recommendations", len(recommendations))
 
     def _create_relationships(self, data: Dict):
         """Create all relationships"""
 
-        # PRD -> ReviewComment
+        # PRD -> ReviewComment (joined on r.prd_id, set when the review is created)
         query1 = """
-        MATCH (p:PRD)
         MATCH (r:ReviewComment)
-        WHERE r.comment_id STARTS WITH p.prd_id + '_REVIEW_'
+        MATCH (p:PRD {prd_id: r.prd_id})
         CREATE (p)-[:HAS_REVIEW]->(r)
         """
         self.client.execute_write(query1)
@@ -380,31 +565,28 @@ class VectorIndexer:
         self.client.execute_write(query2)
         logger.info("✓ Created DEPARTMENT-PROVIDES_REVIEW relationships")
 
-        # PRD -> RiskAssessment
+        # PRD -> RiskAssessment (joined on r.prd_id, set when the risk is created)
         query3 = """
-        MATCH (p:PRD)
         MATCH (r:RiskAssessment)
-        WHERE r.risk_id STARTS WITH p.prd_id + '_RISK_'
+        MATCH (p:PRD {prd_id: r.prd_id})
         CREATE (p)-[:HAS_RISK]->(r)
         """
         self.client.execute_write(query3)
         logger.info("✓ Created PRD-HAS_RISK relationships")
 
-        # PRD -> DecisionRecommendation
+        # PRD -> DecisionRecommendation (joined on d.prd_id)
         query4 = """
-        MATCH (p:PRD)
         MATCH (d:DecisionRecommendation)
-        WHERE d.recommendation_id STARTS WITH p.prd_id + '_RECOMMENDATION'
+        MATCH (p:PRD {prd_id: d.prd_id})
         CREATE (p)-[:HAS_RECOMMENDATION]->(d)
         """
         self.client.execute_write(query4)
         logger.info("✓ Created PRD-HAS_RECOMMENDATION relationships")
 
-        # ReviewComment -> RiskAssessment (for high-risk reviews)
+        # ReviewComment -> RiskAssessment (for high-risk reviews, same PRD)
         query5 = """
         MATCH (r:ReviewComment {risk_level: 'High'})
-        MATCH (risk:RiskAssessment)
-        WHERE risk.risk_id CONTAINS r.comment_id[0..7]
+        MATCH (risk:RiskAssessment {prd_id: r.prd_id})
         CREATE (r)-[:IDENTIFIES_RISK]->(risk)
         """
         self.client.execute_write(query5)
@@ -412,6 +594,8 @@ class VectorIndexer:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     print("Testing Vector Indexer...")
     print("=" * 50)
 
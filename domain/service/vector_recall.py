@@ -6,76 +6,943 @@ Implements 4 recall scenarios:
 3. Risk Identification
 4. Department Knowledge Base Retrieval
 """
+import asyncio
+import io
 import logging
-from typing import List, Dict, Any, Optional
+from collections import defaultdict
+from functools import lru_cache, partial
+from typing import List, Dict, Any, Awaitable, Callable, FrozenSet, Iterable, Optional, Union
+
+import numpy as np
 
 from infrastructure.persistence.neo4j.neo4j_client import Neo4jClient
 from infrastructure.service.embedding.embedding_service import EmbeddingService
+from infrastructure.service.embedding.embedding_cache import RecallResultCache
+from infrastructure.config.config import CONFIG
 from domain.service.vector_indexer import VectorIndexer
+from domain.service.prd_shadow_index import PRDShadowIndex
+from domain.service.reranker import rerank
+
+logger = logging.getLogger(__name__)
+
+
+def _embedding_to_param(embedding: Union[np.ndarray, List[float]]) -> List[float]:
+    """
+    Convert an embedding to a Cypher parameter
+
+    The driver accepts ndarrays but packs them element by element through
+    isinstance checks on numpy scalars; a single C-level tolist() at the
+    Bolt boundary is faster.
+    """
+    if isinstance(embedding, np.ndarray):
+        return embedding.tolist()
+    return embedding
+
+
+class VectorRecallSystem:
+    """Vector-based recall system for PRD reviews"""
+
+    # Scenario queries (parameters: $embedding, $k; review suggestions and
+    # department knowledge also $department)
+    SIMILAR_PRDS_QUERY = """
+        CALL db.index.vector.queryNodes('prd_description_vector', $k, $embedding)
+        YIELD node AS prd, score
+        OPTIONAL MATCH (prd)-[:HAS_RECOMMENDATION]->(rec:DecisionRecommendation)
+        RETURN prd.prd_id AS prd_id,
+               prd.title AS title,
+               prd.description AS description,
+               prd.status AS status,
+               prd.priority AS priority,
+               score AS similarity,
+               rec.decision_type AS decision,
+               rec.confidence_score AS confidence,
+               rec.reasoning AS reasoning
+        ORDER BY score DESC
+        LIMIT $k
+        """
+
+    # Reviews kept per department by the review suggestions scenario
+    SUGGESTIONS_PER_DEPARTMENT = 3
+
+    # Reviews of the $k most similar PRDs, best SUGGESTIONS_PER_DEPARTMENT per department
+    REVIEW_SUGGESTIONS_QUERY = f"""
+        CALL db.index.vector.queryNodes('prd_description_vector', $k, $embedding)
+        YIELD node AS similar_prd, score
+        MATCH (similar_prd)-[:HAS_REVIEW]->(review:ReviewComment)<-[:PROVIDES_REVIEW]-(dept:Department)
+        WHERE $department IS NULL OR review.department = $department
+        WITH dept, similar_prd, review, score
+        ORDER BY score DESC
+        WITH dept, collect({{
+                 source_prd: similar_prd.title,
+                 dept_type: review.department,
+                 suggestion: review.content,
+                 recommendation: review.recommendation,
+                 risk_level: review.risk_level,
+                 similarity: score
+             }})[..{SUGGESTIONS_PER_DEPARTMENT}] AS top_suggestions
+        UNWIND top_suggestions AS s
+        RETURN s.source_prd AS source_prd,
+               dept.dept_name AS department,
+               s.dept_type AS dept_type,
+               s.suggestion AS suggestion,
+               s.recommendation AS recommendation,
+               s.risk_level AS risk_level,
+               s.similarity AS similarity
+        ORDER BY similarity DESC, department
+        """
+
+    RISKS_QUERY = """
+        CALL db.index.vector.queryNodes('prd_description_vector', 20, $embedding)
+        YIELD node AS similar_prd, score
+        MATCH (similar_prd)-[:HAS_RISK]->(risk:RiskAssessment)
+        OPTIONAL MATCH (review:ReviewComment)-[:IDENTIFIES_RISK]->(risk)
+        RETURN similar_prd.title AS source_prd,
+               risk.risk_id AS risk_id,
+               risk.risk_category AS category,
+               risk.severity AS severity,
+               risk.probability AS probability,
+               risk.impact AS impact,
+               risk.mitigation_strategy AS mitigation,
+               review.department AS identified_by,
+               score AS similarity
+        ORDER BY score DESC, risk.severity DESC
+        LIMIT $k
+        """
+
+    # Pre-filtered: reviews of the department are scored exactly, so the
+    # top $k is correct however few reviews the department has
+    DEPARTMENT_KNOWLEDGE_QUERY = """
+        MATCH (review:ReviewComment {department: $department})
+        WHERE review.content_embedding IS NOT NULL
+        WITH review, vector.similarity.cosine(review.content_embedding, $embedding) AS score
+        ORDER BY score DESC
+        LIMIT $k
+        MATCH (dept:Department)-[:PROVIDES_REVIEW]->(review)
+        MATCH (prd:PRD)-[:HAS_REVIEW]->(review)
+        RETURN review.comment_id AS comment_id,
+               prd.title AS prd_title,
+               review.content AS knowledge,
+               review.recommendation AS recommendation,
+               review.risk_level AS risk_level,
+               review.reviewer_name AS reviewer,
+               dept.dept_name AS department_name,
+               score AS relevance
+        ORDER BY score DESC
+        LIMIT $k
+        """
+
+    # Property filter on the recalled node, parameterized as $filters so the
+    # query text (and its cached plan) does not depend on the filter values
+    FILTER_CLAUSE = "WHERE all(key IN keys($filters) WHERE {alias}[key] = $filters[key])\n"
+
+    # Exact scoring function per index similarity function; both return the
+    # index's normalized score
+    SIMILARITY_FUNCTIONS = {
+        "cosine": "vector.similarity.cosine",
+        "euclidean": "vector.similarity.euclidean"
+    }
+
+    # RETURN clause of search_knowledge_base per node type
+    KNOWLEDGE_BASE_RETURNS = {
+        "Ontology": """
+            RETURN 
+                node.name AS name,
+                node.version AS version,
+                node.node_id AS node_id,
+                score AS similarity
+            ORDER BY score DESC
+            LIMIT $k
+            """,
+        "PRD": """
+            RETURN 
+                node.prd_id AS prd_id,
+                node.title AS title,
+                node.description AS description,
+                score AS similarity
+            ORDER BY score DESC
+            LIMIT $k
+            """,
+        "ReviewComment": """
+            RETURN 
+                node.comment_id AS comment_id,
+                node.content AS content,
+                node.department AS department,
+                score AS similarity
+            ORDER BY score DESC
+            LIMIT $k
+            """,
+        "RiskAssessment": """
+            RETURN 
+                node.risk_id AS risk_id,
+                node.risk_category AS category,
+                node.impact AS impact,
+                node.severity AS severity,
+                score AS similarity
+            ORDER BY score DESC
+            LIMIT $k
+            """,
+        # Generic query for any other node type
+        "__generic__": """
+            RETURN 
+                node.name AS name,
+                score AS similarity
+            ORDER BY score DESC
+            LIMIT $k
+            """
+    }
+
+    # Per-label queries kept by _knowledge_base_query and _hybrid_query
+    # (labels come from requests, so the caches are bounded)
+    QUERY_CACHE_SIZE = 128
+
+    # Vector index and embedding property searched by hybrid_search per node type
+    # (other types use <label>_name_vector on name_embedding)
+    HYBRID_INDEXES = {
+        "Ontology": ("ontology_name_vector", "name_embedding"),
+        "PRD": ("prd_description_vector", "description_embedding"),
+        "ReviewComment": ("review_content_vector", "content_embedding"),
+        "RiskAssessment": ("risk_impact_vector", "impact_embedding")
+    }
+
+    # Query text limit in characters (~8k tokens for qwen3-embedding-8b)
+    MAX_QUERY_CHARS = 32000
+
+    # Department types searched by search_all_departments_async
+    DEPARTMENTS = ("Tech", "Finance", "HR", "Compliance", "Security")
+
+    # Concurrent async queries per run_all_scenarios_async call (bounded by
+    # the driver's connection pool, NEO4J_MAX_CONNECTION_POOL_SIZE)
+    MAX_CONCURRENT_QUERIES = 10
+
+    # Candidates fetched per requested result when hybrid_search reranks with boosts
+    RERANK_CANDIDATE_FACTOR = 3
+
+    # Optional parts of get_prd_context; pattern comprehensions keep each
+    # traversal independent (no reviews x risks row product)
+    PRD_CONTEXT_PARTS = {
+        "reviews": "[(prd)-[:HAS_REVIEW]->(review:ReviewComment) | review] AS reviews",
+        "risks": "[(prd)-[:HAS_RISK]->(risk:RiskAssessment) | risk] AS risks",
+        "recommendation": "head([(prd)-[:HAS_RECOMMENDATION]->(rec:DecisionRecommendation) | rec]) AS recommendation"
+    }
+
+    # Result columns of each scenario, used to combine scenarios into one statement
+    SCENARIO_COLUMNS = {
+        "similar_prds": (
+            "prd_id", "title", "description", "status", "priority",
+            "similarity", "decision", "confidence", "reasoning"
+        ),
+        "review_suggestions": (
+            "source_prd", "department", "dept_type", "suggestion",
+            "recommendation", "risk_level", "similarity"
+        ),
+        "risks": (
+            "source_prd", "risk_id", "category", "severity", "probability",
+            "impact", "mitigation", "identified_by", "similarity"
+        ),
+        "department_knowledge": (
+            "comment_id", "prd_title", "knowledge", "recommendation",
+            "risk_level", "reviewer", "department_name", "relevance"
+        )
+    }
+
+    def __init__(
+        self,
+        neo4j_client: Neo4jClient,
+        embedding_service: EmbeddingService,
+        result_cache: Optional[RecallResultCache] = None,
+        embed_async: Optional[Callable[[str], Awaitable[np.ndarray]]] = None,
+        prd_index: Optional[PRDShadowIndex] = None
+    ):
+        """
+        Initialize recall system
+
+        Args:
+            neo4j_client: Neo4j client
+            embedding_service: Embedding service
+            result_cache: Recall results cache (default: new RecallResultCache
+                          unless RECALL_CACHE_SIZE is 0)
+            embed_async: Coroutine function embedding one query text for the
+                         *_async methods, e.g. a request batcher (default:
+                         embedding_service.generate_embedding_async)
+            prd_index: In-memory PRD index serving similar-PRD searches once
+                       loaded (optional; the caller keeps it refreshed)
+        """
+        self.client = neo4j_client
+        self.embedding_service = embedding_service
+        self.embed_async = embed_async or embedding_service.generate_embedding_async
+        self.prd_index = prd_index
+
+        # Recall results cache (disabled when RECALL_CACHE_SIZE is 0)
+        if result_cache is None and CONFIG.recall_cache_size > 0:
+            result_cache = RecallResultCache()
+        self.result_cache = result_cache
+
+        # Build the hybrid_search queries of the known node types up front
+        for node_label in self.HYBRID_INDEXES:
+            for filtered in (False, True):
+                self._hybrid_query(node_label, filtered)
+
+    def _prepare_query(self, query_text: Optional[str]) -> Optional[str]:
+        """
+        Normalize query text before embedding
+
+        Collapses whitespace (so formatting differences share cache entries)
+        and truncates to MAX_QUERY_CHARS. Returns None for empty input, which
+        callers answer with no results instead of an embedding API call.
+        """
+        if not query_text or not query_text.strip():
+            logger.info("Empty query, returning no results")
+            return None
+        return ' '.join(query_text.split())[:self.MAX_QUERY_CHARS]
+
+    def _resolve_embedding(self, query_text: str, query_embedding: Optional[np.ndarray]) -> np.ndarray:
+        """Return the precomputed query embedding, or generate it"""
+        if query_embedding is not None:
+            return query_embedding
+        return self.embedding_service.generate_embedding(query_text)
+
+    @classmethod
+    @lru_cache(maxsize=QUERY_CACHE_SIZE)
+    def _knowledge_base_query(cls, node_label: str, filtered: bool) -> str:
+        """
+        Get the search_knowledge_base query for a node type, building it once
+
+        Args:
+            node_label: Node type to search
+            filtered: Whether property filters are applied
+
+        Returns:
+            str: Cypher query
+        """
+        # Auto-generate standardized index name (zero-config design)
+        # Always use description_embedding as the default property
+        property_name = 'description_embedding'
+        index_name = VectorIndexer.normalize_index_name(
+            label_or_type=node_label,
+            property_name=property_name
+        )
+        logger.info("Using vector index: %s", index_name)
+
+        return_clause = cls.KNOWLEDGE_BASE_RETURNS.get(node_label, cls.KNOWLEDGE_BASE_RETURNS["__generic__"])
+        return cls._vector_candidates(
+            "node", index_name, node_label, property_name, filtered
+        ) + return_clause
+
+    @classmethod
+    @lru_cache(maxsize=QUERY_CACHE_SIZE)
+    def _hybrid_query(cls, node_label: str, filtered: bool) -> str:
+        """
+        Get the hybrid_search query for a node type, building it once
+
+        Args:
+            node_label: Node type to search
+            filtered: Whether property filters are applied
+
+        Returns:
+            str: Cypher query
+        """
+        index_name, property_name = cls.HYBRID_INDEXES.get(
+            node_label, (f"{node_label.lower()}_name_vector", "name_embedding")
+        )
+        node_alias = node_label.lower()[:3]  # Short alias for Cypher query
+
+        # Exact pre-filtered search when filters are given
+        cypher_query = cls._vector_candidates(node_alias, index_name, node_label, property_name, filtered)
+
+        # Add dynamic relationships and return based on node type
+        if node_label == "PRD":
+            cypher_query += f"""
+            OPTIONAL MATCH ({node_alias})-[:HAS_RECOMMENDATION]->(rec:DecisionRecommendation)
+            OPTIONAL MATCH ({node_alias})-[:HAS_RISK]->(risk:RiskAssessment)
+            WITH {node_alias}, score, rec, COUNT(risk) AS risk_count
+            RETURN {node_alias}.prd_id AS prd_id,
+                   {node_alias}.title AS title,
+                   {node_alias}.description AS description,
+                   {node_alias}.priority AS priority,
+                   {node_alias}.status AS status,
+                   score AS similarity,
+                   rec.decision_type AS decision,
+                   risk_count AS num_risks
+            ORDER BY score DESC
+            LIMIT $k
+            """
+        else:
+            # Generic return for other node types
+            cypher_query += f"""
+            RETURN {node_alias}.name AS name,
+                   score AS similarity
+            ORDER BY score DESC
+            LIMIT $k
+            """
+
+        return cypher_query
+
+    @classmethod
+    def _vector_candidates(
+        cls,
+        alias: str,
+        index_name: str,
+        node_label: str,
+        property_name: str,
+        filtered: bool = False
+    ) -> str:
+        """
+        Build the opening of a recall query, yielding ``alias`` and ``score``
+
+        Without filters the top $k nodes come from the vector index. With
+        filters the nodes are filtered first and scored exactly with the
+        function matching CONFIG.vector_similarity_function (same
+        normalized score as the index), so
+        selective filters still return $k results instead of whatever
+        survives a post-filter over the index's top candidates.
+
+        Args:
+            alias: Variable name for the node
+            index_name: Vector index to query when unfiltered
+            node_label: Label of the indexed nodes
+            property_name: Embedding property
+            filtered: Whether $filters is applied
+
+        Returns:
+            str: Cypher fragment
+        """
+        if not filtered:
+            return f"""
+        CALL db.index.vector.queryNodes('{index_name}', $k, $embedding)
+        YIELD node AS {alias}, score
+        """
+
+        similarity = cls.SIMILARITY_FUNCTIONS[CONFIG.vector_similarity_function.lower()]
+        return f"""
+        MATCH ({alias}:`{node_label}`)
+        {cls.FILTER_CLAUSE.format(alias=alias).strip()}
+          AND {alias}.`{property_name}` IS NOT NULL
+        WITH {alias}, {similarity}({alias}.`{property_name}`, $embedding) AS score
+        ORDER BY score DESC
+        LIMIT $k
+        """
+
+    @staticmethod
+    def _filter_params(filters: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Filter values as strings, matching how filters are compared"""
+        return {key: str(value) for key, value in (filters or {}).items()}
+
+    @classmethod
+    def _batch_query(cls, scenarios: Dict[str, str]) -> str:
+        """
+        Combine scenario queries into one statement returning a single row
+
+        Each scenario runs in its own CALL subquery whose rows are collected
+        into a list of maps; the ungrouped collect() always yields exactly one
+        row (an empty list when nothing matches), so all scenarios share one
+        round-trip without multiplying or dropping rows.
+
+        Args:
+            scenarios: Scenario name -> scenario query
+
+        Returns:
+            str: Cypher returning one column per scenario
+        """
+        parts = []
+        for name, cypher_query in scenarios.items():
+            row_map = ", ".join(f"{column}: {column}" for column in cls.SCENARIO_COLUMNS[name])
+            parts.append(f"CALL {{ CALL {{{cypher_query}}} RETURN collect({{{row_map}}}) AS {name} }}")
+        return "\n".join(parts) + f"\nRETURN {', '.join(scenarios)}"
+
+    def _execute_recall(
+        self,
+        cypher_query: str,
+        params: Dict[str, Any],
+        query_text: str,
+        query_embedding: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        """
+        Run a vector recall query, serving repeated queries from the result cache
+
+        Args:
+            cypher_query: Cypher query taking $embedding
+            params: Query parameters other than the embedding
+            query_text: Query text (exact cache key)
+            query_embedding: Query embedding (semantic cache key)
+
+        Returns:
+            list: Query results
+        """
+        if self.result_cache is None:
+            return self.client.execute_query(
+                cypher_query, {**params, "embedding": _embedding_to_param(query_embedding)}, mode="read"
+            )
+
+        namespace = self.result_cache.namespace(cypher_query, params)
+        results = self.result_cache.get(namespace, query_text, query_embedding)
+        if results is not None:
+            logger.info("✓ Served from recall cache")
+            return list(results)
+
+        results = self.client.execute_query(
+            cypher_query, {**params, "embedding": _embedding_to_param(query_embedding)}, mode="read"
+        )
+        self.result_cache.set(namespace, query_text, query_embedding, results)
+        return list(results)
+
+    def run_full_review(
+        self,
+        query_text: str,
+        department: Optional[str] = None,
+        top_k: int = 5
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Run all PRD review scenarios with a single embedding call
+
+        The query embedding is generated once and shared by every scenario,
+        instead of one embedding API round-trip per scenario, and the
+        scenario queries are combined into one Cypher statement.
+
+        Args:
+            query_text: New PRD description
+            department: Department for the knowledge base scenario (optional)
+            top_k: Number of results per scenario
+
+        Returns:
+            dict: Results keyed by scenario
+        """
+        query_text = self._prepare_query(query_text)
+        if query_text is None:
+            return {}
+
+        logger.info("Running full review for: %.50s...", query_text)
+
+        query_embedding = self.embedding_service.generate_embedding(query_text)
+
+        scenarios = self._full_review_scenarios(department)
+        params = {"k": top_k, "department": department}
+
+        try:
+            rows = self._execute_recall(self._batch_query(scenarios), params, query_text, query_embedding)
+            results = rows[0] if rows else {name: [] for name in scenarios}
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("✓ Full review completed in one query: %s",
+                            ", ".join(f"{name}={len(results[name])}" for name in scenarios))
+            return results
+        except Exception as e:
+            # Fall back to one query per scenario (failures are isolated per scenario)
+            logger.warning("Batched full review failed, running scenarios separately: %s", e)
+
+        results = {
+            "similar_prds": self.find_similar_prds(
+                query_text, top_k, query_embedding=query_embedding
+            ),
+            "review_suggestions": self.get_intelligent_review_suggestions(
+                query_text, department, top_k, query_embedding=query_embedding
+            ),
+            "risks": self.identify_potential_risks(
+                query_text, top_k, query_embedding=query_embedding
+            )
+        }
+        if department:
+            results["department_knowledge"] = self.search_department_knowledge_base(
+                query_text, department, top_k, query_embedding=query_embedding
+            )
+
+        return results
+
+    def _full_review_scenarios(self, department: Optional[str]) -> Dict[str, str]:
+        """Scenario name -> query run by a full review"""
+        scenarios = {
+            "similar_prds": self.SIMILAR_PRDS_QUERY,
+            "review_suggestions": self.REVIEW_SUGGESTIONS_QUERY,
+            "risks": self.RISKS_QUERY
+        }
+        if department:
+            scenarios["department_knowledge"] = self.DEPARTMENT_KNOWLEDGE_QUERY
+        return scenarios
+
+    async def run_full_review_async(
+        self,
+        query_text: str,
+        department: Optional[str] = None,
+        top_k: int = 5
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Async variant of run_full_review
+
+        Falls back to run_all_scenarios_async (one concurrent query per
+        scenario) if the combined query fails.
+        """
+        query_text = self._prepare_query(query_text)
+        if query_text is None:
+            return {}
+
+        logger.info("Running full review (async) for: %.50s...", query_text)
+
+        query_embedding = await self.embed_async(query_text)
+        scenarios = self._full_review_scenarios(department)
+        params = {"k": top_k, "department": department}
+
+        try:
+            rows = await self._execute_recall_async(
+                self._batch_query(scenarios), params, query_text, query_embedding
+            )
+            return rows[0] if rows else {name: [] for name in scenarios}
+        except Exception as e:
+            logger.warning("Batched full review failed, running scenarios separately: %s", e)
+
+        return await self.run_all_scenarios_async(
+            query_text, department, top_k, query_embedding=query_embedding
+        )
+
+    async def _execute_recall_async(
+        self,
+        cypher_query: str,
+        params: Dict[str, Any],
+        query_text: str,
+        query_embedding: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of _execute_recall, running the query on the async driver
+
+        Args:
+            cypher_query: Cypher query taking $embedding
+            params: Query parameters other than the embedding
+            query_text: Query text (exact cache key)
+            query_embedding: Query embedding (semantic cache key)
+
+        Returns:
+            list: Query results
+        """
+        if self.result_cache is None:
+            return await self.client.execute_query_async(
+                cypher_query, {**params, "embedding": _embedding_to_param(query_embedding)}, mode="read"
+            )
+
+        namespace = self.result_cache.namespace(cypher_query, params)
+        results = self.result_cache.get(namespace, query_text, query_embedding)
+        if results is not None:
+            logger.info("✓ Served from recall cache")
+            return list(results)
+
+        results = await self.client.execute_query_async(
+            cypher_query, {**params, "embedding": _embedding_to_param(query_embedding)}, mode="read"
+        )
+        self.result_cache.set(namespace, query_text, query_embedding, results)
+        return list(results)
+
+    async def _recall_scenario_async(
+        self,
+        description: str,
+        cypher_query: str,
+        params: Dict[str, Any],
+        query_text: str,
+        query_embedding: Optional[np.ndarray],
+        local_search: Optional[Callable[[np.ndarray], Optional[List[Dict[str, Any]]]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run one scenario query asynchronously, returning [] on failure
+
+        Args:
+            description: Scenario name used in log messages
+            cypher_query: Scenario query
+            params: Query parameters other than the embedding
+            query_text: Query text
+            query_embedding: Precomputed embedding of query_text (optional)
+            local_search: In-memory search tried before the query; returning
+                          None falls through to Neo4j (optional)
+
+        Returns:
+            list: Query results
+        """
+        query_text = self._prepare_query(query_text)
+        if query_text is None:
+            return []
+
+        if query_embedding is None:
+            query_embedding = await self.embed_async(query_text)
+
+        if local_search is not None:
+            results = await asyncio.to_thread(local_search, query_embedding)
+            if results is not None:
+                logger.info("✓ %s: %s results (in memory)", description, len(results))
+                return results
+
+        try:
+            results = await self._execute_recall_async(cypher_query, params, query_text, query_embedding)
+            logger.info("✓ %s: %s results", description, len(results))
+            return results
+        except Exception as e:
+            logger.error("%s failed: %s", description, e)
+            return []
+
+    async def find_similar_prds_async(
+        self,
+        query_text: str,
+        top_k: int = 5,
+        query_embedding: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
+        """Async variant of find_similar_prds"""
+        local_search = partial(self.prd_index.search, k=top_k) if self.prd_index is not None else None
+        return await self._recall_scenario_async(
+            "Similar PRD search", self.SIMILAR_PRDS_QUERY,
+            {"k": top_k}, query_text, query_embedding, local_search
+        )
+
+    async def get_intelligent_review_suggestions_async(
+        self,
+        query_text: str,
+        department: Optional[str] = None,
+        top_k: int = 10,
+        query_embedding: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
+        """Async variant of get_intelligent_review_suggestions"""
+        return await self._recall_scenario_async(
+            "Review suggestion search", self.REVIEW_SUGGESTIONS_QUERY,
+            {"k": top_k, "department": department}, query_text, query_embedding
+        )
+
+    async def identify_potential_risks_async(
+        self,
+        query_text: str,
+        top_k: int = 5,
+        query_embedding: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
+        """Async variant of identify_potential_risks"""
+        return await self._recall_scenario_async(
+            "Risk identification", self.RISKS_QUERY,
+            {"k": top_k}, query_text, query_embedding
+        )
+
+    async def search_department_knowledge_base_async(
+        self,
+        query_text: str,
+        department: str,
+        top_k: int = 8,
+        query_embedding: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
+        """Async variant of search_department_knowledge_base"""
+        return await self._recall_scenario_async(
+            f"{department} knowledge search", self.DEPARTMENT_KNOWLEDGE_QUERY,
+            {"k": top_k, "department": department}, query_text, query_embedding
+        )
 
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+    async def search_knowledge_base_async(
+        self,
+        query_text: str,
+        top_k: int = 8,
+        node_label: str = "Ontology",
+        filters: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
+        """Async variant of search_knowledge_base"""
+        return await self._recall_scenario_async(
+            f"{node_label} knowledge search", self._knowledge_base_query(node_label, bool(filters)),
+            {"k": top_k, "filters": self._filter_params(filters)}, query_text, query_embedding
+        )
 
+    async def search_knowledge_base_batch_async(
+        self,
+        queries: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several knowledge base searches with one batched embedding call
 
-class VectorRecallSystem:
-    """Vector-based recall system for PRD reviews"""
+        The query texts are embedded together (duplicates once), then the
+        searches run concurrently on the async driver.
 
-    def __init__(self, neo4j_client: Neo4jClient, embedding_service: EmbeddingService):
-        self.client = neo4j_client
-        self.embedding_service = embedding_service
+        Args:
+            queries: Keyword arguments of search_knowledge_base_async
+                     (query_text, top_k, node_label, filters), one dict per search
+
+        Returns:
+            list: Results of each search, in input order (empty for empty queries)
+        """
+        texts = [self._prepare_query(query.get("query_text")) for query in queries]
+        unique = list(dict.fromkeys(text for text in texts if text is not None))
+        embeddings = {}
+        if unique:
+            logger.info("Embedding %s queries for a batch of %s searches", len(unique), len(queries))
+            matrix = await asyncio.to_thread(self.embedding_service.generate_embeddings_batch, unique)
+            if len(matrix) != len(unique) or not matrix.any(axis=1).all():
+                raise RuntimeError("Failed to generate query embeddings")
+            embeddings = dict(zip(unique, matrix))
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_QUERIES)
+
+        async def search(query: Dict[str, Any], text: Optional[str]) -> List[Dict[str, Any]]:
+            if text is None:
+                return []
+            async with semaphore:
+                return await self.search_knowledge_base_async(
+                    **dict(query, query_text=text), query_embedding=embeddings[text]
+                )
+
+        return list(await asyncio.gather(*(search(query, text) for query, text in zip(queries, texts))))
+
+    async def hybrid_search_async(
+        self,
+        query_text: str,
+        node_label: str = "PRD",
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        query_embedding: Optional[np.ndarray] = None,
+        boosts: Optional[Dict[str, Dict[Any, float]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Async variant of hybrid_search"""
+        candidates = top_k * self.RERANK_CANDIDATE_FACTOR if boosts else top_k
+        results = await self._recall_scenario_async(
+            "Hybrid search", self._hybrid_query(node_label, bool(filters)),
+            {"k": candidates, "filters": self._filter_params(filters)}, query_text, query_embedding
+        )
+        return rerank(results, boosts, top_k) if boosts else results
+
+    async def search_all_departments_async(
+        self,
+        query_text: str,
+        top_k: int = 8,
+        departments: Optional[List[str]] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Search every department's knowledge base with one embedding call
 
-    def find_similar_prds(self, query_text: str, top_k: int = 5) -> List[Dict[str, Any]]:
+        The department queries run concurrently on the async driver.
+
+        Args:
+            query_text: Query text
+            top_k: Number of results per department
+            departments: Departments to search (default: DEPARTMENTS)
+
+        Returns:
+            dict: Results keyed by department
+        """
+        departments = list(departments or self.DEPARTMENTS)
+        query_text = self._prepare_query(query_text)
+        if query_text is None:
+            return {}
+
+        logger.info("Searching %s department knowledge bases for: %.50s...", len(departments), query_text)
+
+        query_embedding = await self.embed_async(query_text)
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_QUERIES)
+
+        async def search(department: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.search_department_knowledge_base_async(
+                    query_text, department, top_k, query_embedding=query_embedding
+                )
+
+        results = await asyncio.gather(*(search(department) for department in departments))
+        return dict(zip(departments, results))
+
+    async def run_all_scenarios_async(
+        self,
+        query_text: str,
+        department: Optional[str] = None,
+        top_k: int = 5,
+        query_embedding: Optional[np.ndarray] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Run all PRD review scenarios concurrently on the async driver
+
+        The embedding is generated once, then the scenario queries run in
+        parallel over the connection pool, so latency is that of the slowest
+        scenario rather than the sum of all of them.
+
+        Args:
+            query_text: New PRD description
+            department: Department for the knowledge base scenario (optional)
+            top_k: Number of results per scenario
+            query_embedding: Precomputed embedding of query_text (optional)
+
+        Returns:
+            dict: Results keyed by scenario (same shape as run_full_review)
+        """
+        query_text = self._prepare_query(query_text)
+        if query_text is None:
+            return {}
+
+        logger.info("Running all scenarios (async) for: %.50s...", query_text)
+
+        if query_embedding is None:
+            query_embedding = await self.embed_async(query_text)
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_QUERIES)
+
+        async def limited(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        scenarios = {
+            "similar_prds": self.find_similar_prds_async(
+                query_text, top_k, query_embedding=query_embedding
+            ),
+            "review_suggestions": self.get_intelligent_review_suggestions_async(
+                query_text, department, top_k, query_embedding=query_embedding
+            ),
+            "risks": self.identify_potential_risks_async(
+                query_text, top_k, query_embedding=query_embedding
+            )
+        }
+        if department:
+            scenarios["department_knowledge"] = self.search_department_knowledge_base_async(
+                query_text, department, top_k, query_embedding=query_embedding
+            )
+
+        results = await asyncio.gather(*(limited(coroutine) for coroutine in scenarios.values()))
+        return dict(zip(scenarios, results))
+
+    def find_similar_prds(
+        self,
+        query_text: str,
+        top_k: int = 5,
+        query_embedding: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
         """
         Scenario 1: Find similar historical PRDs based on description
 
         Args:
             query_text: Query PRD description
             top_k: Number of similar PRDs to return
+            query_embedding: Precomputed embedding of query_text (optional)
 
         Returns:
             list: Similar PRDs with similarity scores and decision outcomes
         """
-        logger.info(f"Finding {top_k} similar PRDs for query: {query_text[:50]}...")
+        query_text = self._prepare_query(query_text)
+        if query_text is None:
+            return []
+
+        logger.info("Finding %s similar PRDs for query: %.50s...", top_k, query_text)
 
         # Generate embedding for query
-        query_embedding = self.embedding_service.generate_embedding(query_text)
+        query_embedding = self._resolve_embedding(query_text, query_embedding)
+
+        if self.prd_index is not None:
+            results = self.prd_index.search(query_embedding, top_k)
+            if results is not None:
+                logger.info("✓ Found %s similar PRDs (in memory)", len(results))
+                return results
 
         # Vector search query
-        cypher_query = """
-        CALL db.index.vector.queryNodes('prd_description_vector', $k, $embedding)
-        YIELD node AS prd, score
-        OPTIONAL MATCH (prd)-[:HAS_RECOMMENDATION]->(rec:DecisionRecommendation)
-        RETURN prd.prd_id AS prd_id,
-               prd.title AS title,
-               prd.description AS description,
-               prd.status AS status,
-               prd.priority AS priority,
-               score AS similarity,
-               rec.decision_type AS decision,
-               rec.confidence_score AS confidence,
-               rec.reasoning AS reasoning
-        ORDER BY score DESC
-        LIMIT $k
-        """
+        cypher_query = self.SIMILAR_PRDS_QUERY
 
         try:
-            results = self.client.execute_query(
+            results = self._execute_recall(
                 cypher_query,
-                {"k": top_k, "embedding": query_embedding}
+                {"k": top_k},
+                query_text,
+                query_embedding
             )
 
-            logger.info(f"✓ Found {len(results)} similar PRDs")
+            logger.info("✓ Found %s similar PRDs", len(results))
             return results
 
         except Exception as e:
-            logger.error(f"Similar PRD search failed: {e}")
+            logger.error("Similar PRD search failed: %s", e)
             return []
 
     def get_intelligent_review_suggestions(
         self,
         query_text: str,
         department: Optional[str] = None,
-        top_k: int = 10
+        top_k: int = 10,
+        query_embedding: Optional[np.ndarray] = None
     ) -> List[Dict[str, Any]]:
         """
         Scenario 2: Get intelligent review suggestions based on similar historical reviews
@@ -83,99 +950,81 @@ class VectorRecallSystem:
         Args:
             query_text: New PRD description
             department: Filter by specific department (optional)
-            top_k: Number of similar reviews to retrieve
+            top_k: Number of similar PRDs whose reviews are considered
+            query_embedding: Precomputed embedding of query_text (optional)
 
         Returns:
-            list: Historical review suggestions grouped by department
+            list: Historical review suggestions, top SUGGESTIONS_PER_DEPARTMENT per department
         """
-        logger.info(f"Getting review suggestions for: {query_text[:50]}...")
+        query_text = self._prepare_query(query_text)
+        if query_text is None:
+            return []
+
+        logger.info("Getting review suggestions for: %.50s...", query_text)
 
         # Generate embedding for query
-        query_embedding = self.embedding_service.generate_embedding(query_text)
+        query_embedding = self._resolve_embedding(query_text, query_embedding)
 
         # Vector search for similar PRDs, then get their reviews
-        cypher_query = """
-        CALL db.index.vector.queryNodes('prd_description_vector', $k, $embedding)
-        YIELD node AS similar_prd, score
-        MATCH (similar_prd)-[:HAS_REVIEW]->(review:ReviewComment)
-        """
-
-        # Add department filter if specified
-        if department:
-            cypher_query += f"\nWHERE review.department = '{department}'"
-
-        cypher_query += """
-        MATCH (dept:Department)-[:PROVIDES_REVIEW]->(review)
-        RETURN similar_prd.title AS source_prd,
-               dept.dept_name AS department,
-               review.department AS dept_type,
-               review.content AS suggestion,
-               review.recommendation AS recommendation,
-               review.risk_level AS risk_level,
-               score AS similarity
-        ORDER BY score DESC, dept.dept_name
-        LIMIT $k
-        """
+        cypher_query = self.REVIEW_SUGGESTIONS_QUERY
 
         try:
-            results = self.client.execute_query(
+            results = self._execute_recall(
                 cypher_query,
-                {"k": top_k, "embedding": query_embedding}
+                {"k": top_k, "department": department},
+                query_text,
+                query_embedding
             )
 
-            logger.info(f"✓ Found {len(results)} review suggestions")
+            logger.info("✓ Found %s review suggestions", len(results))
             return results
 
         except Exception as e:
-            logger.error(f"Review suggestion search failed: {e}")
+            logger.error("Review suggestion search failed: %s", e)
             return []
 
-    def identify_potential_risks(self, query_text: str, top_k: int = 5) -> List[Dict[str, Any]]:
+    def identify_potential_risks(
+        self,
+        query_text: str,
+        top_k: int = 5,
+        query_embedding: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
         """
         Scenario 3: Identify potential risks by finding similar historical risks
 
         Args:
             query_text: New PRD description
             top_k: Number of similar risks to return
+            query_embedding: Precomputed embedding of query_text (optional)
 
         Returns:
             list: Historical risk assessments from similar projects
         """
-        logger.info(f"Identifying potential risks for: {query_text[:50]}...")
+        query_text = self._prepare_query(query_text)
+        if query_text is None:
+            return []
+
+        logger.info("Identifying potential risks for: %.50s...", query_text)
 
         # Generate embedding for query
-        query_embedding = self.embedding_service.generate_embedding(query_text)
+        query_embedding = self._resolve_embedding(query_text, query_embedding)
 
         # Search for similar risks via similar PRDs
-        cypher_query = """
-        CALL db.index.vector.queryNodes('prd_description_vector', 20, $embedding)
-        YIELD node AS similar_prd, score
-        MATCH (similar_prd)-[:HAS_RISK]->(risk:RiskAssessment)
-        OPTIONAL MATCH (review:ReviewComment)-[:IDENTIFIES_RISK]->(risk)
-        RETURN similar_prd.title AS source_prd,
-               risk.risk_id AS risk_id,
-               risk.risk_category AS category,
-               risk.severity AS severity,
-               risk.probability AS probability,
-               risk.impact AS impact,
-               risk.mitigation_strategy AS mitigation,
-               review.department AS identified_by,
-               score AS similarity
-        ORDER BY score DESC, risk.severity DESC
-        LIMIT $k
-        """
+        cypher_query = self.RISKS_QUERY
 
         try:
-            results = self.client.execute_query(
+            results = self._execute_recall(
                 cypher_query,
-                {"k": top_k, "embedding": query_embedding}
+                {"k": top_k},
+                query_text,
+                query_embedding
             )
 
-            logger.info(f"✓ Identified {len(results)} potential risks")
+            logger.info("✓ Identified %s potential risks", len(results))
             return results
 
         except Exception as e:
-            logger.error(f"Risk identification failed: {e}")
+            logger.error("Risk identification failed: %s", e)
             return []
 
     def search_knowledge_base(
@@ -183,7 +1032,8 @@ class VectorRecallSystem:
         query_text: str,
         top_k: int = 8,
         node_label: str = "Ontology",
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[np.ndarray] = None
     ) -> List[Dict[str, Any]]:
         """
         Generic knowledge base search for any node type with optional filters
@@ -193,145 +1043,44 @@ class VectorRecallSystem:
             top_k: Number of results to return
             node_label: Node type to search (default: Ontology)
             filters: Additional filters (version, entity_type, etc.)
+            query_embedding: Precomputed embedding of query_text (optional)
 
         Returns:
             list: Relevant nodes with similarity scores
         """
-        logger.info(f"Searching {node_label} knowledge base for: {query_text[:50]}...")
-
-        # Generate embedding for query
-        query_embedding = self.embedding_service.generate_embedding(query_text)
-
-        # Auto-generate standardized index name (zero-config design)
-        # Always use description_embedding as the default property
-        property_name = 'description_embedding'
-
-        index_name = VectorIndexer.normalize_index_name(
-            label_or_type=node_label,
-            property_name=property_name
-        )
+        query_text = self._prepare_query(query_text)
+        if query_text is None:
+            return []
 
-        logger.info(f"Using vector index: {index_name}")
+        logger.info("Searching %s knowledge base for: %.50s...", node_label, query_text)
 
-        # Build where clauses for filters
-        where_clauses = []
-        if filters:
-            for key, value in filters.items():
-                where_clauses.append(f"node.{key} = '{value}'")
+        # Generate embedding for query
+        query_embedding = self._resolve_embedding(query_text, query_embedding)
 
-        # Dynamic query based on node type
-        if node_label == "Ontology":
-            base_query = f"""
-            CALL db.index.vector.queryNodes('{index_name}', $k, $embedding)
-            YIELD node, score
-            """
-            
-            if where_clauses:
-                base_query += "WHERE " + " AND ".join(where_clauses) + "\n"
-                
-            cypher_query = base_query + f"""
-            RETURN 
-                node.name AS name,
-                node.version AS version,
-                node.node_id AS node_id,
-                score AS similarity
-            ORDER BY score DESC
-            LIMIT $k
-            """
-        elif node_label == "PRD":
-            base_query = f"""
-            CALL db.index.vector.queryNodes('{index_name}', $k, $embedding)
-            YIELD node, score
-            """
-            
-            if where_clauses:
-                base_query += "WHERE " + " AND ".join(where_clauses) + "\n"
-                
-            cypher_query = base_query + f"""
-            RETURN 
-                node.prd_id AS prd_id,
-                node.title AS title,
-                node.description AS description,
-                score AS similarity
-            ORDER BY score DESC
-            LIMIT $k
-            """
-        elif node_label == "ReviewComment":
-            base_query = f"""
-            CALL db.index.vector.queryNodes('{index_name}', $k, $embedding)
-            YIELD node, score
-            """
-            
-            if where_clauses:
-                base_query += "WHERE " + " AND ".join(where_clauses) + "\n"
-                
-            cypher_query = base_query + f"""
-            RETURN 
-                node.comment_id AS comment_id,
-                node.content AS content,
-                node.department AS department,
-                score AS similarity
-            ORDER BY score DESC
-            LIMIT $k
-            """
-        elif node_label == "RiskAssessment":
-            base_query = f"""
-            CALL db.index.vector.queryNodes('{index_name}', $k, $embedding)
-            YIELD node, score
-            """
-            
-            if where_clauses:
-                base_query += "WHERE " + " AND ".join(where_clauses) + "\n"
-                
-            cypher_query = base_query + f"""
-            RETURN 
-                node.risk_id AS risk_id,
-                node.risk_category AS category,
-                node.impact AS impact,
-                node.severity AS severity,
-                score AS similarity
-            ORDER BY score DESC
-            LIMIT $k
-            """
-        else:
-            # Generic query for any other node type
-            base_query = f"""
-            CALL db.index.vector.queryNodes('{index_name}', $k, $embedding)
-            YIELD node, score
-            """
-            
-            if where_clauses:
-                base_query += "WHERE " + " AND ".join(where_clauses) + "\n"
-                
-            cypher_query = base_query + f"""
-            RETURN 
-                node.name AS name,
-                score AS similarity
-            ORDER BY score DESC
-            LIMIT $k
-            """
+        # Prebuilt query per (node type, filtered), no per-call string building
+        cypher_query = self._knowledge_base_query(node_label, bool(filters))
 
         try:
-            results = self.client.execute_query(
+            results = self._execute_recall(
                 cypher_query,
-                {
-                    "k": top_k,
-                    "embedding": query_embedding
-                }
+                {"k": top_k, "filters": self._filter_params(filters)},
+                query_text,
+                query_embedding
             )
 
-            logger.info(f"✓ Found {len(results)} {node_label} entries")
+            logger.info("✓ Found %s %s entries", len(results), node_label)
             return results
 
         except Exception as e:
-            logger.error(f"{node_label} knowledge search failed: {e}")
+            logger.error("%s knowledge search failed: %s", node_label, e)
             return []
 
     def search_department_knowledge_base(
         self,
         query_text: str,
         department: str,
-        top_k: int = 8
+        top_k: int = 8,
+        query_embedding: Optional[np.ndarray] = None
     ) -> List[Dict[str, Any]]:
         """
         Scenario 4: Search department-specific knowledge base
@@ -340,49 +1089,36 @@ class VectorRecallSystem:
             query_text: Query text
             department: Department to search (Tech, Finance, HR, Compliance, Security)
             top_k: Number of results to return
+            query_embedding: Precomputed embedding of query_text (optional)
 
         Returns:
             list: Relevant review comments from the specified department
         """
-        logger.info(f"Searching {department} knowledge base for: {query_text[:50]}...")
+        query_text = self._prepare_query(query_text)
+        if query_text is None:
+            return []
+
+        logger.info("Searching %s knowledge base for: %.50s...", department, query_text)
 
         # Generate embedding for query
-        query_embedding = self.embedding_service.generate_embedding(query_text)
+        query_embedding = self._resolve_embedding(query_text, query_embedding)
 
         # Search review comments from specific department
-        cypher_query = """
-        CALL db.index.vector.queryNodes('review_content_vector', $k * 2, $embedding)
-        YIELD node AS review, score
-        WHERE review.department = $department
-        MATCH (dept:Department)-[:PROVIDES_REVIEW]->(review)
-        MATCH (prd:PRD)-[:HAS_REVIEW]->(review)
-        RETURN review.comment_id AS comment_id,
-               prd.title AS prd_title,
-               review.content AS knowledge,
-               review.recommendation AS recommendation,
-               review.risk_level AS risk_level,
-               review.reviewer_name AS reviewer,
-               dept.dept_name AS department_name,
-               score AS relevance
-        ORDER BY score DESC
-        LIMIT $k
-        """
+        cypher_query = self.DEPARTMENT_KNOWLEDGE_QUERY
 
         try:
-            results = self.client.execute_query(
+            results = self._execute_recall(
                 cypher_query,
-                {
-                    "k": top_k,
-                    "embedding": query_embedding,
-                    "department": department
-                }
+                {"k": top_k, "department": department},
+                query_text,
+                query_embedding
             )
 
-            logger.info(f"✓ Found {len(results)} knowledge entries from {department}")
+            logger.info("✓ Found %s knowledge entries from %s", len(results), department)
             return results
 
         except Exception as e:
-            logger.error(f"Department knowledge search failed: {e}")
+            logger.error("Department knowledge search failed: %s", e)
             return []
 
     def hybrid_search(
@@ -390,7 +1126,9 @@ class VectorRecallSystem:
         query_text: str,
         node_label: str = "PRD",
         filters: Optional[Dict[str, Any]] = None,
-        top_k: int = 10
+        top_k: int = 10,
+        query_embedding: Optional[np.ndarray] = None,
+        boosts: Optional[Dict[str, Dict[Any, float]]] = None
     ) -> List[Dict[str, Any]]:
         """
         Advanced: Hybrid search combining vector similarity and filters for any node type
@@ -400,137 +1138,167 @@ class VectorRecallSystem:
             node_label: Node type to search (default: PRD)
             filters: Additional filters (priority, status, version, etc.)
             top_k: Number of results
+            query_embedding: Precomputed embedding of query_text (optional)
+            boosts: Score multipliers by returned column value, e.g.
+                    {"priority": {"High": 1.2, "Low": 0.8}} (optional).
+                    RERANK_CANDIDATE_FACTOR * top_k candidates are fetched
+                    and reranked by similarity * boost.
 
         Returns:
             list: Search results
         """
-        logger.info(f"Performing hybrid search on {node_label} for: {query_text[:50]}...")
-
-        # Generate embedding
-        query_embedding = self.embedding_service.generate_embedding(query_text)
-
-        # Map node types to their vector indexes
-        index_mapping = {
-            "Ontology": "ontology_name_vector",
-            "PRD": "prd_description_vector",
-            "ReviewComment": "review_content_vector",
-            "RiskAssessment": "risk_impact_vector"
-        }
-
-        index_name = index_mapping.get(node_label, f"{node_label.lower()}_name_vector")
-        node_alias = node_label.lower()[:3]  # Short alias for Cypher query
-
-        # Build dynamic query
-        cypher_query = f"""
-        CALL db.index.vector.queryNodes('{index_name}', $k * 2, $embedding)
-        YIELD node AS {node_alias}, score
-        """
+        query_text = self._prepare_query(query_text)
+        if query_text is None:
+            return []
 
-        # Add filters
-        where_clauses = []
-        if filters:
-            for key, value in filters.items():
-                where_clauses.append(f"{node_alias}.{key} = '{value}'")
+        logger.info("Performing hybrid search on %s for: %.50s...", node_label, query_text)
 
-        if where_clauses:
-            cypher_query += "\nWHERE " + " AND ".join(where_clauses)
+        # Generate embedding
+        query_embedding = self._resolve_embedding(query_text, query_embedding)
 
-        # Add dynamic relationships and return based on node type
-        if node_label == "PRD":
-            cypher_query += f"""
-            OPTIONAL MATCH ({node_alias})-[:HAS_RECOMMENDATION]->(rec:DecisionRecommendation)
-            OPTIONAL MATCH ({node_alias})-[:HAS_RISK]->(risk:RiskAssessment)
-            WITH {node_alias}, score, rec, COUNT(risk) AS risk_count
-            RETURN {node_alias}.prd_id AS prd_id,
-                   {node_alias}.title AS title,
-                   {node_alias}.description AS description,
-                   {node_alias}.priority AS priority,
-                   {node_alias}.status AS status,
-                   score AS similarity,
-                   rec.decision_type AS decision,
-                   risk_count AS num_risks
-            ORDER BY score DESC
-            LIMIT $k
-            """
-        else:
-            # Generic return for other node types
-            cypher_query += f"""
-            RETURN {node_alias}.name AS name,
-                   score AS similarity
-            ORDER BY score DESC
-            LIMIT $k
-            """
+        # Prebuilt query per (node type, filtered); filter values are parameters
+        cypher_query = self._hybrid_query(node_label, bool(filters))
 
         try:
-            results = self.client.execute_query(
+            candidates = top_k * self.RERANK_CANDIDATE_FACTOR if boosts else top_k
+            results = self._execute_recall(
                 cypher_query,
-                {"k": top_k, "embedding": query_embedding}
+                {"k": candidates, "filters": self._filter_params(filters)},
+                query_text,
+                query_embedding
             )
+            if boosts:
+                results = rerank(results, boosts, top_k)
 
-            logger.info(f"✓ Hybrid search returned {len(results)} results")
+            logger.info("✓ Hybrid search returned %s results", len(results))
             return results
 
         except Exception as e:
-            logger.error(f"Hybrid search failed: {e}")
+            logger.error("Hybrid search failed: %s", e)
             return []
 
-    def get_prd_context(self, prd_id: str) -> Dict[str, Any]:
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _prd_context_query(cls, include: FrozenSet[str]) -> str:
         """
-        Get complete context for a PRD including all reviews, risks, and decision
+        Build the get_prd_context query returning the PRD and the included parts
 
         Args:
-            prd_id: PRD identifier
+            include: Names from PRD_CONTEXT_PARTS
 
         Returns:
-            dict: Complete PRD context
+            str: Cypher query taking $prd_id
         """
-        cypher_query = """
-        MATCH (prd:PRD {prd_id: $prd_id})
-        OPTIONAL MATCH (prd)-[:HAS_REVIEW]->(review:ReviewComment)
-        OPTIONAL MATCH (prd)-[:HAS_RISK]->(risk:RiskAssessment)
-        OPTIONAL MATCH (prd)-[:HAS_RECOMMENDATION]->(rec:DecisionRecommendation)
-        RETURN prd,
-               COLLECT(DISTINCT review) AS reviews,
-               COLLECT(DISTINCT risk) AS risks,
-               rec AS recommendation
+        columns = ["prd"] + [
+            expression for name, expression in cls.PRD_CONTEXT_PARTS.items() if name in include
+        ]
+        return_clause = ",\n               ".join(columns)
+        return f"""
+        MATCH (prd:PRD {{prd_id: $prd_id}})
+        RETURN {return_clause}
+        """
+
+    def get_prd_context(self, prd_id: str, include: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Get context for a PRD: the PRD node plus its reviews, risks and decision
+
+        Args:
+            prd_id: PRD identifier
+            include: Parts to fetch, any of "reviews", "risks", "recommendation"
+                     (default: all). Parts left out are not traversed.
+
+        Returns:
+            dict: PRD context
         """
+        include = frozenset(self.PRD_CONTEXT_PARTS if include is None else include)
+        unknown = include - self.PRD_CONTEXT_PARTS.keys()
+        if unknown:
+            raise ValueError(f"Unknown PRD context parts: {', '.join(sorted(unknown))}")
+
+        cypher_query = self._prd_context_query(include)
 
         try:
-            results = self.client.execute_query(cypher_query, {"prd_id": prd_id})
+            results = self.client.execute_query(cypher_query, {"prd_id": prd_id}, mode="read")
 
             if results:
                 return results[0]
             return {}
 
         except Exception as e:
-            logger.error(f"Failed to get PRD context: {e}")
+            logger.error("Failed to get PRD context: %s", e)
             return {}
 
 
+# Row templates of RecallResultFormatter (filled with str.format_map)
+_SIMILAR_PRD_ROW = (
+    "\n\n[{i}] {title}"
+    "\n    PRD ID: {prd_id}"
+    "\n    Similarity: {similarity:.4f}"
+    "\n    Status: {status} | Priority: {priority}"
+)
+_SIMILAR_PRD_DECISION = (
+    "\n    Decision: {decision} (Confidence: {confidence:.2f})"
+    "\n    Reasoning: {reasoning}"
+)
+_SIMILAR_PRD_DESCRIPTION = "\n    Description: {description:.150}..."
+_SUGGESTION_ROW = (
+    "\n  [{i}] {suggestion}"
+    "\n      From: {source_prd} (Similarity: {similarity:.4f})"
+    "\n      Recommendation: {recommendation} | Risk: {risk_level}"
+)
+_RISK_ROW = (
+    "\n\n[Risk {i}] {category} - {severity}"
+    "\n    Source PRD: {source_prd}"
+    "\n    Similarity: {similarity:.4f}"
+    "\n    Probability: {probability:.2f}"
+    "\n    Impact: {impact}"
+    "\n    Mitigation: {mitigation}"
+)
+_ONTOLOGY_ROW = (
+    "\n\n[{i}] {name}"
+    "\n    Similarity: {similarity:.4f}"
+    "\n    Version: {version}"
+    "\n    Node ID: {node_id}"
+)
+_PRD_ROW = (
+    "\n\n[{i}] {title}"
+    "\n    Similarity: {similarity:.4f}"
+    "\n    PRD ID: {prd_id}"
+    "\n    Description: {description:.150}..."
+)
+_DEPARTMENT_KNOWLEDGE_ROW = (
+    "\n\n[{i}] {department_name} - {prd_title}"
+    "\n    Relevance: {relevance:.4f}"
+)
+
+
 class RecallResultFormatter:
     """Format recall results for display"""
 
+    @staticmethod
+    def _header(title: str) -> io.StringIO:
+        """Start an output buffer with a section header"""
+        buf = io.StringIO()
+        buf.write(f"\n{'=' * 80}\n{title}\n{'=' * 80}")
+        return buf
+
     @staticmethod
     def format_similar_prds(results: List[Dict[str, Any]]) -> str:
         """Format similar PRD results"""
         if not results:
             return "No similar PRDs found."
 
-        output = ["\n" + "=" * 80]
-        output.append("SIMILAR PRD RETRIEVAL RESULTS")
-        output.append("=" * 80)
+        buf = RecallResultFormatter._header("SIMILAR PRD RETRIEVAL RESULTS")
+        write = buf.write
 
         for i, result in enumerate(results, 1):
-            output.append(f"\n[{i}] {result['title']}")
-            output.append(f"    PRD ID: {result['prd_id']}")
-            output.append(f"    Similarity: {result['similarity']:.4f}")
-            output.append(f"    Status: {result['status']} | Priority: {result['priority']}")
+            row = {"confidence": 0, "reasoning": "N/A", **result, "i": i}
+            write(_SIMILAR_PRD_ROW.format_map(row))
             if result.get('decision'):
-                output.append(f"    Decision: {result['decision']} (Confidence: {result.get('confidence', 0):.2f})")
-                output.append(f"    Reasoning: {result.get('reasoning', 'N/A')}")
-            output.append(f"    Description: {result['description'][:150]}...")
+                write(_SIMILAR_PRD_DECISION.format_map(row))
+            write(_SIMILAR_PRD_DESCRIPTION.format_map(row))
 
-        return "\n".join(output)
+        return buf.getvalue()
 
     @staticmethod
     def format_review_suggestions(results: List[Dict[str, Any]]) -> str:
@@ -538,26 +1306,20 @@ class RecallResultFormatter:
         if not results:
             return "No review suggestions found."
 
-        output = ["\n" + "=" * 80]
-        output.append("INTELLIGENT REVIEW SUGGESTIONS")
-        output.append("=" * 80)
+        buf = RecallResultFormatter._header("INTELLIGENT REVIEW SUGGESTIONS")
+        write = buf.write
 
         # Group by department
-        by_dept = {}
+        by_dept = defaultdict(list)
         for result in results:
-            dept = result['department']
-            if dept not in by_dept:
-                by_dept[dept] = []
-            by_dept[dept].append(result)
+            by_dept[result['department']].append(result)
 
         for dept, suggestions in by_dept.items():
-            output.append(f"\n【{dept}】")
-            for i, sugg in enumerate(suggestions[:3], 1):  # Top 3 per department
-                output.append(f"  [{i}] {sugg['suggestion']}")
-                output.append(f"      From: {sugg['source_prd']} (Similarity: {sugg['similarity']:.4f})")
-                output.append(f"      Recommendation: {sugg['recommendation']} | Risk: {sugg['risk_level']}")
+            write(f"\n\n【{dept}】")
+            for i, sugg in enumerate(suggestions, 1):  # Already top 3 per department
+                write(_SUGGESTION_ROW.format_map({**sugg, "i": i}))
 
-        return "\n".join(output)
+        return buf.getvalue()
 
     @staticmethod
     def format_risks(results: List[Dict[str, Any]]) -> str:
@@ -565,21 +1327,15 @@ class RecallResultFormatter:
         if not results:
             return "No potential risks identified."
 
-        output = ["\n" + "=" * 80]
-        output.append("POTENTIAL RISK IDENTIFICATION")
-        output.append("=" * 80)
+        buf = RecallResultFormatter._header("POTENTIAL RISK IDENTIFICATION")
+        write = buf.write
 
         for i, risk in enumerate(results, 1):
-            output.append(f"\n[Risk {i}] {risk['category']} - {risk['severity']}")
-            output.append(f"    Source PRD: {risk['source_prd']}")
-            output.append(f"    Similarity: {risk['similarity']:.4f}")
-            output.append(f"    Probability: {risk['probability']:.2f}")
-            output.append(f"    Impact: {risk['impact']}")
-            output.append(f"    Mitigation: {risk['mitigation']}")
+            write(_RISK_ROW.format_map({**risk, "i": i}))
             if risk.get('identified_by'):
-                output.append(f"    Identified by: {risk['identified_by']} Department")
+                write(f"\n    Identified by: {risk['identified_by']} Department")
 
-        return "\n".join(output)
+        return buf.getvalue()
 
     @staticmethod
     def format_knowledge_base(results: List[Dict[str, Any]], node_label: str) -> str:
@@ -587,46 +1343,45 @@ class RecallResultFormatter:
         if not results:
             return f"No {node_label} knowledge found."
 
-        output = ["\n" + "=" * 80]
-        output.append(f"{node_label.upper()} KNOWLEDGE BASE RESULTS")
-        output.append("=" * 80)
+        buf = RecallResultFormatter._header(f"{node_label.upper()} KNOWLEDGE BASE RESULTS")
+        write = buf.write
 
         for i, entry in enumerate(results, 1):
             if node_label == "Ontology":
                 # Format Ontology results
-                output.append(f"\n[{i}] {entry['name']}")
-                output.append(f"    Similarity: {entry['similarity']:.4f}")
-                output.append(f"    Version: {entry.get('version', 'N/A')}")
-                output.append(f"    Node ID: {entry['node_id']}")
+                write(_ONTOLOGY_ROW.format_map({"version": "N/A", **entry, "i": i}))
             elif node_label == "PRD":
                 # Format PRD results
-                output.append(f"\n[{i}] {entry['title']}")
-                output.append(f"    Similarity: {entry['similarity']:.4f}")
-                output.append(f"    PRD ID: {entry['prd_id']}")
-                output.append(f"    Description: {entry['description'][:150]}...")
+                write(_PRD_ROW.format_map({**entry, "i": i}))
             elif node_label in ["ReviewComment", "RiskAssessment"]:
                 # Format department knowledge results
-                output.append(f"\n[{i}] {entry.get('department_name', '')} - {entry.get('prd_title', '')}")
-                output.append(f"    Relevance: {entry.get('relevance', entry.get('similarity', 0)):.4f}")
+                write(_DEPARTMENT_KNOWLEDGE_ROW.format_map({
+                    "i": i,
+                    "department_name": entry.get('department_name', ''),
+                    "prd_title": entry.get('prd_title', ''),
+                    "relevance": entry.get('relevance', entry.get('similarity', 0))
+                }))
                 if entry.get('reviewer'):
-                    output.append(f"    Reviewer: {entry['reviewer']}")
+                    write(f"\n    Reviewer: {entry['reviewer']}")
                 if entry.get('knowledge'):
-                    output.append(f"    Knowledge: {entry['knowledge']}")
+                    write(f"\n    Knowledge: {entry['knowledge']}")
                 if entry.get('recommendation'):
                     risk_level = entry.get('risk_level', 'N/A')
-                    output.append(f"    Recommendation: {entry['recommendation']} | Risk: {risk_level}")
+                    write(f"\n    Recommendation: {entry['recommendation']} | Risk: {risk_level}")
             else:
                 # Generic format for other node types
-                output.append(f"\n[{i}] {entry.get('name', 'N/A')}")
-                output.append(f"    Similarity: {entry.get('similarity', 0):.4f}")
+                write(f"\n\n[{i}] {entry.get('name', 'N/A')}"
+                      f"\n    Similarity: {entry.get('similarity', 0):.4f}")
                 for key, value in entry.items():
                     if key not in ['name', 'similarity']:
-                        output.append(f"    {key.capitalize()}: {value}")
+                        write(f"\n    {key.capitalize()}: {value}")
 
-        return "\n".join(output)
+        return buf.getvalue()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     print("Testing Vector Recall System...")
     print("=" * 50)
 
@@ -667,6 +1422,18 @@ if __name__ == "__main__":
         )
         print(formatter.format_knowledge_base(knowledge, "Tech"))
 
+        # Test 5: All scenarios concurrently
+        print("\n[Test 5] Running all scenarios concurrently...")
+
+        async def run_all():
+            try:
+                return await recall_system.run_all_scenarios_async(test_query, department="Tech", top_k=3)
+            finally:
+                await neo4j_client.close_async()
+
+        all_results = asyncio.run(run_all())
+        print({name: len(rows) for name, rows in all_results.items()})
+
         neo4j_client.close()
 
     except Exception as e:
@@ -2,64 +2,83 @@
 Configuration management for Neo4j PRD Review System
 """
 import os
+from dataclasses import dataclass
 from dotenv import load_dotenv
 from pathlib import Path
+from typing import Optional
 
-# Load environment variables from .env file
-env_path = Path(__file__).parent.parent.parent / '.env'
-load_dotenv(dotenv_path=env_path)
+# Load environment variables from .env file, once per process tree: child
+# processes inherit os.environ (including the flag) and skip re-parsing it
+if not os.environ.get('_DOTENV_LOADED'):
+    env_path = Path(__file__).resolve().parents[2] / '.env'
+    load_dotenv(dotenv_path=env_path)
+    os.environ['_DOTENV_LOADED'] = '1'
 
 
+@dataclass(frozen=True)
 class Config:
-    """Configuration class for the application"""
-
-    # Get Neo4j environment selection from .env file
-    NEO4J_ENV = os.getenv('NEO4J_ENV', 'local').lower()
-
-    # Load configuration based on environment
-    if NEO4J_ENV == 'production':
-        # Production Neo4j Configuration
-        NEO4J_URI = os.getenv('NEO4J_PROD_URI', 'http://10.160.4.92:7474')
-        NEO4J_USER = os.getenv('NEO4J_PROD_USER', 'neo4j')
-        NEO4J_PASSWORD = os.getenv('NEO4J_PROD_PASSWORD', '818iai818!')
-        NEO4J_DATABASE = os.getenv('NEO4J_PROD_DATABASE', '')  # Default database
-    else:
-        # Local Neo4j Configuration (default)
-        NEO4J_URI = os.getenv('NEO4J_LOCAL_URI', 'neo4j://127.0.0.1:7687')
-        NEO4J_USER = os.getenv('NEO4J_LOCAL_USER', 'neo4j')
-        NEO4J_PASSWORD = os.getenv('NEO4J_LOCAL_PASSWORD', '818iai818!')
-        NEO4J_DATABASE = os.getenv('NEO4J_LOCAL_DATABASE', 'deepworld')  # Local database name
-
-    # Convert HTTP URL to Bolt protocol if needed
-    if NEO4J_URI.startswith('http://'):
-        NEO4J_BOLT_URI = NEO4J_URI.replace('http://', 'bolt://').replace(':7474', ':7687')
-    else:
-        NEO4J_BOLT_URI = NEO4J_URI
+    """Configuration for the application, built once from the environment (see CONFIG)"""
+
+    # Neo4j Configuration
+    neo4j_env: str
+    neo4j_uri: str
+    neo4j_user: str
+    neo4j_password: str
+    neo4j_database: str
+    neo4j_bolt_uri: str
+    # Connections per driver (sync and async drivers each have a pool)
+    neo4j_max_connection_pool_size: int
+    # Seconds to wait for a pooled connection before failing
+    neo4j_connection_acquisition_timeout: float
+    # Pooled connections the shared client opens at startup (0 = connect lazily)
+    neo4j_warmup_connections: int
+    # Write embeddings as float32 VECTOR values instead of LIST<FLOAT> (Neo4j 2025.10+)
+    neo4j_native_vectors: bool
 
     # OpenRouter Configuration
-    OPENROUTER_API_KEY = os.getenv('OPENROUTER_API_KEY')
-    OPENROUTER_BASE_URL = os.getenv('OPENROUTER_BASE_URL', 'https://openrouter.ai/api/v1')
+    openrouter_api_key: Optional[str]
+    openrouter_base_url: str
 
     # Embedding Model Configuration
-    EMBEDDING_MODEL = 'qwen/qwen3-embedding-8b'
-    EMBEDDING_DIMENSION = 4096
+    embedding_model: str
+    embedding_dimension: int
+    # Client-side cap on embedding API requests per minute (0 = unlimited)
+    embedding_rate_per_minute: float
 
     # Vector Index Configuration
-    VECTOR_SIMILARITY_FUNCTION = 'cosine'
+    vector_similarity_function: str
+    # Serve similar-PRD searches from an in-memory copy of the PRD vectors
+    prd_shadow_index_enabled: bool
+    # Seconds between reloads of the in-memory PRD vectors
+    prd_shadow_index_refresh: float
+    # Server-side int8 quantization of vector indexes (Neo4j 5.23+)
+    vector_quantization_enabled: bool
+
+    # Cache Configuration (size 0 disables a cache)
+    embedding_cache_size: int
+    embedding_cache_ttl: int
+    recall_cache_size: int
+    recall_cache_ttl: int
+    # Cosine similarity at which a near-duplicate query reuses cached recall
+    # results (None = exact query matches only)
+    semantic_cache_threshold: Optional[float]
+    # Store cached query embeddings as int8 (4x less memory per entry)
+    embedding_cache_int8: bool
+    # SQLite file that persists query embeddings across restarts (None = memory only)
+    embedding_cache_path: Optional[Path]
 
     # Data Configuration
-    DATA_DIR = Path(__file__).parent.parent / 'data'
-    PRD_SCENARIOS_FILE = DATA_DIR / 'prd_scenarios.json'
+    data_dir: Path
+    prd_scenarios_file: Path
 
-    @classmethod
-    def validate(cls):
+    def validate(self):
         """Validate that all required configurations are set"""
         errors = []
 
-        if not cls.OPENROUTER_API_KEY:
+        if not self.openrouter_api_key:
             errors.append("OPENROUTER_API_KEY is not set in .env file")
 
-        if not cls.NEO4J_PASSWORD:
+        if not self.neo4j_password:
             errors.append("NEO4J_PASSWORD is not set")
 
         if errors:
@@ -67,27 +86,89 @@ class Config:
 
         return True
 
-    @classmethod
-    def display(cls):
+    def display(self):
         """Display current configuration (masked sensitive data)"""
         print("=== Configuration ===")
-        print(f"Neo4j Environment: {cls.NEO4J_ENV}")
-        print(f"Neo4j URI: {cls.NEO4J_BOLT_URI}")
-        print(f"Neo4j User: {cls.NEO4J_USER}")
-        print(f"Neo4j Password: {'*' * len(cls.NEO4J_PASSWORD)}")
-        print(f"Neo4j Database: {cls.NEO4J_DATABASE if cls.NEO4J_DATABASE else 'default'}")
-        print(f"OpenRouter API Key: {cls.OPENROUTER_API_KEY[:20]}...{cls.OPENROUTER_API_KEY[-10:] if cls.OPENROUTER_API_KEY else 'NOT SET'}")
-        print(f"Embedding Model: {cls.EMBEDDING_MODEL}")
-        print(f"Embedding Dimension: {cls.EMBEDDING_DIMENSION}")
-        print(f"Data Directory: {cls.DATA_DIR}")
+        print(f"Neo4j Environment: {self.neo4j_env}")
+        print(f"Neo4j URI: {self.neo4j_bolt_uri}")
+        print(f"Neo4j User: {self.neo4j_user}")
+        print(f"Neo4j Password: {'*' * len(self.neo4j_password)}")
+        print(f"Neo4j Database: {self.neo4j_database if self.neo4j_database else 'default'}")
+        print(f"OpenRouter API Key: {self.openrouter_api_key[:20]}...{self.openrouter_api_key[-10:] if self.openrouter_api_key else 'NOT SET'}")
+        print(f"Embedding Model: {self.embedding_model}")
+        print(f"Embedding Dimension: {self.embedding_dimension}")
+        print(f"Data Directory: {self.data_dir}")
         print("=" * 40)
 
 
+def _build_config() -> Config:
+    """Read the environment once and build the application config"""
+    # Get Neo4j environment selection from .env file
+    neo4j_env = os.getenv('NEO4J_ENV', 'local').lower()
+
+    # Load configuration based on environment
+    if neo4j_env == 'production':
+        # Production Neo4j Configuration
+        neo4j_uri = os.getenv('NEO4J_PROD_URI', 'http://10.160.4.92:7474')
+        neo4j_user = os.getenv('NEO4J_PROD_USER', 'neo4j')
+        neo4j_password = os.getenv('NEO4J_PROD_PASSWORD', '818iai818!')
+        neo4j_database = os.getenv('NEO4J_PROD_DATABASE', '')  # Default database
+    else:
+        # Local Neo4j Configuration (default)
+        neo4j_uri = os.getenv('NEO4J_LOCAL_URI', 'neo4j://127.0.0.1:7687')
+        neo4j_user = os.getenv('NEO4J_LOCAL_USER', 'neo4j')
+        neo4j_password = os.getenv('NEO4J_LOCAL_PASSWORD', '818iai818!')
+        neo4j_database = os.getenv('NEO4J_LOCAL_DATABASE', 'deepworld')  # Local database name
+
+    # Convert HTTP URL to Bolt protocol if needed
+    if neo4j_uri.startswith('http://'):
+        neo4j_bolt_uri = neo4j_uri.replace('http://', 'bolt://').replace(':7474', ':7687')
+    else:
+        neo4j_bolt_uri = neo4j_uri
+
+    data_dir = Path(__file__).resolve().parents[2] / 'data'
+
+    return Config(
+        neo4j_env=neo4j_env,
+        neo4j_uri=neo4j_uri,
+        neo4j_user=neo4j_user,
+        neo4j_password=neo4j_password,
+        neo4j_database=neo4j_database,
+        neo4j_bolt_uri=neo4j_bolt_uri,
+        neo4j_max_connection_pool_size=int(os.getenv('NEO4J_MAX_CONNECTION_POOL_SIZE', '100')),
+        neo4j_connection_acquisition_timeout=float(os.getenv('NEO4J_CONNECTION_ACQUISITION_TIMEOUT', '60')),
+        neo4j_warmup_connections=int(os.getenv('NEO4J_WARMUP_CONNECTIONS', '0')),
+        neo4j_native_vectors=os.getenv('NEO4J_NATIVE_VECTORS', 'false').lower() == 'true',
+        openrouter_api_key=os.getenv('OPENROUTER_API_KEY'),
+        openrouter_base_url=os.getenv('OPENROUTER_BASE_URL', 'https://openrouter.ai/api/v1'),
+        embedding_model='qwen/qwen3-embedding-8b',
+        embedding_dimension=4096,
+        embedding_rate_per_minute=float(os.getenv('EMBEDDING_RATE_PER_MINUTE', '0')),
+        vector_similarity_function='cosine',
+        prd_shadow_index_enabled=os.getenv('PRD_SHADOW_INDEX', 'false').lower() == 'true',
+        prd_shadow_index_refresh=float(os.getenv('PRD_SHADOW_INDEX_REFRESH', '300')),
+        vector_quantization_enabled=os.getenv('VECTOR_QUANTIZATION_ENABLED', 'false').lower() == 'true',
+        embedding_cache_size=int(os.getenv('EMBEDDING_CACHE_SIZE', '10000')),
+        embedding_cache_ttl=int(os.getenv('EMBEDDING_CACHE_TTL', '3600')),
+        recall_cache_size=int(os.getenv('RECALL_CACHE_SIZE', '1000')),
+        recall_cache_ttl=int(os.getenv('RECALL_CACHE_TTL', '300')),
+        semantic_cache_threshold=float(os.environ['SEMANTIC_CACHE_THRESHOLD']) if os.getenv('SEMANTIC_CACHE_THRESHOLD') else None,
+        embedding_cache_int8=os.getenv('EMBEDDING_CACHE_INT8', 'false').lower() == 'true',
+        embedding_cache_path=Path(os.environ['EMBEDDING_CACHE_PATH']) if os.getenv('EMBEDDING_CACHE_PATH') else None,
+        data_dir=data_dir,
+        prd_scenarios_file=data_dir / 'prd_scenarios.json'
+    )
+
+
+# Application config, read from the environment once at import
+CONFIG = _build_config()
+
+
 if __name__ == "__main__":
     # Test configuration
     try:
-        Config.validate()
-        Config.display()
+        CONFIG.validate()
+        CONFIG.display()
         print("\nConfiguration is valid!")
     except ValueError as e:
         print(f"\nConfiguration validation failed:\n{e}")
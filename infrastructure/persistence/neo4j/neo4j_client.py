@@ -1,20 +1,143 @@
 """
 Neo4j Database Client for PRD Review System
 """
-from neo4j import GraphDatabase
-from typing import List, Dict, Any, Optional
+from neo4j import (
+    READ_ACCESS, WRITE_ACCESS, AsyncDriver, AsyncGraphDatabase, Driver, GraphDatabase, RoutingControl, Session
+)
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+import asyncio
+import atexit
 import logging
+import threading
 
-from infrastructure.config.config import Config
+import numpy as np
+
+from infrastructure.config.config import CONFIG
+
+try:
+    from neo4j.vector import Vector
+except ImportError:  # neo4j driver < 6.0
+    Vector = None
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+if CONFIG.neo4j_native_vectors and Vector is None:
+    logger.warning("⚠ NEO4J_NATIVE_VECTORS needs neo4j driver 6.0+; writing embeddings as lists")
+
+# Sync drivers shared by every Neo4jClient, keyed by (uri, user, password)
+_drivers: Dict[Tuple[str, str, str], Driver] = {}
+_drivers_lock = threading.Lock()
+
+
+def _get_driver(uri: str, user: str, password: str) -> Driver:
+    """
+    Get the process-wide driver for a server and user, creating it on first use
+
+    Drivers are thread-safe and own the connection pool, so clients share
+    one instead of paying the handshake and a new pool each. Drivers are
+    closed at interpreter exit.
+    """
+    key = (uri, user, password)
+    with _drivers_lock:
+        driver = _drivers.get(key)
+        if driver is None:
+            if not _drivers:
+                atexit.register(_close_drivers)
+            driver = GraphDatabase.driver(
+                uri,
+                auth=(user, password),
+                max_connection_pool_size=CONFIG.neo4j_max_connection_pool_size,
+                connection_acquisition_timeout=CONFIG.neo4j_connection_acquisition_timeout
+            )
+            _drivers[key] = driver
+            logger.info("Connected to Neo4j at %s", uri)
+        return driver
+
+
+def _close_drivers():
+    """Close every shared driver"""
+    with _drivers_lock:
+        for driver in _drivers.values():
+            driver.close()
+        _drivers.clear()
+
+
+def embedding_param(embedding: np.ndarray) -> Any:
+    """
+    Convert an embedding to a property value for a write
+
+    With NEO4J_NATIVE_VECTORS the embedding is sent and stored as a float32
+    VECTOR (4 bytes per dimension); otherwise as a LIST<FLOAT>, which
+    PackStream encodes as 9 bytes per dimension.
+
+    Args:
+        embedding: Embedding vector
+
+    Returns:
+        Vector or list: Value to pass as a query parameter
+    """
+    if CONFIG.neo4j_native_vectors and Vector is not None:
+        return Vector(np.asarray(embedding, dtype=np.float32))
+    return np.asarray(embedding).tolist()
+
+
+def _records_to_dicts(result) -> List[Dict[str, Any]]:
+    """
+    Convert a result to dictionaries
+
+    Records are tuples sharing the result's keys, so the keys are read once
+    and zipped with each record instead of looked up field by field.
+    """
+    keys = tuple(result.keys())
+    return [dict(zip(keys, record)) for record in result]
+
+
+async def _records_to_dicts_async(result) -> List[Dict[str, Any]]:
+    """Async variant of _records_to_dicts"""
+    keys = tuple(await result.keys())
+    return [dict(zip(keys, record)) async for record in result]
+
 
 class Neo4jClient:
     """Neo4j database client wrapper"""
 
-    def __init__(self, uri: str = None, user: str = None, password: str = None):
+    # Process-wide client returned by shared()
+    _shared: Optional["Neo4jClient"] = None
+    _shared_lock = threading.Lock()
+
+    # Fixed query texts: the server caches one plan per distinct text, so
+    # runtime values must always be passed as parameters, never interpolated
+    VERIFY_QUERY = "RETURN 1 AS num"
+
+    DATABASE_INFO_QUERY = """
+        CALL dbms.components() YIELD name, versions, edition
+        RETURN name, versions[0] AS version, edition
+        """
+
+    CLEAR_DATABASE_QUERY = """
+        MATCH (n)
+        CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF $chunk_size ROWS
+        """
+
+    CONSTRAINTS = (
+        "CREATE CONSTRAINT prd_id_unique IF NOT EXISTS FOR (p:PRD) REQUIRE p.prd_id IS UNIQUE",
+        "CREATE CONSTRAINT comment_id_unique IF NOT EXISTS FOR (r:ReviewComment) REQUIRE r.comment_id IS UNIQUE",
+        "CREATE CONSTRAINT dept_id_unique IF NOT EXISTS FOR (d:Department) REQUIRE d.dept_id IS UNIQUE",
+        "CREATE CONSTRAINT risk_id_unique IF NOT EXISTS FOR (r:RiskAssessment) REQUIRE r.risk_id IS UNIQUE",
+        "CREATE CONSTRAINT recommendation_id_unique IF NOT EXISTS FOR (r:DecisionRecommendation) REQUIRE r.recommendation_id IS UNIQUE"
+    )
+
+    VECTOR_SUPPORT_QUERY = """
+        SHOW INDEXES
+        WHERE type = 'VECTOR'
+        """
+
+    NODE_COUNT_QUERY = "MATCH (n) RETURN count(n) AS count"
+
+    RELATIONSHIP_COUNT_QUERY = "MATCH ()-[r]->() RETURN count(r) AS count"
+
+    def __init__(self, uri: str = None, user: str = None, password: str = None, warmup: int = 0):
         """
         Initialize Neo4j client
 
@@ -22,26 +145,169 @@ class Neo4jClient:
             uri: Neo4j connection URI (bolt://)
             user: Database username
             password: Database password
+            warmup: Number of pooled connections to open up front (see warmup);
+                    0 leaves the driver lazy
         """
-        self.uri = uri or Config.NEO4J_BOLT_URI
-        self.user = user or Config.NEO4J_USER
-        self.password = password or Config.NEO4J_PASSWORD
+        self.uri = uri or CONFIG.neo4j_bolt_uri
+        self.user = user or CONFIG.neo4j_user
+        self.password = password or CONFIG.neo4j_password
 
         try:
-            self.driver = GraphDatabase.driver(
-                self.uri,
-                auth=(self.user, self.password)
-            )
-            logger.info(f"Connected to Neo4j at {self.uri}")
+            self.driver = _get_driver(self.uri, self.user, self.password)
         except Exception as e:
-            logger.error(f"Failed to connect to Neo4j: {e}")
+            logger.error("Failed to connect to Neo4j: %s", e)
             raise
 
+        # Created on first async query (bound to the event loop that uses it)
+        self._async_driver: Optional[AsyncDriver] = None
+
+        # One reusable session per thread for the helper methods (see _session)
+        self._local = threading.local()
+        self._sessions: List[Session] = []
+        self._sessions_lock = threading.Lock()
+
+        if warmup > 0:
+            self.warmup(warmup)
+
+    @property
+    def async_driver(self) -> AsyncDriver:
+        """Async driver sharing this client's URI and credentials"""
+        if self._async_driver is None:
+            self._async_driver = AsyncGraphDatabase.driver(
+                self.uri,
+                auth=(self.user, self.password),
+                max_connection_pool_size=CONFIG.neo4j_max_connection_pool_size,
+                connection_acquisition_timeout=CONFIG.neo4j_connection_acquisition_timeout
+            )
+        return self._async_driver
+
+    @classmethod
+    def shared(cls) -> "Neo4jClient":
+        """
+        Get the process-wide client, creating it on first use
+
+        Reuses one client (its cached sessions and async driver) across
+        callers; the client is closed at interpreter exit, so callers must
+        not close it themselves.
+
+        Returns:
+            Neo4jClient: Shared client
+        """
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    client = cls(warmup=CONFIG.neo4j_warmup_connections)
+                    atexit.register(client.close)
+                    cls._shared = client
+        return cls._shared
+
+    def _session(self) -> Session:
+        """
+        Get the calling thread's cached session, opening it on first use
+
+        Sessions are not thread-safe, so each thread keeps its own and reuses
+        it across calls instead of creating and tearing one down per query.
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None or session.closed():
+            new_session = self.driver.session()
+            with self._sessions_lock:
+                if session is not None:
+                    self._sessions.remove(session)
+                self._sessions.append(new_session)
+            self._local.session = session = new_session
+        return session
+
     def close(self):
-        """Close the database connection"""
-        if self.driver:
-            self.driver.close()
-            logger.info("Neo4j connection closed")
+        """
+        Close this client's sessions
+
+        The sync driver is shared with other clients and stays open until
+        interpreter exit (see _get_driver).
+        """
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+        logger.info("Neo4j client closed")
+
+    async def close_async(self):
+        """Close the async driver, if it was created"""
+        if self._async_driver is not None:
+            await self._async_driver.close()
+            self._async_driver = None
+
+    def warmup(self, connections: int = 1):
+        """
+        Open pooled connections now instead of on the first queries
+
+        Drivers connect lazily, so without this the first queries pay the
+        TCP, TLS and auth handshakes. Each connection is held by an open
+        transaction until all are established, so the pool ends up with
+        that many distinct connections.
+
+        Args:
+            connections: Number of connections to open (capped at the pool size)
+
+        Raises:
+            Exception: If the server cannot be reached
+        """
+        self.driver.verify_connectivity()
+        connections = min(connections, CONFIG.neo4j_max_connection_pool_size)
+        if connections <= 1:
+            return
+
+        def open_connection(_):
+            session = self.driver.session(default_access_mode=READ_ACCESS)
+            try:
+                tx = session.begin_transaction()
+                tx.run(self.VERIFY_QUERY).consume()
+            except Exception:
+                session.close()
+                raise
+            return session, tx
+
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            futures = [executor.submit(open_connection, i) for i in range(connections)]
+        # Every worker has finished: release the connections back to the pool
+        errors = [future.exception() for future in futures if future.exception()]
+        for future in futures:
+            if not future.exception():
+                session, tx = future.result()
+                tx.close()
+                session.close()
+        if errors:
+            raise errors[0]
+        logger.info("✓ Warmed up %d Neo4j connections", connections)
+
+    async def warmup_async(self, connections: int = 1):
+        """Async variant of warmup, for the async driver's pool"""
+        await self.async_driver.verify_connectivity()
+        connections = min(connections, CONFIG.neo4j_max_connection_pool_size)
+        if connections <= 1:
+            return
+
+        async def open_connection():
+            session = self.async_driver.session(default_access_mode=READ_ACCESS)
+            try:
+                tx = await session.begin_transaction()
+                await (await tx.run(self.VERIFY_QUERY)).consume()
+            except Exception:
+                await session.close()
+                raise
+            return session, tx
+
+        opened = await asyncio.gather(*(open_connection() for _ in range(connections)),
+                                      return_exceptions=True)
+        for item in opened:
+            if not isinstance(item, BaseException):
+                session, tx = item
+                await tx.close()
+                await session.close()
+        for item in opened:
+            if isinstance(item, BaseException):
+                raise item
+        logger.info("✓ Warmed up %d async Neo4j connections", connections)
 
     def __enter__(self):
         """Context manager entry"""
@@ -59,15 +325,13 @@ class Neo4jClient:
             bool: True if connection is successful
         """
         try:
-            with self.driver.session() as session:
-                result = session.run("RETURN 1 AS num")
-                record = result.single()
-                if record and record["num"] == 1:
-                    logger.info("Neo4j connection verified successfully")
-                    return True
+            record = self._session().run(self.VERIFY_QUERY).single()
+            if record and record["num"] == 1:
+                logger.info("Neo4j connection verified successfully")
+                return True
             return False
         except Exception as e:
-            logger.error(f"Connection verification failed: {e}")
+            logger.error("Connection verification failed: %s", e)
             return False
 
     def get_database_info(self) -> Dict[str, Any]:
@@ -77,60 +341,148 @@ class Neo4jClient:
         Returns:
             dict: Database version and edition information
         """
-        query = """
-        CALL dbms.components() YIELD name, versions, edition
-        RETURN name, versions[0] AS version, edition
-        """
         try:
-            with self.driver.session() as session:
-                result = session.run(query)
-                record = result.single()
-                if record:
-                    info = {
-                        "name": record["name"],
-                        "version": record["version"],
-                        "edition": record["edition"]
-                    }
-                    logger.info(f"Database Info: {info}")
-                    return info
-                return {}
+            record = self._session().run(self.DATABASE_INFO_QUERY).single()
+            if record:
+                info = {
+                    "name": record["name"],
+                    "version": record["version"],
+                    "edition": record["edition"]
+                }
+                logger.info("Database Info: %s", info)
+                return info
+            return {}
         except Exception as e:
-            logger.error(f"Failed to get database info: {e}")
+            logger.error("Failed to get database info: %s", e)
             return {}
 
-    def clear_database(self):
-        """Clear all nodes and relationships (use with caution!)"""
-        query = """
-        MATCH (n)
-        DETACH DELETE n
+    def clear_database(self, chunk_size: int = 10000):
+        """
+        Clear all nodes and relationships (use with caution!)
+
+        Nodes are deleted in batches of chunk_size, each committed in its own
+        inner transaction, so memory use stays bounded on large databases.
+        CALL { ... } IN TRANSACTIONS requires an auto-commit query.
+
+        Args:
+            chunk_size: Number of nodes deleted per transaction
         """
         try:
-            with self.driver.session() as session:
-                session.run(query)
-                logger.info("Database cleared successfully")
+            self._session().run(self.CLEAR_DATABASE_QUERY, {"chunk_size": chunk_size}).consume()
+            logger.info("Database cleared successfully")
         except Exception as e:
-            logger.error(f"Failed to clear database: {e}")
+            logger.error("Failed to clear database: %s", e)
             raise
 
-    def execute_query(self, query: str, parameters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    def execute_query(self, query: str, parameters: Dict[str, Any] = None,
+                      mode: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Execute a Cypher query
 
         Args:
             query: Cypher query string
             parameters: Query parameters
+            mode: 'read' routes the query to readers; None routes it to the writer
 
         Returns:
             list: Query results as list of dictionaries
         """
+        # driver.execute_query pipelines BEGIN and RUN in one round-trip and
+        # retries the managed transaction on transient errors
+        routing = RoutingControl.READ if mode == 'read' else RoutingControl.WRITE
         try:
-            with self.driver.session() as session:
+            return self.driver.execute_query(
+                query, parameters or {},
+                routing_=routing,
+                result_transformer_=_records_to_dicts
+            )
+        except Exception as e:
+            logger.error("Query execution failed: %s", e)
+            logger.error("Query: %s", query)
+            # Parameters can hold embeddings: name them, dump values at DEBUG only
+            logger.error("Parameters: %s", sorted(parameters or {}))
+            logger.debug("Parameter values: %r", parameters)
+            raise
+
+    def stream_query(self, query: str, parameters: Dict[str, Any] = None,
+                     mode: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a Cypher query and yield records one at a time
+
+        Records are pulled from the server as the caller iterates, so large
+        result sets are never materialized as a list. The session stays open
+        until the iterator is exhausted or closed; use execute_query when the
+        full list is needed.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            mode: 'read' opens a session routed to readers; None routes it to the writer
+
+        Yields:
+            dict: One record per iteration
+        """
+        access_mode = READ_ACCESS if mode == 'read' else WRITE_ACCESS
+        try:
+            with self.driver.session(default_access_mode=access_mode) as session:
                 result = session.run(query, parameters or {})
-                return [dict(record) for record in result]
+                keys = tuple(result.keys())
+                for record in result:
+                    yield dict(zip(keys, record))
+        except Exception as e:
+            logger.error("Query streaming failed: %s", e)
+            logger.error("Query: %s", query)
+            raise
+
+    async def execute_query_async(self, query: str, parameters: Dict[str, Any] = None,
+                                  mode: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Execute a Cypher query on the async driver
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            mode: 'read' routes the query to readers; None routes it to the writer
+
+        Returns:
+            list: Query results as list of dictionaries
+        """
+        routing = RoutingControl.READ if mode == 'read' else RoutingControl.WRITE
+        try:
+            return await self.async_driver.execute_query(
+                query, parameters or {},
+                routing_=routing,
+                result_transformer_=_records_to_dicts_async
+            )
+        except Exception as e:
+            logger.error("Query execution failed: %s", e)
+            logger.error("Query: %s", query)
+            # Parameters can hold embeddings: name them, dump values at DEBUG only
+            logger.error("Parameters: %s", sorted(parameters or {}))
+            logger.debug("Parameter values: %r", parameters)
+            raise
+
+    def execute_query_df(self, query: str, parameters: Dict[str, Any] = None):
+        """
+        Execute a read query and return the result as a pandas DataFrame
+
+        Requires the optional pandas dependency.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+
+        Returns:
+            pandas.DataFrame: One column per returned field
+        """
+        def read_tx(tx, query, params):
+            return tx.run(query, params).to_df()
+
+        try:
+            return self._session().execute_read(read_tx, query, parameters or {})
         except Exception as e:
-            logger.error(f"Query execution failed: {e}")
-            logger.error(f"Query: {query}")
-            logger.error(f"Parameters: {parameters}")
+            logger.error("Query execution failed: %s", e)
+            logger.error("Query: %s", query)
             raise
 
     def execute_write(self, query: str, parameters: Dict[str, Any] = None) -> Any:
@@ -142,38 +494,111 @@ class Neo4jClient:
             parameters: Query parameters
 
         Returns:
-            Query execution result
+            list: Records returned by the query as dictionaries
+        """
+        try:
+            return self.driver.execute_query(
+                query, parameters or {},
+                routing_=RoutingControl.WRITE,
+                result_transformer_=_records_to_dicts
+            )
+        except Exception as e:
+            logger.error("Write transaction failed: %s", e)
+            logger.error("Query: %s", query)
+            raise
+
+    async def execute_write_async(self, query: str, parameters: Dict[str, Any] = None) -> Any:
         """
-        def write_tx(tx, query, params):
-            result = tx.run(query, params)
-            return result
+        Execute a write transaction on the async driver
 
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+
+        Returns:
+            list: Records returned by the query as dictionaries
+        """
         try:
-            with self.driver.session() as session:
-                result = session.execute_write(write_tx, query, parameters or {})
-                return result
+            return await self.async_driver.execute_query(
+                query, parameters or {},
+                routing_=RoutingControl.WRITE,
+                result_transformer_=_records_to_dicts_async
+            )
         except Exception as e:
-            logger.error(f"Write transaction failed: {e}")
-            logger.error(f"Query: {query}")
+            logger.error("Write transaction failed: %s", e)
+            logger.error("Query: %s", query)
             raise
 
-    def create_constraints(self):
-        """Create database constraints for data integrity"""
-        constraints = [
-            "CREATE CONSTRAINT prd_id_unique IF NOT EXISTS FOR (p:PRD) REQUIRE p.prd_id IS UNIQUE",
-            "CREATE CONSTRAINT comment_id_unique IF NOT EXISTS FOR (r:ReviewComment) REQUIRE r.comment_id IS UNIQUE",
-            "CREATE CONSTRAINT dept_id_unique IF NOT EXISTS FOR (d:Department) REQUIRE d.dept_id IS UNIQUE",
-            "CREATE CONSTRAINT risk_id_unique IF NOT EXISTS FOR (r:RiskAssessment) REQUIRE r.risk_id IS UNIQUE",
-            "CREATE CONSTRAINT recommendation_id_unique IF NOT EXISTS FOR (r:DecisionRecommendation) REQUIRE r.recommendation_id IS UNIQUE"
-        ]
-
-        for constraint in constraints:
+    def execute_write_many(self, query: str, rows: List[Dict[str, Any]],
+                           chunk_size: int = 1000) -> List[Dict[str, Any]]:
+        """
+        Execute a write query for many rows, one transaction per chunk
+
+        The query receives each chunk as ``$rows`` and must unwind it, e.g.::
+
+            UNWIND $rows AS row
+            MERGE (p:PRD {prd_id: row.prd_id})
+            SET p += row.props
+
+        so chunk_size rows share one commit instead of paying one each.
+
+        Args:
+            query: Cypher query reading rows from ``UNWIND $rows AS row``
+            rows: Parameter maps, one per row
+            chunk_size: Maximum number of rows per transaction
+
+        Returns:
+            list: Records returned by every chunk, in order
+        """
+        def write_tx(tx, query, chunk):
+            return _records_to_dicts(tx.run(query, {"rows": chunk}))
+
+        records = []
+        session = self._session()
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
             try:
-                self.execute_write(constraint)
-                logger.info(f"Constraint created: {constraint[:50]}...")
+                records.extend(session.execute_write(write_tx, query, chunk))
             except Exception as e:
-                # Constraint might already exist
-                logger.warning(f"Constraint creation skipped: {e}")
+                logger.error("Write transaction failed (rows %s-%s): %s", start, start + len(chunk) - 1, e)
+                logger.error("Query: %s", query)
+                raise
+        return records
+
+    def execute_write_batches(self, statements: List[Tuple[str, Dict[str, Any]]]) -> List[List[Dict[str, Any]]]:
+        """
+        Execute several statements in one managed write transaction
+
+        The driver retries the whole transaction on transient errors
+        (e.g. deadlocks), so either every statement is committed or none is.
+
+        Args:
+            statements: (query, parameters) pairs, run in order
+
+        Returns:
+            list: Records returned by each statement, aligned with statements
+        """
+        def write_tx(tx, statements):
+            return [
+                _records_to_dicts(tx.run(query, params or {}))
+                for query, params in statements
+            ]
+
+        try:
+            return self._session().execute_write(write_tx, statements)
+        except Exception as e:
+            logger.error("Write transaction failed (%s statements): %s", len(statements), e)
+            raise
+
+    def create_constraints(self):
+        """Create database constraints for data integrity"""
+        # One transaction (one commit, one round-trip) for all schema changes;
+        # IF NOT EXISTS keeps the batch idempotent
+        try:
+            self.execute_write_batches([(constraint, {}) for constraint in self.CONSTRAINTS])
+            logger.info("Constraints created: %s", len(self.CONSTRAINTS))
+        except Exception as e:
+            logger.warning("Constraint creation skipped: %s", e)
 
     def check_vector_support(self) -> bool:
         """
@@ -182,18 +607,13 @@ class Neo4jClient:
         Returns:
             bool: True if vector indexes are supported
         """
-        query = """
-        SHOW INDEXES
-        WHERE type = 'VECTOR'
-        """
         try:
-            with self.driver.session() as session:
-                result = session.run(query)
-                # If query executes without error, vector indexes are supported
-                logger.info("Vector index support detected")
-                return True
+            self._session().run(self.VECTOR_SUPPORT_QUERY).consume()
+            # If query executes without error, vector indexes are supported
+            logger.info("Vector index support detected")
+            return True
         except Exception as e:
-            logger.warning(f"Vector index check failed: {e}")
+            logger.warning("Vector index check failed: %s", e)
             logger.warning("This may indicate that the Community Edition does not support vector indexes")
             return False
 
@@ -204,8 +624,7 @@ class Neo4jClient:
         Returns:
             int: Number of nodes
         """
-        query = "MATCH (n) RETURN count(n) AS count"
-        result = self.execute_query(query)
+        result = self.execute_query(self.NODE_COUNT_QUERY, mode="read")
         return result[0]['count'] if result else 0
 
     def get_relationship_count(self) -> int:
@@ -215,12 +634,13 @@ class Neo4jClient:
         Returns:
             int: Number of relationships
         """
-        query = "MATCH ()-[r]->() RETURN count(r) AS count"
-        result = self.execute_query(query)
+        result = self.execute_query(self.RELATIONSHIP_COUNT_QUERY, mode="read")
         return result[0]['count'] if result else 0
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     # Test Neo4j client
     print("Testing Neo4j Client...")
     print("=" * 50)
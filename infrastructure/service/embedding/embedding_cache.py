@@ -0,0 +1,439 @@
+"""
+Caches for query embeddings and recall results
+
+Two tiers:
+1. Exact: LRU + TTL keyed by a BLAKE2b digest of the text, optionally
+   backed by a SQLite file that survives restarts
+2. Semantic: returns a stored value when the cosine similarity between
+   query embeddings exceeds a threshold
+"""
+import functools
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from infrastructure.config.config import CONFIG
+
+
+def text_key(text: str) -> str:
+    """
+    Return the cache key for a text
+
+    A 128-bit BLAKE2b digest of the text without surrounding whitespace:
+    cheaper than SHA256 and still collision-free in practice.
+    """
+    return hashlib.blake2b(text.strip().encode('utf-8'), digest_size=16).hexdigest()
+
+
+def quantize_int8(vector: Union[List[float], np.ndarray]) -> bytes:
+    """
+    Quantize an embedding to symmetric int8
+
+    Layout: float32 scale followed by one int8 per dimension
+    (4100 bytes for a 4096-dimensional embedding).
+    """
+    vector = np.asarray(vector, dtype=np.float32)
+    peak = float(np.max(np.abs(vector))) if vector.size else 0.0
+    scale = np.float32(peak / 127.0 if peak else 1.0)
+    codes = np.clip(np.rint(vector / scale), -127, 127).astype(np.int8)
+    return scale.tobytes() + codes.tobytes()
+
+
+def dequantize_int8(data: bytes) -> np.ndarray:
+    """Restore a float32 embedding from quantize_int8 output"""
+    scale = np.frombuffer(data, dtype=np.float32, count=1)[0]
+    return np.frombuffer(data, dtype=np.int8, offset=4).astype(np.float32) * scale
+
+
+class LRUCache:
+    """Thread-safe LRU cache with per-entry time-to-live"""
+
+    def __init__(self, maxsize: int = 10000, ttl: Optional[float] = 3600):
+        """
+        Initialize LRU cache
+
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Seconds before an entry expires (None = never)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Get a cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any):
+        """Cache a value, evicting the least recently used entry when full"""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Clear the cache"""
+        with self._lock:
+            self._data.clear()
+
+    def size(self) -> int:
+        """Get cache size"""
+        return len(self._data)
+
+
+class SQLiteEmbeddingStore:
+    """
+    Persistent embedding store in a SQLite file
+
+    Rows are keyed by (model, text_key) and hold float32 bytes, or
+    quantize_int8 bytes with ``quantize``. Embeddings are deterministic for
+    a model, so persisted rows never expire.
+    """
+
+    def __init__(self, path: Union[str, Path], model: str = None, quantize: bool = False):
+        """
+        Initialize the store, creating the file and table if needed
+
+        Args:
+            path: SQLite database file
+            model: Embedding model the rows belong to (default: CONFIG.embedding_model)
+            quantize: Store embeddings as int8 (4x smaller file)
+        """
+        self.quantize = quantize
+        # int8 rows live under their own model key, so toggling the format
+        # misses instead of misreading rows written in the other one
+        self.model = (model or CONFIG.embedding_model) + (':int8' if quantize else '')
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "model TEXT NOT NULL, key TEXT NOT NULL, embedding BLOB NOT NULL, "
+                "PRIMARY KEY (model, key))"
+            )
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Get a stored embedding, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT embedding FROM embeddings WHERE model = ? AND key = ?",
+                (self.model, key)
+            ).fetchone()
+        if row is None:
+            return None
+        return dequantize_int8(row[0]) if self.quantize else np.frombuffer(row[0], dtype=np.float32).copy()
+
+    def set(self, key: str, embedding: np.ndarray):
+        """Store an embedding, replacing any previous value"""
+        data = quantize_int8(embedding) if self.quantize else np.asarray(embedding, dtype=np.float32).tobytes()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (model, key, embedding) VALUES (?, ?, ?)",
+                (self.model, key, data)
+            )
+
+    def clear(self):
+        """Delete every embedding stored for the model"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM embeddings WHERE model = ?", (self.model,))
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+class EmbeddingCache:
+    """
+    Exact-match embedding cache keyed by text_key(text)
+
+    With ``quantize`` enabled, entries are stored as int8 (see quantize_int8),
+    in memory and on disk: about 4 KB per 4096-dimensional embedding instead
+    of 16 KB as float32, at the cost of a small rounding error on hits.
+
+    With a ``path``, the in-memory LRU is backed by a SQLiteEmbeddingStore:
+    memory misses are looked up on disk, so embeddings survive restarts.
+    """
+
+    def __init__(self, maxsize: int = None, ttl: Optional[float] = None, quantize: bool = None,
+                 path: Union[str, Path, None] = None):
+        """
+        Initialize embedding cache
+
+        Args:
+            maxsize: Maximum number of cached embeddings (default: CONFIG.embedding_cache_size)
+            ttl: Seconds before an embedding expires (default: CONFIG.embedding_cache_ttl)
+            quantize: Store embeddings as int8 (default: CONFIG.embedding_cache_int8)
+            path: SQLite file for persistence (default: CONFIG.embedding_cache_path)
+        """
+        self.cache = LRUCache(
+            maxsize=maxsize or CONFIG.embedding_cache_size,
+            ttl=ttl or CONFIG.embedding_cache_ttl
+        )
+        self.quantize = CONFIG.embedding_cache_int8 if quantize is None else quantize
+        path = path or CONFIG.embedding_cache_path
+        self.store = SQLiteEmbeddingStore(path, quantize=self.quantize) if path else None
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """Get cached embedding for text"""
+        key = text_key(text)
+        embedding = self.cache.get(key)
+        if embedding is None:
+            if self.store is None:
+                return None
+            embedding = self.store.get(key)
+            if embedding is not None:
+                self._remember(key, embedding)
+            return embedding
+        return dequantize_int8(embedding) if self.quantize else embedding
+
+    def set(self, text: str, embedding: np.ndarray):
+        """Cache embedding for text"""
+        key = text_key(text)
+        self._remember(key, embedding)
+        if self.store is not None:
+            self.store.set(key, embedding)
+
+    def _remember(self, key: str, embedding: np.ndarray):
+        """Put an embedding in the in-memory tier"""
+        self.cache.set(key, quantize_int8(embedding) if self.quantize else embedding)
+
+    def clear(self):
+        """Clear the cache (including the persistent store)"""
+        self.cache.clear()
+        if self.store is not None:
+            self.store.clear()
+
+    def size(self) -> int:
+        """Get cache size"""
+        return self.cache.size()
+
+
+def cached_embedding(func: Callable) -> Callable:
+    """
+    Serve ``generate_embedding(self, text, ...)`` from ``self.embedding_cache``
+
+    Services without an ``embedding_cache`` attribute (or with None) call
+    through unchanged.
+    """
+    @functools.wraps(func)
+    def wrapper(self, text: str, *args, **kwargs):
+        cache = getattr(self, 'embedding_cache', None)
+        if cache is None:
+            return func(self, text, *args, **kwargs)
+
+        embedding = cache.get(text)
+        if embedding is None:
+            embedding = func(self, text, *args, **kwargs)
+            cache.set(text, embedding)
+        return embedding
+
+    return wrapper
+
+
+class _SemanticEntries:
+    """
+    Ring buffer of one namespace's unit-normalized embeddings and values
+
+    Rows live in one preallocated float32 matrix, so a lookup is a single
+    matrix-vector product and an insert writes one row in place. Capacity
+    doubles up to ``maxsize``; after that the oldest row is overwritten.
+    """
+
+    INITIAL_CAPACITY = 8
+
+    def __init__(self, maxsize: int, dimension: int):
+        capacity = min(self.INITIAL_CAPACITY, maxsize)
+        self.maxsize = maxsize
+        self.matrix = np.empty((capacity, dimension), dtype=np.float32)
+        self.expiries: List[Optional[float]] = [None] * capacity
+        self.values: List[Any] = [None] * capacity
+        self.size = 0
+        self.next = 0
+        # Expiry of the newest row: the TTL is fixed, so it expires last
+        self.expires_at: Optional[float] = None
+
+    def expired(self, now: float) -> bool:
+        """Whether every row has expired"""
+        return self.expires_at is not None and self.expires_at < now
+
+    def append(self, vector: np.ndarray, expires_at: Optional[float], value: Any):
+        """Store a row, growing the buffer or overwriting the oldest row"""
+        capacity = len(self.values)
+        if self.size == capacity and capacity < self.maxsize:
+            grown = min(capacity * 2, self.maxsize)
+            matrix = np.empty((grown, self.matrix.shape[1]), dtype=np.float32)
+            matrix[:capacity] = self.matrix
+            self.matrix = matrix
+            self.expiries.extend([None] * (grown - capacity))
+            self.values.extend([None] * (grown - capacity))
+            capacity = grown
+
+        slot = self.next
+        self.matrix[slot] = vector
+        self.expiries[slot] = expires_at
+        self.values[slot] = value
+        self.next = (slot + 1) % capacity
+        self.size = min(self.size + 1, capacity)
+        self.expires_at = expires_at
+
+
+class SemanticCache:
+    """
+    Similarity-keyed cache
+
+    Entries are grouped by namespace; a lookup returns the value stored
+    for the most similar embedding in the namespace when its cosine
+    similarity reaches the threshold. Similarities are computed with a
+    single matrix-vector product over the namespace. Namespaces are kept
+    in LRU order, bounded by ``max_namespaces``, and dropped once all of
+    their entries have expired.
+    """
+
+    def __init__(self, threshold: float = 0.95, maxsize: int = 256, ttl: Optional[float] = 300,
+                 max_namespaces: int = 64):
+        """
+        Initialize semantic cache
+
+        Args:
+            threshold: Minimum cosine similarity for a hit
+            maxsize: Maximum number of entries per namespace
+            ttl: Seconds before an entry expires (None = never)
+            max_namespaces: Maximum number of namespaces (least recently
+                            used ones are evicted)
+        """
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_namespaces = max_namespaces
+        self._entries: "OrderedDict[Any, _SemanticEntries]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(embedding: Union[List[float], np.ndarray]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, namespace: Any, embedding: np.ndarray) -> Optional[Any]:
+        """Get the value stored for the most similar embedding, or None"""
+        with self._lock:
+            entries = self._entries.get(namespace)
+            if entries is None:
+                return None
+            if entries.expired(time.monotonic()):
+                del self._entries[namespace]
+                return None
+            self._entries.move_to_end(namespace)
+
+            similarities = entries.matrix[:entries.size] @ self._normalize(embedding)
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                return None
+            expires_at = entries.expiries[best]
+            if expires_at is not None and expires_at < time.monotonic():
+                return None
+            return entries.values[best]
+
+    def set(self, namespace: Any, embedding: np.ndarray, value: Any):
+        """Store a value, replacing the oldest entry of the namespace when full"""
+        now = time.monotonic()
+        expires_at = now + self.ttl if self.ttl is not None else None
+        vector = self._normalize(embedding)
+
+        with self._lock:
+            entries = self._entries.get(namespace)
+            if entries is None:
+                entries = self._entries[namespace] = _SemanticEntries(self.maxsize, vector.shape[0])
+            else:
+                self._entries.move_to_end(namespace)
+            entries.append(vector, expires_at, value)
+
+            # Drop fully expired namespaces, then the least recently used
+            for key in [key for key, other in self._entries.items() if other.expired(now)]:
+                del self._entries[key]
+            while len(self._entries) > self.max_namespaces:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Clear the cache"""
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> int:
+        """Get total number of cached entries"""
+        with self._lock:
+            return sum(entries.size for entries in self._entries.values())
+
+
+class RecallResultCache:
+    """
+    Two-tier cache for recall query results
+
+    Results are keyed by a namespace derived from the Cypher query and its
+    non-embedding parameters. Within a namespace, the exact tier matches on
+    text_key(query_text). The optional semantic tier matches on query
+    embedding similarity, so it can answer with a different (near-duplicate)
+    query's results; it is only enabled when a threshold is configured.
+    """
+
+    def __init__(self, maxsize: int = None, ttl: Optional[float] = None, threshold: float = None):
+        """
+        Initialize recall result cache
+
+        Args:
+            maxsize: Maximum number of exact entries (default: CONFIG.recall_cache_size)
+            ttl: Seconds before results expire (default: CONFIG.recall_cache_ttl)
+            threshold: Cosine similarity for semantic hits (default:
+                       CONFIG.semantic_cache_threshold; None disables the semantic tier)
+        """
+        ttl = ttl or CONFIG.recall_cache_ttl
+        threshold = threshold or CONFIG.semantic_cache_threshold
+        self.exact = LRUCache(maxsize=maxsize or CONFIG.recall_cache_size, ttl=ttl)
+        self.semantic = SemanticCache(threshold=threshold, ttl=ttl) if threshold is not None else None
+
+    @staticmethod
+    def namespace(cypher_query: str, params: Dict[str, Any]) -> str:
+        """Build the namespace key for a query and its non-embedding parameters"""
+        payload = json.dumps(params, sort_keys=True, default=str)
+        return text_key(f"{cypher_query}\x1f{payload}")
+
+    def get(self, namespace: str, query_text: str, embedding: np.ndarray) -> Optional[List[Dict[str, Any]]]:
+        """Get cached results, trying the exact tier before the semantic tier"""
+        results = self.exact.get((namespace, text_key(query_text)))
+        if results is None and self.semantic is not None:
+            results = self.semantic.get(namespace, embedding)
+        return results
+
+    def set(self, namespace: str, query_text: str, embedding: np.ndarray, results: List[Dict[str, Any]]):
+        """Cache results in both tiers"""
+        self.exact.set((namespace, text_key(query_text)), results)
+        if self.semantic is not None:
+            self.semantic.set(namespace, embedding, results)
+
+    def clear(self):
+        """Clear both tiers"""
+        self.exact.clear()
+        if self.semantic is not None:
+            self.semantic.clear()
@@ -1,38 +1,59 @@
 """
 OpenRouter Embedding Service for text vectorization
 """
-from openai import OpenAI
-from typing import List, Union
+from concurrent.futures import ThreadPoolExecutor
+from openai import OpenAI, RateLimitError
+from typing import Iterator, List, Optional
+import asyncio
+import importlib.util
 import logging
+import threading
 import time
 import os
 
-from infrastructure.config.config import Config
+import httpx
+import numpy as np
+
+from infrastructure.config.config import CONFIG
+from infrastructure.service.embedding.embedding_cache import (
+    EmbeddingCache, cached_embedding, dequantize_int8, quantize_int8
+)
+from infrastructure.service.embedding.rate_limiter import TokenBucket
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 class EmbeddingService:
     """Service for generating text embeddings using OpenRouter API"""
 
-    def __init__(self, api_key: str = None, model: str = None):
+    # Batch requests in flight at once in generate_embeddings_batch
+    MAX_CONCURRENT_BATCHES = 4
+    # Characters per batch request: long texts get smaller batches
+    MAX_BATCH_CHARS = 100000
+
+    def __init__(self, api_key: str = None, model: str = None, cache: EmbeddingCache = None,
+                 rate_per_minute: float = None):
         """
         Initialize embedding service
 
         Args:
             api_key: OpenRouter API key
             model: Embedding model to use
+            cache: Query embedding cache (default: new EmbeddingCache unless
+                   EMBEDDING_CACHE_SIZE is 0)
+            rate_per_minute: Maximum API requests per minute (default:
+                             CONFIG.embedding_rate_per_minute; 0 = unlimited)
         """
-        self.api_key = api_key or Config.OPENROUTER_API_KEY
-        self.model = model or Config.EMBEDDING_MODEL
+        self.api_key = api_key or CONFIG.openrouter_api_key
+        self.model = model or CONFIG.embedding_model
 
         if not self.api_key:
             raise ValueError("OPENROUTER_API_KEY is required")
 
         self.client = OpenAI(
-            base_url=Config.OPENROUTER_BASE_URL,
-            api_key=self.api_key
+            base_url=CONFIG.openrouter_base_url,
+            api_key=self.api_key,
+            http_client=self._build_http_client()
         )
 
         # Optional headers for OpenRouter
@@ -44,23 +65,60 @@ class EmbeddingService:
         # Filter out empty headers
         self.extra_headers = {k: v for k, v in self.extra_headers.items() if v}
 
-        logger.info(f"Embedding service initialized with model: {self.model}")
+        if cache is None and CONFIG.embedding_cache_size > 0:
+            cache = EmbeddingCache()
+        self.embedding_cache = cache
+
+        if rate_per_minute is None:
+            rate_per_minute = CONFIG.embedding_rate_per_minute
+        self.rate_limiter = TokenBucket(rate_per_minute) if rate_per_minute > 0 else None
+
+        # Monotonic time before which batch requests wait (set on HTTP 429)
+        self._retry_at = 0.0
+        self._rate_limit_lock = threading.Lock()
 
-    def generate_embedding(self, text: str, retry: int = 3) -> List[float]:
+        logger.info("Embedding service initialized with model: %s", self.model)
+
+    def close(self):
+        """Close the HTTP client and its pooled connections"""
+        self.client.close()
+
+    @staticmethod
+    def _build_http_client() -> httpx.Client:
+        """
+        Build the HTTP client shared by all API requests
+
+        Keeps connections alive across batches (enough for every concurrent
+        batch worker) and, when the optional h2 package is installed,
+        multiplexes concurrent requests over HTTP/2.
+        """
+        http2 = importlib.util.find_spec("h2") is not None
+        return httpx.Client(
+            http2=http2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=60.0
+        )
+
+    @cached_embedding
+    def generate_embedding(self, text: str, retry: int = 3) -> np.ndarray:
         """
         Generate embedding for a single text
 
+        Repeated texts are served from the embedding cache.
+
         Args:
             text: Input text to embed
             retry: Number of retry attempts on failure
 
         Returns:
-            list: Embedding vector
+            np.ndarray: float32 embedding vector (16 KB at 4096 dimensions,
+                        vs ~130 KB as a list of Python floats)
         """
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
 
         for attempt in range(retry):
+            self._wait_for_rate_limit()
             try:
                 response = self.client.embeddings.create(
                 extra_headers=self.extra_headers,
@@ -68,74 +126,295 @@ class EmbeddingService:
                 input=text,
                 encoding_format="float"
             )
-                embedding = response.data[0].embedding
-                logger.debug(f"Generated embedding for text: {text[:50]}...")
+                embedding = np.asarray(response.data[0].embedding, dtype=np.float32)
+                logger.debug("Generated embedding for text: %.50s...", text)
                 return embedding
 
             except Exception as e:
-                logger.warning(f"Embedding generation failed (attempt {attempt + 1}/{retry}): {e}")
+                logger.warning("Embedding generation failed (attempt %s/%s): %s", attempt + 1, retry, e)
                 if attempt < retry - 1:
                     time.sleep(2 ** attempt)  # Exponential backoff
                 else:
-                    logger.error(f"Failed to generate embedding after {retry} attempts")
+                    logger.error("Failed to generate embedding after %s attempts", retry)
                     raise
 
-    def generate_embeddings_batch(self, texts: List[str], batch_size: int = 20) -> List[List[float]]:
+    async def generate_embedding_async(self, text: str) -> np.ndarray:
+        """
+        Generate embedding without blocking the event loop
+
+        Args:
+            text: Input text to embed
+
+        Returns:
+            np.ndarray: float32 embedding vector
+        """
+        return await asyncio.to_thread(self.generate_embedding, text)
+
+    def generate_embeddings_batch(self, texts: List[str], batch_size: int = 20,
+                                  max_workers: int = None) -> np.ndarray:
         """
         Generate embeddings for multiple texts in batches
 
+        Duplicate texts are embedded once and their row is copied to every
+        position. Texts found in the embedding cache are not sent; only the
+        misses are batched over the wire, and their embeddings are cached.
+        Misses are sent shortest first, so each batch holds texts of similar
+        length (a batch is as slow as its longest text).
+
         Args:
             texts: List of input texts
             batch_size: Number of texts to process in each batch
+            max_workers: Maximum number of batch requests in flight
+                         (default: MAX_CONCURRENT_BATCHES)
 
         Returns:
-            list: List of embedding vectors
+            np.ndarray: float32 embedding matrix of shape (len(texts), D), one
+                        row per text (zeros where embedding failed)
         """
+        # Map each text to the row of its first occurrence
+        unique = {}
+        positions = [unique.setdefault(text, len(unique)) for text in texts]
+        if len(unique) < len(texts):
+            logger.info("Embedding %s unique texts out of %s", len(unique), len(texts))
+            unique_embeddings = self.generate_embeddings_batch(list(unique), batch_size, max_workers)
+            return unique_embeddings[positions]
+
+        all_embeddings = np.zeros((len(texts), self.get_embedding_dimension()), dtype=np.float32)
         if not texts:
-            return []
+            return all_embeddings
+
+        cache = self.embedding_cache
+        missing = []
+        for i, text in enumerate(texts):
+            embedding = cache.get(text) if cache is not None else None
+            if embedding is None:
+                missing.append(i)
+            else:
+                all_embeddings[i] = embedding
+        if len(missing) < len(texts):
+            logger.info("Embedding cache hits: %s/%s", len(texts) - len(missing), len(texts))
+
+        # Rows are scattered back by index, so the send order is free
+        missing.sort(key=lambda i: len(texts[i]))
+        fresh = self._embed_batches([texts[i] for i in missing], batch_size, max_workers)
+        for i, embedding in zip(missing, fresh):
+            # Failed texts keep the zero row as fallback (not cached)
+            if embedding is None:
+                continue
+            all_embeddings[i] = embedding
+            if cache is not None:
+                cache.set(texts[i], all_embeddings[i].copy())
+
+        logger.info("Generated %s embeddings total", len(all_embeddings))
+        return all_embeddings
+
+    def _embed_batches(self, texts: List[str], batch_size: int,
+                       max_workers: int = None) -> List[Optional[List[float]]]:
+        """
+        Request embeddings from the API, up to batch_size texts per request
 
-        all_embeddings = []
-        total_batches = (len(texts) + batch_size - 1) // batch_size
+        A batch also closes once it reaches MAX_BATCH_CHARS characters, so
+        requests stay within the API's input limits without bisecting.
+        Batches are sent concurrently from a thread pool; the endpoint is
+        I/O bound, so threads overlap the network round-trips.
 
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            batch_num = i // batch_size + 1
+        Args:
+            texts: List of input texts
+            batch_size: Maximum number of texts in each batch
+            max_workers: Maximum number of batch requests in flight
+
+        Returns:
+            list: Embedding vectors aligned with texts (None where a text failed)
+        """
+        batches = []
+        batch, chars = [], 0
+        for text in texts:
+            if batch and (len(batch) == batch_size or chars + len(text) > self.MAX_BATCH_CHARS):
+                batches.append(batch)
+                batch, chars = [], 0
+            batch.append(text)
+            chars += len(text)
+        if batch:
+            batches.append(batch)
+        workers = min(max_workers or self.MAX_CONCURRENT_BATCHES, len(batches))
+
+        def embed(numbered_batch):
+            batch_num, batch = numbered_batch
+            return self._embed_batch(batch, batch_num, len(batches))
+
+        if workers <= 1:
+            parts = [embed(numbered_batch) for numbered_batch in enumerate(batches, 1)]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(embed, enumerate(batches, 1)))
+
+        return [embedding for part in parts for embedding in part]
+
+    def _embed_batch(self, batch: List[str], batch_num: int, total_batches: int) -> List[Optional[List[float]]]:
+        """
+        Embed one batch, bisecting it when the request fails
+
+        A failed batch is split in two halves that are retried separately,
+        recursively, so a single bad text costs about log2(len(batch)) extra
+        requests instead of one request per text.
 
+        Args:
+            batch: Texts to embed
+            batch_num: 1-based batch number (for logging)
+            total_batches: Number of batches in the run (for logging)
+
+        Returns:
+            list: Embedding vectors aligned with batch (None where a text failed)
+        """
+        logger.info("Processing batch %s/%s (%s texts)", batch_num, total_batches, len(batch))
+        try:
+            embeddings = self._embed_once(batch)
+            logger.info("✓ Batch %s/%s completed", batch_num, total_batches)
+            return embeddings
+        except Exception as e:
+            logger.error("Batch %s failed: %s", batch_num, e)
+
+        logger.info("Retrying batch %s in halves...", batch_num)
+        return self._embed_bisect(batch)
+
+    def _embed_bisect(self, batch: List[str]) -> List[Optional[List[float]]]:
+        """Embed the two halves of a failed batch, bisecting again on failure"""
+        if len(batch) == 1:
+            try:
+                return [self.generate_embedding(batch[0]).tolist()]
+            except Exception as e:
+                logger.error("Failed to generate embedding for text: %.50s... Error: %s", batch[0], e)
+                return [None]
+
+        mid = len(batch) // 2
+        embeddings = []
+        for half in (batch[:mid], batch[mid:]):
             try:
-                logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} texts)")
+                embeddings.extend(self._embed_once(half))
+            except Exception:
+                embeddings.extend(self._embed_bisect(half))
+        return embeddings
+
+    def _embed_once(self, batch: List[str], retry: int = 3) -> List[List[float]]:
+        """
+        Embed a batch with a single API request
+
+        On HTTP 429 every worker pauses for the server's Retry-After (or an
+        exponential backoff) before the request is retried.
+
+        Args:
+            batch: Texts to embed
+            retry: Number of attempts when rate limited
+
+        Returns:
+            list: Embedding vectors aligned with batch
 
+        Raises:
+            Exception: The API error, or the last RateLimitError after retry attempts
+        """
+        for attempt in range(retry):
+            self._wait_for_rate_limit()
+            try:
                 response = self.client.embeddings.create(
                     extra_headers=self.extra_headers,
                     model=self.model,
                     input=batch,
                     encoding_format="float"
                 )
-
                 # Extract embeddings in order
-                batch_embeddings = [item.embedding for item in response.data]
-                all_embeddings.extend(batch_embeddings)
+                return [item.embedding for item in response.data]
 
-                logger.info(f"✓ Batch {batch_num}/{total_batches} completed")
+            except RateLimitError as e:
+                if attempt == retry - 1:
+                    raise
+                delay = self._retry_after(e, attempt)
+                logger.warning("⚠ Rate limited, pausing %.1fs (attempt %s/%s)", delay, attempt + 1, retry)
+                with self._rate_limit_lock:
+                    self._retry_at = max(self._retry_at, time.monotonic() + delay)
 
-                # Rate limiting: small delay between batches
-                if i + batch_size < len(texts):
-                    time.sleep(0.5)
+    def _wait_for_rate_limit(self):
+        """
+        Sleep until a request may be sent
 
-            except Exception as e:
-                logger.error(f"Batch {batch_num} failed: {e}")
-                # Fallback: generate embeddings one by one for this batch
-                logger.info(f"Retrying batch {batch_num} with individual requests...")
-                for text in batch:
-                    try:
-                        embedding = self.generate_embedding(text)
-                        all_embeddings.append(embedding)
-                    except Exception as inner_e:
-                        logger.error(f"Failed to generate embedding for text: {text[:50]}... Error: {inner_e}")
-                        # Use zero vector as fallback
-                        all_embeddings.append([0.0] * Config.EMBEDDING_DIMENSION)
-
-        logger.info(f"Generated {len(all_embeddings)} embeddings total")
-        return all_embeddings
+        Waits out the pause requested by the last rate-limited response, then
+        takes a token from the client-side rate limiter (if configured).
+        """
+        delay = self._retry_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+    @staticmethod
+    def _retry_after(error: RateLimitError, attempt: int) -> float:
+        """Seconds to pause after a 429: the Retry-After header, else exponential backoff"""
+        try:
+            return float(error.response.headers.get("retry-after"))
+        except (AttributeError, TypeError, ValueError):
+            return float(2 ** attempt)
+
+    def generate_embeddings_array(self, texts: List[str], chunk_size: int = 64,
+                                  max_workers: int = 4) -> np.ndarray:
+        """
+        Generate embeddings for many texts as a single (N, D) float32 array
+
+        Same as generate_embeddings_batch, with larger default requests.
+
+        Args:
+            texts: List of input texts
+            chunk_size: Number of texts per API request
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            np.ndarray: Embedding matrix of shape (len(texts), D)
+        """
+        return self.generate_embeddings_batch(texts, batch_size=chunk_size, max_workers=max_workers)
+
+    def iter_embeddings_batched(self, texts: List[str], batch_size: int = 20) -> Iterator[np.ndarray]:
+        """
+        Generate embeddings chunk by chunk, in input order
+
+        Each chunk covers MAX_CONCURRENT_BATCHES requests' worth of texts
+        (embedded concurrently with generate_embeddings_batch), so callers
+        can consume early rows while later ones are still being generated.
+
+        Args:
+            texts: List of input texts
+            batch_size: Number of texts per API request
+
+        Yields:
+            np.ndarray: float32 embedding matrix for the next texts in order
+                        (zero rows where embedding failed)
+        """
+        chunk_size = batch_size * self.MAX_CONCURRENT_BATCHES
+        for start in range(0, len(texts), chunk_size):
+            yield self.generate_embeddings_batch(texts[start:start + chunk_size], batch_size)
+
+    @staticmethod
+    def quantize_int8(vec: np.ndarray) -> bytes:
+        """
+        Quantize an embedding to int8 (float32 scale + one int8 per dimension)
+
+        Args:
+            vec: Embedding vector
+
+        Returns:
+            bytes: 4 + dimension bytes
+        """
+        return quantize_int8(vec)
+
+    @staticmethod
+    def dequantize_int8(data: bytes) -> np.ndarray:
+        """
+        Restore a float32 embedding from quantize_int8 output
+
+        Args:
+            data: Quantized embedding
+
+        Returns:
+            np.ndarray: float32 embedding
+        """
+        return dequantize_int8(data)
 
     def get_embedding_dimension(self) -> int:
         """
@@ -144,7 +423,7 @@ class EmbeddingService:
         Returns:
             int: Embedding dimension
         """
-        return Config.EMBEDDING_DIMENSION
+        return CONFIG.embedding_dimension
 
     def test_connection(self) -> bool:
         """
@@ -158,41 +437,20 @@ class EmbeddingService:
             embedding = self.generate_embedding(test_text)
 
             if len(embedding) == self.get_embedding_dimension():
-                logger.info(f"✓ API connection successful. Embedding dimension: {len(embedding)}")
+                logger.info("✓ API connection successful. Embedding dimension: %s", len(embedding))
                 return True
             else:
-                logger.error(f"Unexpected embedding dimension: {len(embedding)}")
+                logger.error("Unexpected embedding dimension: %s", len(embedding))
                 return False
 
         except Exception as e:
-            logger.error(f"API connection test failed: {e}")
+            logger.error("API connection test failed: %s", e)
             return False
 
 
-class EmbeddingCache:
-    """Simple in-memory cache for embeddings"""
-
-    def __init__(self):
-        self.cache = {}
-
-    def get(self, text: str) -> Union[List[float], None]:
-        """Get cached embedding for text"""
-        return self.cache.get(text)
-
-    def set(self, text: str, embedding: List[float]):
-        """Cache embedding for text"""
-        self.cache[text] = embedding
-
-    def clear(self):
-        """Clear the cache"""
-        self.cache.clear()
-
-    def size(self) -> int:
-        """Get cache size"""
-        return len(self.cache)
-
-
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     # Test embedding service
     print("Testing Embedding Service...")
     print("=" * 50)
@@ -225,7 +483,9 @@ if __name__ == "__main__":
         cache = EmbeddingCache()
         cache.set(text, embedding)
         cached = cache.get(text)
-        print(f"✓ Cache test: {'Passed' if cached == embedding else 'Failed'}")
+        # int8 cache entries round-trip approximately, not exactly
+        matches = np.allclose(cached, embedding, rtol=0, atol=np.abs(embedding).max() / 127) if CONFIG.embedding_cache_int8 else np.array_equal(cached, embedding)
+        print(f"✓ Cache test: {'Passed' if matches else 'Failed'}")
 
     except Exception as e:
         print(f"✗ Test failed: {e}")
@@ -4,11 +4,11 @@ Mock Embedding Service for testing purposes
 from typing import List, Union
 import logging
 import os
-import random
 
-from infrastructure.config.config import Config
+import numpy as np
+
+from infrastructure.config.config import CONFIG
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -23,13 +23,23 @@ class MockEmbeddingService:
             api_key: OpenRouter API key (not used in mock)
             model: Embedding model to use (not used in mock)
         """
-        self.model = model or Config.EMBEDDING_MODEL
-        self.dimension = Config.EMBEDDING_DIMENSION
+        self.model = model or CONFIG.embedding_model
+        self.dimension = CONFIG.embedding_dimension
         self.api_key = api_key or "mock-api-key"
+        self._rng = np.random.default_rng()
+
+        logger.info("Mock Embedding service initialized with model: %s", self.model)
 
-        logger.info(f"Mock Embedding service initialized with model: {self.model}")
+    def _random_embeddings(self, shape) -> np.ndarray:
+        """
+        Draw random float32 embeddings of the given shape
 
-    def generate_embedding(self, text: str, retry: int = 3) -> List[float]:
+        Gaussian components give uniformly distributed directions, and are
+        generated directly as float32 (no float64 buffer to cast).
+        """
+        return self._rng.standard_normal(shape, dtype=np.float32)
+
+    def generate_embedding(self, text: str, retry: int = 3) -> np.ndarray:
         """
         Generate mock embedding for a single text
 
@@ -38,42 +48,64 @@ class MockEmbeddingService:
             retry: Number of retry attempts (ignored in mock)
 
         Returns:
-            list: Mock embedding vector
+            np.ndarray: Mock float32 embedding vector
         """
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
 
-        logger.debug(f"Generated MOCK embedding for text: {text[:50]}...")
+        logger.debug("Generated MOCK embedding for text: %.50s...", text)
         
         # Generate random embedding vector
-        embedding = [random.uniform(-1.0, 1.0) for _ in range(self.dimension)]
-        return embedding
+        return self._random_embeddings(self.dimension)
+
+    async def generate_embedding_async(self, text: str) -> np.ndarray:
+        """
+        Generate mock embedding (async interface of EmbeddingService)
+
+        Args:
+            text: Input text to embed
+
+        Returns:
+            np.ndarray: Mock float32 embedding vector
+        """
+        return self.generate_embedding(text)
 
-    def generate_embeddings_batch(self, texts: List[str], batch_size: int = 20) -> List[List[float]]:
+    def generate_embeddings_batch(self, texts: List[str], batch_size: int = 20,
+                                  max_workers: int = None) -> np.ndarray:
         """
         Generate mock embeddings for multiple texts in batches
 
         Args:
             texts: List of input texts
             batch_size: Number of texts to process in each batch (ignored in mock)
+            max_workers: Maximum number of batch requests in flight (ignored in mock)
 
         Returns:
-            list: List of mock embedding vectors
+            np.ndarray: Mock float32 embedding matrix of shape (len(texts), D)
         """
-        if not texts:
-            return []
+        logger.info("Generating MOCK embeddings for %s texts", len(texts))
 
-        logger.info(f"Generating MOCK embeddings for {len(texts)} texts")
-        
-        # Generate random embeddings for all texts
-        embeddings = [
-            [random.uniform(-1.0, 1.0) for _ in range(self.dimension)]
-            for _ in range(len(texts))
-        ]
-        
-        logger.info(f"Generated {len(embeddings)} MOCK embeddings total")
+        # Generate random embeddings for all texts in one call
+        embeddings = self._random_embeddings((len(texts), self.dimension))
+
+        logger.info("Generated %s MOCK embeddings total", len(embeddings))
         return embeddings
 
+    def generate_embeddings_array(self, texts: List[str], chunk_size: int = 64,
+                                  max_workers: int = 4) -> np.ndarray:
+        """
+        Generate mock embeddings as a single (N, D) float32 array
+
+        Args:
+            texts: List of input texts
+            chunk_size: Number of texts per request (ignored in mock)
+            max_workers: Maximum number of requests in flight (ignored in mock)
+
+        Returns:
+            np.ndarray: Mock embedding matrix of shape (len(texts), D)
+        """
+        return self.generate_embeddings_batch(texts)
+
     def get_embedding_dimension(self) -> int:
         """
         Get the dimension of embeddings for the current model
@@ -95,6 +127,8 @@ class MockEmbeddingService:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     # Test mock embedding service
     print("Testing Mock Embedding Service...")
     print("=" * 50)
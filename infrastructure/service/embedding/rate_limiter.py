@@ -0,0 +1,41 @@
+"""
+Client-side rate limiting for embedding API requests
+"""
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+
+    Tokens refill continuously at ``rate_per_minute / 60`` per second up to
+    ``burst``; each request takes one token and blocks until one is available.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int = None):
+        """
+        Initialize token bucket
+
+        Args:
+            rate_per_minute: Sustained number of requests allowed per minute
+            burst: Maximum number of requests sent back to back
+                   (default: one second's worth, at least 1)
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(burst or max(1, int(self.rate)))
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until the bucket has refilled enough"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            # Reserve the token now; a negative balance is the caller's wait
+            self._tokens -= 1.0
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)
@@ -4,19 +4,34 @@ FastAPI HTTP API for Vector Recall System
 Provides RESTful endpoints for vector-based search with filtering capabilities
 """
 import sys
+import asyncio
+import base64
 import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from itertools import islice
 from pathlib import Path
 
 # Add the project root to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Awaitable, Callable, Literal, Optional, Set, Tuple
+import anyio.to_thread
+import numpy as np
+import orjson
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, field_validator
 
 from domain.service.vector_recall import VectorRecallSystem
 from domain.service.vector_indexer import VectorIndexer
-from infrastructure.persistence.neo4j.neo4j_client import Neo4jClient
+from domain.service.prd_shadow_index import PRDShadowIndex
+from infrastructure.config.config import CONFIG
+from infrastructure.persistence.neo4j.neo4j_client import Neo4jClient, embedding_param
 from infrastructure.service.embedding.embedding_service import EmbeddingService
 
 # Initialize logging
@@ -29,24 +44,84 @@ app = FastAPI(
     description="RESTful API for vector-based search with filtering capabilities",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # orjson encodes the float-heavy embedding and recall payloads far faster
+    default_response_class=ORJSONResponse
 )
-
-# Initialize services (will be created on first request)
+# Float lists and repeated keys compress several-fold; small replies are
+# sent as-is, and clients that do not send Accept-Encoding: gzip are unaffected
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Initialize services (created at startup, or on first request if that
+# failed); the recall system and indexer share one Neo4j client and one
+# embedding service
+_embedding_service = None
 _recall_system = None
 _vector_indexer = None
+# Reentrant: the getters call each other while holding it
+_services_lock = threading.RLock()
+
+# Micro-batching for /embedding/generate: concurrent requests are queued and
+# embedded together, one API call per batch instead of one per request
+EMBEDDING_MAX_BATCH = 32
+EMBEDDING_BATCH_WAIT = 0.005  # seconds to wait for more texts after the first
+_embedding_queue: Optional["asyncio.Queue[Tuple[str, asyncio.Future]]"] = None
+_embedding_worker: Optional[asyncio.Task] = None
+# Batches being embedded (referenced here so the tasks are not garbage collected)
+_embedding_batches: Set[asyncio.Task] = set()
+
+# Tasks of requests being handled, keyed by their payload (see coalesced)
+_inflight: Dict[Tuple[type, str], asyncio.Task] = {}
+
+# Periodic reload of the in-memory PRD index (PRD_SHADOW_INDEX)
+_prd_index_refresher: Optional[asyncio.Task] = None
+
+# Worker threads for blocking Neo4j and embedding calls (anyio's default is 40)
+THREADPOOL_SIZE = 64
+
+# Elements embedded and written back per page (and transaction) by
+# /embedding/generate-and-store; at 4096 dimensions a page is ~8 MB of vectors
+EMBEDDING_WRITE_CHUNK = 500
+
+
+def get_embedding_service() -> EmbeddingService:
+    """
+    Get or initialize the shared embedding service
+
+    One instance keeps a single HTTP connection pool, embedding cache and
+    rate limit for every endpoint.
+    """
+    global _embedding_service
+    if _embedding_service is None:
+        with _services_lock:
+            if _embedding_service is None:
+                _embedding_service = EmbeddingService()
+    return _embedding_service
 
 
 def get_recall_system():
     """Get or initialize the recall system"""
     global _recall_system
     if _recall_system is None:
-        try:
-            neo4j_client = Neo4jClient()
-            embedding_service = EmbeddingService()
-            _recall_system = VectorRecallSystem(neo4j_client, embedding_service)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Failed to initialize services: {str(e)}")
+        with _services_lock:
+            if _recall_system is None:
+                try:
+                    # Async recall routes embed their queries through the batcher
+                    neo4j_client = Neo4jClient.shared()
+                    prd_index = None
+                    if CONFIG.prd_shadow_index_enabled:
+                        if CONFIG.vector_similarity_function.lower() == 'cosine':
+                            prd_index = PRDShadowIndex(neo4j_client)
+                        else:
+                            # Its scores would not match the index's
+                            logger.warning("⚠ PRD_SHADOW_INDEX needs cosine similarity, not %s; disabled",
+                                           CONFIG.vector_similarity_function)
+                    _recall_system = VectorRecallSystem(
+                        neo4j_client, get_embedding_service(), embed_async=embed_queued,
+                        prd_index=prd_index
+                    )
+                except Exception as e:
+                    raise HTTPException(status_code=500, detail=f"Failed to initialize services: {str(e)}")
     return _recall_system
 
 
@@ -54,12 +129,12 @@ def get_vector_indexer():
     """Get or initialize the vector indexer"""
     global _vector_indexer
     if _vector_indexer is None:
-        try:
-            neo4j_client = Neo4jClient()
-            embedding_service = EmbeddingService()
-            _vector_indexer = VectorIndexer(neo4j_client, embedding_service)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Failed to initialize vector indexer: {str(e)}")
+        with _services_lock:
+            if _vector_indexer is None:
+                try:
+                    _vector_indexer = VectorIndexer(Neo4jClient.shared(), get_embedding_service())
+                except Exception as e:
+                    raise HTTPException(status_code=500, detail=f"Failed to initialize vector indexer: {str(e)}")
     return _vector_indexer
 
 
@@ -81,12 +156,166 @@ def check_index_exists(indexer: VectorIndexer, index_name: str) -> bool:
         return False
 
 
+def _embed_texts(texts: List[str]):
+    """Embed a queued batch with the shared embedding service"""
+    return get_embedding_service().generate_embeddings_batch(
+        texts, batch_size=EMBEDDING_MAX_BATCH
+    )
+
+
+async def _embed_batch(items: List[Tuple[str, asyncio.Future]], slots: asyncio.Semaphore):
+    """Embed one collected batch and resolve each request's future with its row"""
+    try:
+        try:
+            embeddings = await run_in_threadpool(_embed_texts, [text for text, _ in items])
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), embedding in zip(items, embeddings):
+            if future.done():
+                continue
+            # generate_embeddings_batch leaves a zero row for failed texts
+            if embedding.any():
+                future.set_result(embedding)
+            else:
+                future.set_exception(RuntimeError("Embedding service returned no embedding"))
+    finally:
+        slots.release()
+
+
+async def _run_embedding_batches():
+    """
+    Drain the embedding queue into batches
+
+    Waits for a free slot (up to MAX_CONCURRENT_BATCHES batches are embedded
+    at once) and a first text, lets EMBEDDING_BATCH_WAIT seconds of requests
+    pile up, takes up to EMBEDDING_MAX_BATCH texts and starts embedding them
+    in one call without waiting for the result.
+    """
+    slots = asyncio.Semaphore(EmbeddingService.MAX_CONCURRENT_BATCHES)
+    while True:
+        await slots.acquire()
+        try:
+            items = [await _embedding_queue.get()]
+            await asyncio.sleep(EMBEDDING_BATCH_WAIT)
+        except BaseException:
+            slots.release()
+            raise
+        while len(items) < EMBEDDING_MAX_BATCH and not _embedding_queue.empty():
+            items.append(_embedding_queue.get_nowait())
+
+        task = asyncio.create_task(_embed_batch(items, slots))
+        _embedding_batches.add(task)
+        task.add_done_callback(_embedding_batches.discard)
+
+
+def encode_embeddings(embeddings: np.ndarray, encoding: str, key: str) -> Dict[str, Any]:
+    """
+    Build the embedding fields of a response
+
+    Args:
+        embeddings: Embedding vector or matrix
+        encoding: "json" for the array under ``key`` (written as float
+                  lists by orjson's numpy support); "f16b64" for
+                  base64-encoded little-endian float16 bytes in "data",
+                  with "dtype" and "shape" (lossy, ~8x smaller)
+        key: Response field for the json encoding
+
+    Returns:
+        dict: Fields to merge into the response
+    """
+    if encoding == "f16b64":
+        array = np.ascontiguousarray(embeddings, dtype='<f2')
+        return {
+            "data": base64.b64encode(array.tobytes()).decode('ascii'),
+            "dtype": "float16",
+            "shape": list(array.shape)
+        }
+    return {key: embeddings}
+
+
+async def _refresh_prd_index(index: PRDShadowIndex):
+    """Reload the in-memory PRD index every PRD_SHADOW_INDEX_REFRESH seconds"""
+    while True:
+        try:
+            await run_in_threadpool(index.refresh)
+        except Exception as e:
+            # Searches keep the previous snapshot (or Neo4j, if none loaded yet)
+            logger.warning("⚠ PRD index refresh failed: %s", e)
+        await asyncio.sleep(CONFIG.prd_shadow_index_refresh)
+
+
+async def coalesced(request: BaseModel, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+    """
+    Await ``func(*args, **kwargs)`` once for identical requests in flight
+
+    Concurrent requests with the same model type and payload share the
+    first one's result (or error) instead of repeating the embedding and
+    Neo4j work. The work runs in its own task, so it finishes even if the
+    caller that started it is cancelled. Nothing is kept once it
+    completes; repeats after that are the caches' job.
+
+    Args:
+        request: Request model identifying the work
+        func: Coroutine function doing the work
+    """
+    key = (type(request), request.model_dump_json())
+    task = _inflight.get(key)
+    if task is None:
+        # The shared task belongs to no caller: cancelling one caller (a
+        # disconnected client) leaves the work running for the others
+        task = _inflight[key] = asyncio.ensure_future(func(*args, **kwargs))
+
+        def forget(done: asyncio.Future):
+            if _inflight.get(key) is done:
+                del _inflight[key]
+            if not done.cancelled():
+                done.exception()  # mark retrieved: there may be no callers left
+
+        task.add_done_callback(forget)
+    return await asyncio.shield(task)
+
+
+async def embed_queued(text: str):
+    """
+    Return a text's embedding, from the embedding cache or else by queueing
+    it for the next embedding batch
+    """
+    # Cache hits must not wait behind API calls in flight
+    cache = get_embedding_service().embedding_cache
+    embedding = cache.get(text) if cache is not None else None
+    if embedding is not None:
+        return embedding
+
+    future = asyncio.get_running_loop().create_future()
+    await _embedding_queue.put((text, future))
+    return await future
+
+
+# Request limits: keep one request from monopolizing the embedding API,
+# Neo4j or server memory
+MAX_TOP_K = 200
+MAX_TEXT_LENGTH = 32000  # characters per text
+MAX_BATCH_TEXTS = 512
+MAX_BATCH_SIZE = 128
+MAX_BATCH_CHARS = 2000000  # total characters per batch request
+MAX_BATCH_QUERIES = 48  # searches per /recall/batch request
+
+# Labels, relationship types and property names that are formatted into
+# Cypher (they cannot be query parameters) must be plain identifiers
+IDENTIFIER_PATTERN = r"^[A-Za-z_][A-Za-z0-9_]{0,63}$"
+_IDENTIFIER_RE = re.compile(IDENTIFIER_PATTERN)
+
+
 # Request models
 class RecallRequest(BaseModel):
     """Base request model for recall operations"""
-    query_text: str
-    top_k: int = 5
-    node_label: str = "Ontology"
+    query_text: str = Field(..., max_length=MAX_TEXT_LENGTH)
+    top_k: int = Field(5, ge=1, le=MAX_TOP_K)
+    node_label: str = Field("Ontology", pattern=IDENTIFIER_PATTERN)
     filters: Optional[Dict[str, Any]] = None
 
 
@@ -94,9 +323,9 @@ class CreateIndexRequest(BaseModel):
     """
     Request model for creating a vector index
     """
-    index_name: str
-    node_label: str
-    property_name: str
+    index_name: str = Field(..., pattern=IDENTIFIER_PATTERN)
+    node_label: str = Field(..., pattern=IDENTIFIER_PATTERN)
+    property_name: str = Field(..., pattern=IDENTIFIER_PATTERN)
 
 
 class CreateAllIndexesResponse(BaseModel):
@@ -109,48 +338,65 @@ class CreateAllIndexesResponse(BaseModel):
 
 class SimilarPRDRequest(BaseModel):
     """Request model for similar PRD search"""
-    query_text: str
-    top_k: int = 5
+    query_text: str = Field(..., max_length=MAX_TEXT_LENGTH)
+    top_k: int = Field(5, ge=1, le=MAX_TOP_K)
 
 
 class ReviewSuggestionRequest(BaseModel):
     """Request model for review suggestion search"""
-    query_text: str
+    query_text: str = Field(..., max_length=MAX_TEXT_LENGTH)
     department: Optional[str] = None
-    top_k: int = 10
+    top_k: int = Field(10, ge=1, le=MAX_TOP_K)
 
 
 class RiskIdentificationRequest(BaseModel):
     """Request model for risk identification"""
-    query_text: str
-    top_k: int = 5
+    query_text: str = Field(..., max_length=MAX_TEXT_LENGTH)
+    top_k: int = Field(5, ge=1, le=MAX_TOP_K)
 
 
 class KnowledgeBaseRequest(BaseModel):
     """
     Request model for knowledge base search
     """
-    query_text: str
-    top_k: int = 8
-    node_label: str = "Ontology"
+    query_text: str = Field(..., max_length=MAX_TEXT_LENGTH)
+    top_k: int = Field(8, ge=1, le=MAX_TOP_K)
+    node_label: str = Field("Ontology", pattern=IDENTIFIER_PATTERN)
     filters: Optional[Dict[str, Any]] = None
 
 
+class BatchRecallRequest(BaseModel):
+    """
+    Request model for running several knowledge base searches at once
+    """
+    queries: List[KnowledgeBaseRequest] = Field(..., min_length=1, max_length=MAX_BATCH_QUERIES)
+
+
 class HybridSearchRequest(BaseModel):
     """
     Request model for hybrid search
     """
-    query_text: str
-    node_label: str = "PRD"
+    query_text: str = Field(..., max_length=MAX_TEXT_LENGTH)
+    node_label: str = Field("PRD", pattern=IDENTIFIER_PATTERN)
     filters: Optional[Dict[str, Any]] = None
-    top_k: int = 10
+    top_k: int = Field(10, ge=1, le=MAX_TOP_K)
+    boosts: Optional[Dict[str, Dict[str, float]]] = None
+
+
+class FullReviewRequest(BaseModel):
+    """
+    Request model for running all review scenarios at once
+    """
+    query_text: str = Field(..., max_length=MAX_TEXT_LENGTH)
+    department: Optional[str] = None
+    top_k: int = Field(5, ge=1, le=MAX_TOP_K)
 
 
 class EmbeddingRequest(BaseModel):
     """
     Request model for single text embedding
     """
-    text: str
+    text: str = Field(..., max_length=MAX_TEXT_LENGTH)
     field: str = "description"  # 默认是description字段
 
 
@@ -158,9 +404,17 @@ class BatchEmbeddingRequest(BaseModel):
     """
     Request model for batch text embedding
     """
-    texts: List[str]
+    texts: List[str] = Field(..., max_length=MAX_BATCH_TEXTS)
     field: str = "description"  # 默认是description字段
-    batch_size: int = 20
+    batch_size: int = Field(20, ge=1, le=MAX_BATCH_SIZE)
+
+    @field_validator('texts')
+    @classmethod
+    def check_total_length(cls, texts: List[str]) -> List[str]:
+        """Bound the total size of the batch, not just the number of texts"""
+        if sum(len(text) for text in texts) > MAX_BATCH_CHARS:
+            raise ValueError(f"texts exceed {MAX_BATCH_CHARS} characters in total")
+        return texts
 
 
 class GenerateAndStoreEmbeddingRequest(BaseModel):
@@ -168,14 +422,23 @@ class GenerateAndStoreEmbeddingRequest(BaseModel):
     Request model for generating embeddings and storing them in the database
     Supports both nodes and relationships
     """
-    element_type: str = "node"  # "node" 或 "relationship"
-    node_label: Optional[str] = None  # 节点标签，如 "OntologyClass" (element_type="node" 时必需)
-    relationship_type: Optional[str] = None  # 关系类型，如 "INHERITANCE", "LINK" (element_type="relationship" 时必需)
-    source_property: str = "description"  # 源文本字段
-    target_property: str = "description_embedding"  # 目标embedding字段
-    batch_size: int = 20  # 批处理大小
+    element_type: Literal["node", "relationship"] = "node"
+    node_label: Optional[str] = Field(None, pattern=IDENTIFIER_PATTERN)  # 节点标签，如 "OntologyClass" (element_type="node" 时必需)
+    relationship_type: Optional[str] = Field(None, pattern=IDENTIFIER_PATTERN)  # 关系类型，如 "INHERITANCE", "LINK" (element_type="relationship" 时必需)
+    source_property: str = Field("description", pattern=IDENTIFIER_PATTERN)  # 源文本字段
+    target_property: str = Field("description_embedding", pattern=IDENTIFIER_PATTERN)  # 目标embedding字段
+    batch_size: int = Field(20, ge=1, le=MAX_BATCH_SIZE)  # 批处理大小
     filters: Optional[Dict[str, Any]] = None  # 可选的过滤条件
 
+    @field_validator('filters')
+    @classmethod
+    def check_filter_keys(cls, filters: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Filter keys become property names and parameter names in the query"""
+        for key in filters or {}:
+            if not _IDENTIFIER_RE.match(key):
+                raise ValueError(f"invalid filter property name: {key!r}")
+        return filters
+
 
 class GenerateAndStoreEmbeddingResponse(BaseModel):
     """
@@ -191,6 +454,64 @@ class GenerateAndStoreEmbeddingResponse(BaseModel):
     index_name: Optional[str] = None  # 创建的索引名称
 
 
+@app.on_event("startup")
+async def size_threadpool():
+    """Size the threadpool that run_in_threadpool and sync routes run on"""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
+
+@app.on_event("startup")
+async def start_embedding_batcher():
+    """Start the task that batches /embedding/generate requests"""
+    global _embedding_queue, _embedding_worker
+    _embedding_queue = asyncio.Queue()
+    _embedding_worker = asyncio.create_task(_run_embedding_batches())
+
+
+@app.on_event("startup")
+async def init_services():
+    """
+    Build the services (and optionally open Neo4j connections) before the
+    first request arrives, instead of on it
+    """
+    global _prd_index_refresher
+    try:
+        recall_system = await run_in_threadpool(get_recall_system)
+        await run_in_threadpool(get_vector_indexer)
+        if recall_system.prd_index is not None:
+            _prd_index_refresher = asyncio.create_task(_refresh_prd_index(recall_system.prd_index))
+        if CONFIG.neo4j_warmup_connections > 0:
+            await recall_system.client.warmup_async(CONFIG.neo4j_warmup_connections)
+        logger.info("✓ Services initialized")
+    except Exception as e:
+        logger.warning("⚠ Service initialization failed, retrying on first request: %s", e)
+
+
+@app.on_event("shutdown")
+async def close_async_driver():
+    """Close the shared client's async driver on the server's event loop"""
+    if _recall_system is not None:
+        await _recall_system.client.close_async()
+
+
+@app.on_event("shutdown")
+async def close_embedding_service():
+    """Close the shared embedding service's HTTP connections"""
+    if _embedding_service is not None:
+        _embedding_service.close()
+
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    """Stop the embedding batch and PRD index refresh tasks"""
+    if _embedding_worker is not None:
+        _embedding_worker.cancel()
+    for task in list(_embedding_batches):
+        task.cancel()
+    if _prd_index_refresher is not None:
+        _prd_index_refresher.cancel()
+
+
 # Health check endpoint
 @app.get("/health", tags=["system"])
 async def health_check():
@@ -199,6 +520,9 @@ async def health_check():
 
 
 # Recall endpoints
+# Recall and embedding routes return ORJSONResponse directly: response_model
+# still documents the shape, but FastAPI skips re-validating and
+# jsonable_encoder-walking every result row
 @app.post("/recall/knowledge-base", response_model=List[Dict[str, Any]], tags=["recall"])
 async def knowledge_base_recall(request: KnowledgeBaseRequest):
     """
@@ -212,17 +536,40 @@ async def knowledge_base_recall(request: KnowledgeBaseRequest):
     """
     try:
         recall_system = get_recall_system()
-        results = recall_system.search_knowledge_base(
+        results = await coalesced(
+            request, recall_system.search_knowledge_base_async,
             query_text=request.query_text,
             top_k=request.top_k,
             node_label=request.node_label,
             filters=request.filters
         )
-        return results
+        return ORJSONResponse(results)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Knowledge base search failed: {str(e)}")
 
 
+@app.post("/recall/batch", response_model=List[List[Dict[str, Any]]], tags=["recall"])
+async def batch_recall(request: BatchRecallRequest):
+    """
+    Run several knowledge base searches with one embedding call
+
+    Args:
+        request: Batch of knowledge base search requests
+
+    Returns:
+        Results of each search, in request order
+    """
+    try:
+        recall_system = get_recall_system()
+        results = await coalesced(
+            request, recall_system.search_knowledge_base_batch_async,
+            [query.model_dump() for query in request.queries]
+        )
+        return ORJSONResponse(results)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Batch recall failed: {str(e)}")
+
+
 @app.post("/recall/similar-prds", response_model=List[Dict[str, Any]], tags=["recall"])
 async def similar_prds_recall(request: SimilarPRDRequest):
     """
@@ -236,11 +583,12 @@ async def similar_prds_recall(request: SimilarPRDRequest):
     """
     try:
         recall_system = get_recall_system()
-        results = recall_system.find_similar_prds(
+        results = await coalesced(
+            request, recall_system.find_similar_prds_async,
             query_text=request.query_text,
             top_k=request.top_k
         )
-        return results
+        return ORJSONResponse(results)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Similar PRD search failed: {str(e)}")
 
@@ -258,12 +606,13 @@ async def review_suggestions_recall(request: ReviewSuggestionRequest):
     """
     try:
         recall_system = get_recall_system()
-        results = recall_system.get_intelligent_review_suggestions(
+        results = await coalesced(
+            request, recall_system.get_intelligent_review_suggestions_async,
             query_text=request.query_text,
             department=request.department,
             top_k=request.top_k
         )
-        return results
+        return ORJSONResponse(results)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Review suggestion search failed: {str(e)}")
 
@@ -281,11 +630,12 @@ async def risk_identification_recall(request: RiskIdentificationRequest):
     """
     try:
         recall_system = get_recall_system()
-        results = recall_system.identify_potential_risks(
+        results = await coalesced(
+            request, recall_system.identify_potential_risks_async,
             query_text=request.query_text,
             top_k=request.top_k
         )
-        return results
+        return ORJSONResponse(results)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Risk identification failed: {str(e)}")
 
@@ -303,51 +653,83 @@ async def hybrid_search_recall(request: HybridSearchRequest):
     """
     try:
         recall_system = get_recall_system()
-        results = recall_system.hybrid_search(
+        results = await coalesced(
+            request, recall_system.hybrid_search_async,
             query_text=request.query_text,
             node_label=request.node_label,
             filters=request.filters,
-            top_k=request.top_k
+            top_k=request.top_k,
+            boosts=request.boosts
         )
-        return results
+        return ORJSONResponse(results)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Hybrid search failed: {str(e)}")
 
 
+@app.post("/recall/full-review", response_model=Dict[str, List[Dict[str, Any]]], tags=["recall"])
+async def full_review_recall(request: FullReviewRequest):
+    """
+    Run similar PRD, review suggestion and risk recall (plus department
+    knowledge when a department is given) with one query embedding
+    
+    Args:
+        request: Full review request parameters
+    
+    Returns:
+        Results keyed by scenario
+    """
+    try:
+        recall_system = get_recall_system()
+        results = await coalesced(
+            request, recall_system.run_full_review_async,
+            query_text=request.query_text,
+            department=request.department,
+            top_k=request.top_k
+        )
+        return ORJSONResponse(results)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Full review recall failed: {str(e)}")
+
+
 # Embedding endpoints
 @app.post("/embedding/generate", response_model=Dict[str, Any], tags=["embedding"])
-async def generate_embedding(request: EmbeddingRequest):
+async def generate_embedding(request: EmbeddingRequest, encoding: Literal["json", "f16b64"] = "json"):
     """
     Generate embedding for a single text
+
+    Concurrent requests are embedded together (see _run_embedding_batches).
     
     Args:
         request: Embedding request parameters with text and field
+        encoding: Embedding encoding, see encode_embeddings (query parameter)
     
     Returns:
         Embedding vector and metadata
     """
     try:
+        if not request.text or not request.text.strip():
+            raise ValueError("Text cannot be empty")
         recall_system = get_recall_system()
-        # Directly use the embedding service from recall system
-        embedding = recall_system.embedding_service.generate_embedding(request.text)
-        return {
+        embedding = await coalesced(request, embed_queued, request.text)
+        return ORJSONResponse({
             "text": request.text,
             "field": request.field,
-            "embedding": embedding,
+            **encode_embeddings(embedding, encoding, "embedding"),
             "dimension": len(embedding),
             "model": recall_system.embedding_service.model
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Embedding generation failed: {str(e)}")
 
 
 @app.post("/embedding/batch", response_model=Dict[str, Any], tags=["embedding"])
-async def generate_batch_embeddings(request: BatchEmbeddingRequest):
+async def generate_batch_embeddings(request: BatchEmbeddingRequest, encoding: Literal["json", "f16b64"] = "json"):
     """
     Generate embeddings for multiple texts in batch
 
     Args:
         request: Batch embedding request parameters
+        encoding: Embedding encoding, see encode_embeddings (query parameter)
 
     Returns:
         List of embeddings and metadata
@@ -355,26 +737,62 @@ async def generate_batch_embeddings(request: BatchEmbeddingRequest):
     try:
         recall_system = get_recall_system()
         # Directly use the embedding service from recall system
-        embeddings = recall_system.embedding_service.generate_embeddings_batch(
+        embeddings = await run_in_threadpool(
+            recall_system.embedding_service.generate_embeddings_batch,
             request.texts,
             batch_size=request.batch_size
         )
-        return {
+        return ORJSONResponse({
             "count": len(embeddings),
             "field": request.field,
             "batch_size": request.batch_size,
-            "embeddings": embeddings,
+            **encode_embeddings(embeddings, encoding, "embeddings"),
             "model": recall_system.embedding_service.model
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Batch embedding generation failed: {str(e)}")
 
 
+@app.post("/embedding/batch/stream", tags=["embedding"])
+async def stream_batch_embeddings(request: BatchEmbeddingRequest, encoding: Literal["json", "f16b64"] = "json"):
+    """
+    Generate embeddings for multiple texts, streamed as NDJSON
+
+    One line per text, in input order: {"index": i, "embedding": [...]}
+    (or the f16b64 fields, see encode_embeddings). Lines are sent as each
+    chunk of batches completes, so neither side holds the whole response.
+
+    Args:
+        request: Batch embedding request parameters
+        encoding: Embedding encoding, see encode_embeddings (query parameter)
+
+    Returns:
+        application/x-ndjson stream
+    """
+    try:
+        embedding_service = get_embedding_service()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Batch embedding generation failed: {str(e)}")
+
+    # Sync generator: Starlette iterates it on the threadpool
+    def lines():
+        index = 0
+        for chunk in embedding_service.iter_embeddings_batched(request.texts, request.batch_size):
+            for embedding in chunk:
+                line = {"index": index, **encode_embeddings(embedding, encoding, "embedding")}
+                yield orjson.dumps(line, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+                index += 1
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @app.post("/embedding/generate-and-store", response_model=GenerateAndStoreEmbeddingResponse, tags=["embedding"])
-async def generate_and_store_embeddings(request: GenerateAndStoreEmbeddingRequest):
+def generate_and_store_embeddings(request: GenerateAndStoreEmbeddingRequest):
     """
     Generate embeddings for nodes or relationships and store them in the database
 
+    Declared sync so FastAPI runs the whole pipeline on its threadpool.
+
     This endpoint supports both nodes and relationships:
     - For nodes: specify element_type="node" and node_label
     - For relationships: specify element_type="relationship" and relationship_type
@@ -382,8 +800,9 @@ async def generate_and_store_embeddings(request: GenerateAndStoreEmbeddingReques
     Steps:
     1. Query elements by type and optional filters
     2. Extract the source property (e.g., "description")
-    3. Generate embeddings in batches
-    4. Update elements with the embeddings in the target property
+    3. Generate embeddings in batches, EMBEDDING_WRITE_CHUNK elements at a time
+    4. Update elements with the embeddings in the target property, one
+       transaction per page while the next page is embedded
 
     Args:
         request: Generate and store embedding request parameters
@@ -446,42 +865,11 @@ async def generate_and_store_embeddings(request: GenerateAndStoreEmbeddingReques
                 """
                 element_name = "all relationships"
 
-        # Execute query with filters as parameters
-        results = neo4j_client.execute_query(query, request.filters or {})
-
-        if not results:
-            return GenerateAndStoreEmbeddingResponse(
-                success=True,
-                message=f"No {element_name} {request.element_type}s found with {request.source_property} property",
-                total_nodes=0,
-                processed_nodes=0,
-                failed_nodes=0,
-                embedding_dimension=0
-            )
-
-        total_elements = len(results)
-
-        # 2. Extract texts and element IDs
-        texts = [result['text'] for result in results]
-        element_ids = [result['element_id'] for result in results]
-
-        # 3. Generate embeddings in batches
-        embeddings = embedding_service.generate_embeddings_batch(
-            texts,
-            batch_size=request.batch_size
-        )
-
-        if not embeddings:
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to generate embeddings"
-            )
-
-        # 4. Update elements with embeddings
+        # 2. Build the write-back query
         if request.element_type == "node":
             if request.node_label:
                 update_query = f"""
-                UNWIND $data AS item
+                UNWIND $rows AS item
                 MATCH (e:{request.node_label})
                 WHERE id(e) = item.element_id
                 SET e.{request.target_property} = item.embedding
@@ -489,7 +877,7 @@ async def generate_and_store_embeddings(request: GenerateAndStoreEmbeddingReques
                 """
             else:
                 update_query = f"""
-                UNWIND $data AS item
+                UNWIND $rows AS item
                 MATCH (e)
                 WHERE id(e) = item.element_id
                 SET e.{request.target_property} = item.embedding
@@ -498,7 +886,7 @@ async def generate_and_store_embeddings(request: GenerateAndStoreEmbeddingReques
         else:
             if request.relationship_type:
                 update_query = f"""
-                UNWIND $data AS item
+                UNWIND $rows AS item
                 MATCH ()-[e:{request.relationship_type}]->()
                 WHERE id(e) = item.element_id
                 SET e.{request.target_property} = item.embedding
@@ -506,20 +894,60 @@ async def generate_and_store_embeddings(request: GenerateAndStoreEmbeddingReques
                 """
             else:
                 update_query = f"""
-                UNWIND $data AS item
+                UNWIND $rows AS item
                 MATCH ()-[e]->()
                 WHERE id(e) = item.element_id
                 SET e.{request.target_property} = item.embedding
                 RETURN count(e) as updated_count
                 """
 
-        data = [
-            {"element_id": element_id, "embedding": embedding}
-            for element_id, embedding in zip(element_ids, embeddings)
-        ]
+        # 3. Stream elements page by page: embed a page while the previous
+        # page is written, so at most two pages are held in memory and the
+        # embedding API and Neo4j work at the same time
+        total_elements = 0
+        processed_elements = 0
+        embedding_dimension = 0
+        pending_write = None
+        with closing(neo4j_client.stream_query(query, request.filters or {}, mode="read")) as rows, \
+                ThreadPoolExecutor(max_workers=1) as writer:
+            while True:
+                page = list(islice(rows, EMBEDDING_WRITE_CHUNK))
+                if not page:
+                    break
+                total_elements += len(page)
+
+                embeddings = embedding_service.generate_embeddings_batch(
+                    [row['text'] for row in page],
+                    batch_size=request.batch_size
+                )
+                if len(embeddings) == 0:
+                    raise HTTPException(
+                        status_code=500,
+                        detail="Failed to generate embeddings"
+                    )
+                embedding_dimension = embeddings.shape[1]
+
+                data = [
+                    {"element_id": row['element_id'], "embedding": embedding_param(embedding)}
+                    for row, embedding in zip(page, embeddings)
+                ]
+                if pending_write is not None:
+                    processed_elements += pending_write.result()
+                pending_write = writer.submit(_write_embeddings, neo4j_client, update_query, data)
+
+            if pending_write is not None:
+                processed_elements += pending_write.result()
+
+        if total_elements == 0:
+            return GenerateAndStoreEmbeddingResponse(
+                success=True,
+                message=f"No {element_name} {request.element_type}s found with {request.source_property} property",
+                total_nodes=0,
+                processed_nodes=0,
+                failed_nodes=0,
+                embedding_dimension=0
+            )
 
-        update_result = neo4j_client.execute_query(update_query, {"data": data})
-        processed_elements = update_result[0]['updated_count'] if update_result else 0
         failed_elements = total_elements - processed_elements
 
         # 5. Auto-create vector index if not exists
@@ -543,7 +971,7 @@ async def generate_and_store_embeddings(request: GenerateAndStoreEmbeddingReques
 
             # Create index if it doesn't exist (only if we have a specific label/type)
             if index_name and not check_index_exists(indexer, index_name):
-                logger.info(f"Auto-creating vector index: {index_name}")
+                logger.info("Auto-creating vector index: %s", index_name)
 
                 # Create index based on element type
                 if request.element_type == "node":
@@ -561,14 +989,14 @@ async def generate_and_store_embeddings(request: GenerateAndStoreEmbeddingReques
 
                 index_created = success
                 if success:
-                    logger.info(f"✓ Auto-created index: {index_name}")
+                    logger.info("✓ Auto-created index: %s", index_name)
             elif index_name:
-                logger.info(f"Index already exists: {index_name}")
+                logger.info("Index already exists: %s", index_name)
             else:
                 logger.warning("Cannot create index without specific label/type")
 
         except Exception as e:
-            logger.warning(f"Failed to create index (non-fatal): {e}")
+            logger.warning("Failed to create index (non-fatal): %s", e)
             # Index creation failure should not affect the main process
 
         # 6. Return results
@@ -578,7 +1006,7 @@ async def generate_and_store_embeddings(request: GenerateAndStoreEmbeddingReques
             total_nodes=total_elements,
             processed_nodes=processed_elements,
             failed_nodes=failed_elements,
-            embedding_dimension=len(embeddings[0]) if embeddings else 0,
+            embedding_dimension=embedding_dimension,
             index_created=index_created,
             index_name=index_name
         )
@@ -594,6 +1022,12 @@ async def generate_and_store_embeddings(request: GenerateAndStoreEmbeddingReques
         )
 
 
+def _write_embeddings(neo4j_client: Neo4jClient, update_query: str, data: List[Dict[str, Any]]) -> int:
+    """Write one page of embeddings in its own transaction and return the updated count"""
+    update_result = neo4j_client.execute_write(update_query, {"rows": data})
+    return update_result[0]['updated_count'] if update_result else 0
+
+
 # Vector Index Management endpoints
 @app.post("/index/create", response_model=Dict[str, Any], tags=["vector-index"])
 async def create_vector_index(request: CreateIndexRequest):
@@ -608,7 +1042,8 @@ async def create_vector_index(request: CreateIndexRequest):
     """
     try:
         indexer = get_vector_indexer()
-        success = indexer.create_vector_index(
+        success = await run_in_threadpool(
+            indexer.create_vector_index,
             index_name=request.index_name,
             node_label=request.node_label,
             property_name=request.property_name
@@ -635,7 +1070,7 @@ async def create_all_vector_indexes():
     """
     try:
         indexer = get_vector_indexer()
-        results = indexer.create_all_indexes()
+        results = await run_in_threadpool(indexer.create_all_indexes)
         return CreateAllIndexesResponse(
             results=results,
             message="Vector index creation completed"
@@ -657,7 +1092,7 @@ async def drop_vector_index(index_name: str):
     """
     try:
         indexer = get_vector_indexer()
-        success = indexer.drop_vector_index(index_name)
+        success = await run_in_threadpool(indexer.drop_vector_index, index_name)
         if success:
             return {
                 "success": True,
@@ -679,19 +1114,43 @@ async def list_vector_indexes():
     """
     try:
         indexer = get_vector_indexer()
-        indexes = indexer.list_vector_indexes()
+        indexes = await run_in_threadpool(indexer.list_vector_indexes)
         return indexes
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list vector indexes: {str(e)}")
 
 
-# Main entry point for development
+# Main entry point: development server by default, --prod for deployment
 if __name__ == "__main__":
+    import argparse
+    import os
     import uvicorn
-    uvicorn.run(
-        "interface.api.main:app",
-        host="0.0.0.0",
-        port=8001,
-        reload=True,
-        log_level="info"
-    )
+
+    parser = argparse.ArgumentParser(description="Vector Recall System API server")
+    parser.add_argument("--prod", action="store_true",
+                        help="Run without reload, with one worker process per CPU")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes with --prod (default: CPU count)")
+    args = parser.parse_args()
+
+    if args.prod:
+        # loop/http "auto" pick uvloop and httptools when installed
+        uvicorn.run(
+            "interface.api.main:app",
+            host="0.0.0.0",
+            port=args.port,
+            workers=args.workers or os.cpu_count(),
+            loop="auto",
+            http="auto",
+            log_level="warning",
+            access_log=False
+        )
+    else:
+        uvicorn.run(
+            "interface.api.main:app",
+            host="0.0.0.0",
+            port=args.port,
+            reload=True,
+            log_level="info"
+        )
@@ -5,6 +5,7 @@ Provides commands for data import, vector indexing, and recall operations
 """
 import sys
 import argparse
+import logging
 from pathlib import Path
 
 # Add the project root to Python path
@@ -13,6 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from application.service.flight_csv_importer import FlightCSVImporter
 from domain.service.vector_indexer import VectorIndexer
 from domain.service.vector_recall import VectorRecallSystem, RecallResultFormatter
+from infrastructure.config.config import CONFIG
 from infrastructure.persistence.neo4j.neo4j_client import Neo4jClient
 from infrastructure.service.embedding.embedding_service import EmbeddingService
 
@@ -36,6 +38,32 @@ def import_flight_data(args):
     return 0
 
 
+def import_prd_data(args):
+    """Import PRD scenario data with embeddings"""
+    data_file = args.data_file or str(CONFIG.prd_scenarios_file)
+    print(f"Importing PRD data from {data_file}...")
+    
+    try:
+        with Neo4jClient() as client:
+            indexer = VectorIndexer(client, EmbeddingService())
+            
+            if args.bulk:
+                # Drop vector indexes during the load and rebuild them once at the end
+                results = indexer.bulk_load_embeddings(data_file)
+                for name, success in results.items():
+                    print(f"{'✓' if success else '✗'} {name}")
+            else:
+                indexer.import_data_with_embeddings(data_file)
+        
+        print(f"\nImport completed successfully!")
+        
+    except Exception as e:
+        print(f"Error importing PRD data: {e}")
+        return 1
+    
+    return 0
+
+
 def create_vector_index(args):
     """Create vector index for Neo4j nodes"""
     print(f"Creating vector index {args.index_name} for {args.node_label}:{args.property_name}...")
@@ -133,7 +161,8 @@ def test_insert(args):
         with Neo4jClient() as client:
             # Create test nodes
             create_node_query = """
-            MERGE (p:Person {name: $name, age: $age, city: $city})
+            UNWIND $rows AS row
+            MERGE (p:Person {name: row.name, age: row.age, city: row.city})
             RETURN p
             """
             
@@ -144,14 +173,15 @@ def test_insert(args):
                 {"name": "王五", "age": 32, "city": "广州"}
             ]
             
+            client.execute_write_many(create_node_query, sample_data)
             for data in sample_data:
-                client.execute_write(create_node_query, data)
                 print(f"✓ Created node: {data['name']}")
             
             # Create relationships
             create_rel_query = """
-            MATCH (a:Person {name: $person1}), (b:Person {name: $person2})
-            MERGE (a)-[r:朋友 {since: $since}]->(b)
+            UNWIND $rows AS row
+            MATCH (a:Person {name: row.person1}), (b:Person {name: row.person2})
+            MERGE (a)-[r:朋友 {since: row.since}]->(b)
             RETURN r
             """
             
@@ -160,8 +190,8 @@ def test_insert(args):
                 {"person1": "李四", "person2": "王五", "since": 2019}
             ]
             
+            client.execute_write_many(create_rel_query, relationships)
             for rel in relationships:
-                client.execute_write(create_rel_query, rel)
                 print(f"✓ Created relationship: {rel['person1']} -> {rel['person2']}")
             
             print("\n✓ Test insert completed successfully!")
@@ -175,6 +205,7 @@ def test_insert(args):
 
 def main():
     """Main CLI function"""
+    logging.basicConfig(level=logging.INFO)
     parser = argparse.ArgumentParser(
         description="Neo4j Graph Database Operations CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -183,6 +214,9 @@ Examples:
   # Import flight data
   python -m interface.cli.main import-flight --data-dir data/Flight
   
+  # Import PRD data with embeddings (rebuild vector indexes after the load)
+  python -m interface.cli.main import-prd --bulk
+  
   # Create vector index
   python -m interface.cli.main create-index --index-name prd_embedding_index --node-label PRD --property-name description
   
@@ -201,6 +235,13 @@ Examples:
     import_parser.add_argument("--data-dir", type=str, default=None, help="Directory containing CSV files")
     import_parser.set_defaults(func=import_flight_data)
     
+    # Import PRD data command
+    prd_parser = subparsers.add_parser("import-prd", help="Import PRD scenario data with embeddings")
+    prd_parser.add_argument("--data-file", type=str, default=None, help="JSON data file (default: PRD scenarios file)")
+    prd_parser.add_argument("--bulk", action="store_true",
+                            help="Drop vector indexes during the load and recreate them afterwards (faster, search unavailable meanwhile)")
+    prd_parser.set_defaults(func=import_prd_data)
+    
     # Create vector index command
     index_parser = subparsers.add_parser("create-index", help="Create vector index for Neo4j nodes")
     index_parser.add_argument("--index-name", type=str, required=True, help="Name of the vector index")
@@ -32,4 +32,9 @@ echo "API documentation: http://0.0.0.0:8001/docs"
 echo "Redoc documentation: http://0.0.0.0:8001/redoc"
 echo "-" * 50
 
-uvicorn interface.api.main:app --host 0.0.0.0 --port 8001 --reload
+# ./start_api.sh --prod: no reload, one worker per CPU, no access log
+if [ "$1" = "--prod" ]; then
+    python -m interface.api.main --prod
+else
+    uvicorn interface.api.main:app --host 0.0.0.0 --port 8001 --reload
+fi
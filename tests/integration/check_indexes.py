@@ -2,14 +2,14 @@
 直接查询 Neo4j 检查索引状态
 """
 from infrastructure.persistence.neo4j.neo4j_client import Neo4jClient
-from infrastructure.config.config import Config
+from infrastructure.config.config import CONFIG
 
 def main():
     print("=" * 80)
     print("检查 Neo4j 向量索引状态")
     print("=" * 80)
 
-    client = Neo4jClient()
+    client = Neo4jClient.shared()
 
     try:
         # 1. 检查所有索引
@@ -88,8 +88,6 @@ def main():
         print(f"\n✗ 错误: {e}")
         import traceback
         traceback.print_exc()
-    finally:
-        client.close()
 
     print("\n" + "=" * 80)
 
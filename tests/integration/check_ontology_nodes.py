@@ -15,33 +15,33 @@ def check_ontology_nodes():
     print("检查Neo4j数据库中的Ontology节点...")
     
     try:
-        with Neo4jClient() as client:
-            # 查询Ontology节点数量
-            count_query = "MATCH (o:Ontology) RETURN count(o) AS count"
-            count_result = client.execute_query(count_query)
-            count = count_result[0]['count'] if count_result else 0
+        client = Neo4jClient.shared()
+        # 查询Ontology节点数量
+        count_query = "MATCH (o:Ontology) RETURN count(o) AS count"
+        count_result = client.execute_query(count_query)
+        count = count_result[0]['count'] if count_result else 0
+        
+        print(f"\n找到 {count} 个Ontology节点")
+        
+        if count > 0:
+            # 查询前5个Ontology节点的属性
+            sample_query = "MATCH (o:Ontology) RETURN o LIMIT 5"
+            sample_result = client.execute_query(sample_query)
             
-            print(f"\n找到 {count} 个Ontology节点")
+            print("\nOntology节点示例 (前5个):")
+            print("=" * 60)
             
-            if count > 0:
-                # 查询前5个Ontology节点的属性
-                sample_query = "MATCH (o:Ontology) RETURN o LIMIT 5"
-                sample_result = client.execute_query(sample_query)
-                
-                print("\nOntology节点示例 (前5个):")
-                print("=" * 60)
-                
-                for i, result in enumerate(sample_result, 1):
-                    ontology = result['o']
-                    print(f"\n[{i}] 节点ID: {ontology.id}")
-                    print("  属性:")
-                    for key, value in ontology.items():
-                        print(f"    {key}: {value}")
-                        if key == 'description' and value:
-                            print(f"    ✓ description字段存在，长度: {len(value)}")
-            else:
-                print("\n✗ 没有找到任何Ontology节点")
-                print("请先导入Ontology数据，然后再生成embedding向量")
+            for i, result in enumerate(sample_result, 1):
+                ontology = result['o']
+                print(f"\n[{i}] 节点ID: {ontology.id}")
+                print("  属性:")
+                for key, value in ontology.items():
+                    print(f"    {key}: {value}")
+                    if key == 'description' and value:
+                        print(f"    ✓ description字段存在，长度: {len(value)}")
+        else:
+            print("\n✗ 没有找到任何Ontology节点")
+            print("请先导入Ontology数据，然后再生成embedding向量")
                 
     except Exception as e:
         print(f"\n错误: {e}")
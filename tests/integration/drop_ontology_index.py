@@ -18,16 +18,16 @@ def main():
     print(f"删除向量索引: {index_name}...")
     
     try:
-        with Neo4jClient() as client:
-            indexer = VectorIndexer(client)
-            success = indexer.drop_vector_index(index_name)
-            
-            if success:
-                print(f"✓ 索引 {index_name} 删除成功!")
-                return 0
-            else:
-                print(f"✗ 索引 {index_name} 删除失败!")
-                return 1
+        client = Neo4jClient.shared()
+        indexer = VectorIndexer(client)
+        success = indexer.drop_vector_index(index_name)
+        
+        if success:
+            print(f"✓ 索引 {index_name} 删除成功!")
+            return 0
+        else:
+            print(f"✗ 索引 {index_name} 删除失败!")
+            return 1
     except Exception as e:
         print(f"错误: {e}")
         return 1
@@ -67,7 +67,7 @@ def main():
             """
 
             node_data = [
-                {"node_id": node_id, "embedding": embedding}
+                {"node_id": node_id, "embedding": embedding.tolist()}
                 for node_id, embedding in zip(node_ids, node_embeddings)
             ]
 
@@ -132,7 +132,7 @@ def main():
             """
 
             rel_data = [
-                {"rel_id": rel_id, "embedding": embedding}
+                {"rel_id": rel_id, "embedding": embedding.tolist()}
                 for rel_id, embedding in zip(rel_ids, rel_embeddings)
             ]
 
@@ -52,7 +52,7 @@ def main():
             """
             
             data = [
-                {"node_id": node_id, "embedding": embedding}
+                {"node_id": node_id, "embedding": embedding.tolist()}
                 for node_id, embedding in zip(node_ids, embeddings)
             ]
             
@@ -8,7 +8,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from openai import OpenAI
-from infrastructure.config.config import Config
+from infrastructure.config.config import CONFIG
 
 
 def test_embedding_api():
@@ -19,7 +19,7 @@ def test_embedding_api():
 
     client = OpenAI(
         base_url='https://openrouter.ai/api/v1',
-        api_key=Config.OPENROUTER_API_KEY
+        api_key=CONFIG.openrouter_api_key
     )
 
     test_cases = [
@@ -9,7 +9,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from infrastructure.service.embedding.embedding_service import EmbeddingService
-from infrastructure.config.config import Config
+from infrastructure.config.config import CONFIG
 
 def test_qwen_embedding():
     """Test Qwen3 embedding model"""
@@ -18,8 +18,8 @@ def test_qwen_embedding():
     print("=" * 60)
 
     # Display configuration
-    print(f"\nModel: {Config.EMBEDDING_MODEL}")
-    print(f"Expected Dimension: {Config.EMBEDDING_DIMENSION}")
+    print(f"\nModel: {CONFIG.embedding_model}")
+    print(f"Expected Dimension: {CONFIG.embedding_dimension}")
 
     try:
         # Initialize service
@@ -35,13 +35,13 @@ def test_qwen_embedding():
         print(f"   - Text: {test_text}")
         print(f"   - Dimension: {len(embedding)}")
         print(f"   - First 5 values: {embedding[:5]}")
-        print(f"   - Expected dimension: {Config.EMBEDDING_DIMENSION}")
+        print(f"   - Expected dimension: {CONFIG.embedding_dimension}")
 
         # Verify dimension
-        if len(embedding) == Config.EMBEDDING_DIMENSION:
-            print(f"   ✅ Dimension matches expected value ({Config.EMBEDDING_DIMENSION})")
+        if len(embedding) == CONFIG.embedding_dimension:
+            print(f"   ✅ Dimension matches expected value ({CONFIG.embedding_dimension})")
         else:
-            print(f"   ❌ Dimension mismatch: got {len(embedding)}, expected {Config.EMBEDDING_DIMENSION}")
+            print(f"   ❌ Dimension mismatch: got {len(embedding)}, expected {CONFIG.embedding_dimension}")
 
         # Test batch embeddings
         print("\n3. Testing batch embeddings...")